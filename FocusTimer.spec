@@ -1,4 +1,9 @@
 # -*- mode: python ; coding: utf-8 -*-
+import sys
+
+# Same trimmed stdlib / PIL plugin list as `build.py --profile standalone`
+sys.path.insert(0, SPECPATH)
+from build import trimmed_imports
 
 
 a = Analysis(
@@ -10,7 +15,7 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=trimmed_imports(),
     noarchive=False,
     optimize=0,
 )
@@ -0,0 +1,181 @@
+import collections
+import os
+import re
+
+CHUNK_SIZE = 8 * 1024 * 1024  # Bytes read per chunk
+
+# Log rows look like: "2025-01-31 14:05:59,12:34[,12:26]"
+# The first 13 bytes ("2025-01-31 14") identify the day + hour bucket.
+PREFIX_LEN = 13
+# Optional 3rd column: time elapsed in the session ("MM:SS")
+_ELAPSED_MINUTES = re.compile(rb",\d+:\d\d,(\d+):")
+
+
+def iter_chunks(path, start=0, end=None, chunk_size=CHUNK_SIZE):
+    """
+    Yields byte chunks of whole rows from [start, end) of the file.
+    A row belongs to the range its first byte falls into, so adjacent
+    ranges can be streamed independently.
+    """
+    with open(path, "rb") as f:
+        if end is None:
+            end = os.fstat(f.fileno()).st_size
+        if start > 0:
+            f.seek(start - 1)
+            f.readline()  # Finish the row that started in the previous range
+        pos = f.tell()
+        tail = b""
+        while pos < end:
+            block = f.read(min(chunk_size, end - pos))
+            if not block:
+                break
+            pos += len(block)
+            block = tail + block
+            cut = block.rfind(b"\n") + 1
+            tail = block[cut:]
+            if cut:
+                yield block[:cut]
+        if tail:
+            # Complete the last row even if it runs past `end`
+            tail += f.readline()
+            yield tail if tail.endswith(b"\n") else tail + b"\n"
+
+
+def _run_end(chunk, start, end, prefix, guess):
+    """
+    Offset just past the last row of the run of `prefix` starting at `start`.
+    Gallops forward from a guessed run length until a row with another prefix
+    is found, then locates the last occurrence with one C-level `rfind`.
+    """
+    limit = start + guess
+    while limit < end:
+        row = chunk.find(b"\n", limit - 1, end) + 1
+        if row == 0 or not chunk.startswith(prefix, row):
+            break
+        guess *= 2
+        limit = start + guess
+    last = chunk.rfind(b"\n" + prefix, start, min(limit + PREFIX_LEN + 1, end))
+    row_end = chunk.find(b"\n", start if last == -1 else last + 1) + 1
+    return row_end or end
+
+
+def count_prefix_runs(chunk, counter):
+    """
+    Counts rows per day+hour prefix without splitting the chunk into lines.
+    The log is appended in time order, so long runs of rows share a prefix:
+    each run is located by a galloping search and then counted and verified
+    with two C-level `bytes.count` passes. Out-of-order rows (e.g. after a
+    clock change) fail verification and fall back to per-row counting.
+    """
+    pos, size = 0, len(chunk)
+    guess = 4096
+    while pos < size:
+        prefix = chunk[pos:pos + PREFIX_LEN]
+        if prefix[4:5] != b"-" or b"\n" in prefix:
+            pos = chunk.find(b"\n", pos) + 1 or size  # Header or malformed row
+            continue
+        end = _run_end(chunk, pos, size, prefix, guess)
+        guess = max(256, 2 * (end - pos))
+        rows = chunk.count(b"\n", pos, end)
+        if 1 + chunk.count(b"\n" + prefix, pos, end) == rows:
+            counter[prefix] += rows
+        else:
+            for line in chunk[pos:end].split(b"\n"):
+                if line[4:5] == b"-":
+                    counter[line[:PREFIX_LEN]] += 1
+        pos = end
+
+
+class DistractionReport:
+    def __init__(self):
+        # Keys stay raw bytes while streaming and are decoded once at the end
+        self._prefixes = collections.Counter()
+        self._minutes = collections.Counter()
+
+    def add_chunk(self, chunk):
+        count_prefix_runs(chunk, self._prefixes)
+        self._minutes.update(_ELAPSED_MINUTES.findall(chunk))
+
+    def merge(self, other):
+        self._prefixes.update(other._prefixes)
+        self._minutes.update(other._minutes)
+        return self
+
+    def counts(self):
+        """JSON-friendly counters: rows per "YYYY-MM-DD HH" and per elapsed minute."""
+        return ({prefix.decode(): count for prefix, count in sorted(self._prefixes.items())},
+                {minute.decode(): count for minute, count in sorted(self._minutes.items())})
+
+    def add_counts(self, hours, minutes):
+        """Merges counters saved by counts(), e.g. from a log segment index."""
+        for prefix, count in hours.items():
+            self._prefixes[prefix.encode()] += count
+        for minute, count in minutes.items():
+            self._minutes[minute.encode()] += count
+        return self
+
+    @property
+    def total(self):
+        return sum(self._prefixes.values())
+
+    @property
+    def by_day(self):
+        days = collections.Counter()
+        for prefix, count in self._prefixes.items():
+            days[prefix[:10].decode()] += count
+        return dict(sorted(days.items()))
+
+    @property
+    def by_hour(self):
+        hours = collections.Counter()
+        for prefix, count in self._prefixes.items():
+            try:
+                hours[int(prefix[11:13])] += count
+            except ValueError:
+                continue
+        return dict(sorted(hours.items()))
+
+    @property
+    def by_minute(self):
+        """Distractions by whole minutes into the session."""
+        minutes = collections.Counter()
+        for minute, count in self._minutes.items():
+            minutes[int(minute)] += count
+        return dict(sorted(minutes.items()))
+
+    def format(self):
+        lines = [f"총 딴짓 기록: {self.total}회", "", "[일별]"]
+        lines += [f"  {day}: {count}" for day, count in self.by_day.items()]
+        lines += ["", "[시간대별]"]
+        lines += [f"  {hour:02}시: {count}" for hour, count in self.by_hour.items()]
+        if self._minutes:
+            lines += ["", "[세션 시작 후 경과 분]"]
+            lines += [f"  {minute}분: {count}" for minute, count in self.by_minute.items()]
+        return "\n".join(lines)
+
+
+def _analyze_range(path, start, end, chunk_size):
+    report = DistractionReport()
+    for chunk in iter_chunks(path, start, end, chunk_size):
+        report.add_chunk(chunk)
+    return report
+
+
+def analyze(path, chunk_size=CHUNK_SIZE, workers=1):
+    """
+    Streams a focus log and aggregates it in bounded memory.
+    With workers > 1 the file is split into byte ranges analyzed in parallel.
+    """
+    size = os.path.getsize(path)
+    if workers <= 1 or size < 2 * chunk_size:
+        return _analyze_range(path, 0, size, chunk_size)
+
+    from concurrent.futures import ProcessPoolExecutor
+    bounds = [size * i // workers for i in range(workers + 1)]
+    report = DistractionReport()
+    with ProcessPoolExecutor(workers) as pool:
+        futures = [pool.submit(_analyze_range, path, bounds[i], bounds[i + 1], chunk_size)
+                   for i in range(workers)]
+        for future in futures:
+            report.merge(future.result())
+    return report
@@ -0,0 +1,65 @@
+"""
+Benchmark for the streaming focus log analytics.
+Generates a synthetic, time-ordered focus_log.csv of the requested size
+and times analyze().
+
+Usage: python benchmarks/bench_analytics.py [--size-mb 1024] [--workers 4]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import analyze
+
+
+def generate_log(path, size_mb, rows_per_hour=120):
+    rng = random.Random(42)
+    target = size_mb * 1024 * 1024
+    hour = datetime(2015, 1, 1)
+    written = 0
+    with open(path, "wb") as f:
+        f.write(b"Timestamp,TimeRemaining,TimeElapsed\r\n")
+        while written < target:
+            prefix = hour.strftime("%Y-%m-%d %H")
+            rows = []
+            for second in sorted(rng.sample(range(3600), rows_per_hour)):
+                elapsed = rng.randrange(35 * 60)
+                remaining = 35 * 60 - elapsed
+                rows.append(f"{prefix}:{second // 60:02}:{second % 60:02},"
+                            f"{remaining // 60:02}:{remaining % 60:02},{elapsed // 60:02}:{elapsed % 60:02}\r\n")
+            block = "".join(rows).encode()
+            f.write(block)
+            written += len(block)
+            hour += timedelta(hours=1)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "focus_log.csv")
+        size = generate_log(path, args.size_mb)
+
+        start = time.perf_counter()
+        report = analyze(path, workers=args.workers)
+        elapsed = time.perf_counter() - start
+
+    mb = size / 1024 / 1024
+    print(f"log size:    {mb:.0f} MB ({report.total} rows, {len(report.by_day)} days)")
+    print(f"analyze():   {elapsed:.2f} s ({mb / elapsed:.0f} MB/s, workers={args.workers})")
+    # Memory is bounded by the chunk size plus one counter entry per hour bucket
+    print(f"chunk size:  8 MB per worker")
+
+
+if __name__ == "__main__":
+    main()
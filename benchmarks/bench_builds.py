@@ -0,0 +1,115 @@
+"""
+Cold-start comparison across build variants.
+
+For every variant that exists on disk (source run, Nuitka onefile, Nuitka
+standalone directory, PyInstaller) this launches the app with the startup
+probe (FOCUS_STARTUP_PROBE, see main.install_startup_probe) and reports
+spawn -> first mapped frame: the first launch (coldest: onefile unpacks,
+files are read from disk) and the best of the rest. Each run gets a fresh
+working directory, so no journal or database is carried over.
+Also compares loading the tray icon from assets/icon.ico with the baked
+icon_assets module, which needs no display.
+
+Usage: python benchmarks/bench_builds.py [--runs 5] [--timeout 60]
+Build the variants first: python build.py [--profile standalone], pyinstaller FocusTimer.spec
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+EXE = "FocusTimer.exe"
+
+
+def variants():
+    # Nuitka names the binary FocusTimer.exe on every platform (--output-filename)
+    pyinstaller = "FocusTimer.exe" if os.name == "nt" else "FocusTimer"
+    return [
+        ("source", [sys.executable, os.path.join(ROOT, "main.py")], os.path.join(ROOT, "main.py")),
+        ("nuitka onefile", [os.path.join(ROOT, EXE)], os.path.join(ROOT, EXE)),
+        ("nuitka standalone", [os.path.join(ROOT, "dist", "standalone", "main.dist", EXE)],
+         os.path.join(ROOT, "dist", "standalone", "main.dist")),
+        ("pyinstaller", [os.path.join(ROOT, "dist", pyinstaller)], os.path.join(ROOT, "dist", pyinstaller)),
+    ]
+
+
+def disk_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for dirpath, _, files in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(dirpath, name)) for name in files)
+    return total
+
+
+def first_frame_ms(command, timeout):
+    with tempfile.TemporaryDirectory() as workdir:
+        probe = os.path.join(workdir, "first_frame.txt")
+        env = dict(os.environ, FOCUS_STARTUP_PROBE=probe, FOCUS_STARTUP_T0=repr(time.time()), FOCUS_DATA_DIR=workdir)
+        try:
+            subprocess.run(command, cwd=workdir, env=env, timeout=timeout,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        try:
+            with open(probe) as f:
+                return float(f.read())
+        except (OSError, ValueError):
+            return None  # No display, or the build failed to start
+
+
+def icon_load_us(repeat=20):
+    from PIL import Image
+    import icon_assets
+
+    def from_ico():
+        image = Image.open(os.path.join(ROOT, "assets", "icon.ico"))
+        image.load()
+
+    def from_baked():
+        Image.frombuffer("RGBA", icon_assets.TRAY_ICON_SIZE, icon_assets.TRAY_ICON_RGBA, "raw", "RGBA", 0, 1)
+
+    results = {}
+    for name, func in (("decode assets/icon.ico", from_ico), ("icon_assets (baked)", from_baked)):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        results[name] = best * 1e6
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    print(f"{'variant':20} {'size':>10} {'first':>10} {'best warm':>10}")
+    for name, command, path in variants():
+        if not os.path.exists(command[-1] if name == "source" else command[0]):
+            print(f"{name:20} {'not built':>10}")
+            continue
+        frames = [first_frame_ms(command, args.timeout) for _ in range(args.runs)]
+        size = f"{disk_size(path) / 2 ** 20:.1f} MB" if name != "source" else "-"
+        if frames[0] is None:
+            print(f"{name:20} {size:>10} {'no frame (display?)':>21}")
+            continue
+        warm = [f for f in frames[1:] if f is not None]
+        best = f"{min(warm):.0f} ms" if warm else "-"
+        print(f"{name:20} {size:>10} {frames[0]:7.0f} ms {best:>10}")
+
+    print()
+    for name, us in icon_load_us().items():
+        print(f"tray icon: {name:24} {us:8.0f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Benchmark for the calendar-aware planner.
+Builds a synthetic calendar (nights plus random meetings on every working
+day), then times building the interval index, planning the whole range,
+and planning a single day out of it. The target is well under 100 ms for
+weeks of calendar with thousands of busy intervals.
+
+Usage: python benchmarks/bench_calendar.py [--weeks 26] [--meetings 12] [--seed 1]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calendar_plan import CalendarPlanner, IntervalIndex
+
+HOUR = 3600
+DAY = 24 * HOUR
+BUDGET_MS = 100
+
+
+def synthetic_calendar(days, meetings_per_day, rng):
+    busy = []
+    for day in range(days):
+        base = day * DAY
+        busy.append((base + 18 * HOUR, base + DAY + 9 * HOUR))  # Evening and night
+        for _ in range(meetings_per_day):
+            start = base + 9 * HOUR + rng.randrange(0, 36) * 15 * 60
+            busy.append((start, start + rng.choice((15, 30, 45, 60)) * 60))
+    rng.shuffle(busy)
+    return busy
+
+
+def best_ms(func, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--weeks", type=int, default=26)
+    parser.add_argument("--meetings", type=int, default=12, help="meetings per day")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    days = args.weeks * 7
+    busy = synthetic_calendar(days, args.meetings, random.Random(args.seed))
+    build_ms, index = best_ms(lambda: IntervalIndex(busy))
+    calendar = CalendarPlanner(index)
+
+    def add_one_by_one():
+        incremental = IntervalIndex()
+        for interval in busy:
+            incremental.add(*interval)
+        return incremental
+
+    add_ms, incremental = best_ms(add_one_by_one)
+    assert list(incremental) == list(index)
+
+    plan_ms, plan = best_ms(lambda: calendar.plan(0, days * DAY))
+    middle = (days // 2) * DAY
+    day_ms, day_plan = best_ms(lambda: calendar.plan(middle, middle + DAY), repeat=50)
+
+    print(f"{len(busy)} busy intervals over {days} days ({len(index)} after merging)")
+    print(f"index build       {build_ms:8.2f} ms")
+    print(f"index add() x{len(busy):<5}{add_ms:8.2f} ms")
+    print(f"plan all days     {plan_ms:8.2f} ms  ({len(plan)} steps)")
+    print(f"plan one day      {day_ms:8.3f} ms  ({len(day_plan)} steps)")
+    total = build_ms + plan_ms
+    print(f"build + plan      {total:8.2f} ms  (budget {BUDGET_MS} ms)")
+    return 0 if total < BUDGET_MS else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+Wakeups per minute while the window is minimized to the tray.
+Starts a 25 minute step, minimizes, and counts the event loop callbacks
+(Tk after() firings) until the step's deadline, against a virtual clock
+(no display needed). Three designs:
+- original: what shipped before ticker.py, a root.after() loop per job,
+  a static tray icon, and process_queue polled every 100 ms for tray
+  messages
+- always on: the ticker with low-power mode off (the window keeps
+  redrawing every second)
+- low-power: deadline wakeup plus the tray icon's minute updates
+--metrics adds the metrics watchdog to every run.
+
+Usage: python benchmarks/bench_idle.py [--metrics]
+"""
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_ui_ticks import PerJobLoops, widget
+from clock import VirtualClock, VirtualScheduler
+from metrics import Metrics
+from simulation import WIDGETS, build_app
+
+
+class VisibleTray:
+    visible = False
+
+    def show(self, image=None):
+        self.visible = True
+
+    def update(self, image=None):
+        pass
+
+    def hide(self):
+        self.visible = False
+
+    def stop(self):
+        pass
+
+
+MODES = ("original", "always on", "low-power")
+QUEUE_POLL_MS = 100  # The original process_queue re-arm interval
+
+
+def poll_queue(loop, app):
+    def poll():
+        app.process_queue()
+        loop.after(QUEUE_POLL_MS, poll)
+    loop.after(QUEUE_POLL_MS, poll)
+
+
+def run(mode, metrics):
+    clock = VirtualClock()
+    loop = VirtualScheduler(clock)
+    app = build_app(clock, loop, metrics=Metrics() if metrics else None)
+    app.LOW_POWER_WHEN_HIDDEN = mode == "low-power"
+    if mode == "original":
+        app.ticker = PerJobLoops(loop, app.tk_stats)
+        app.schedule_tray_update = lambda: None  # The icon never changed
+        poll_queue(loop, app)
+    for name in WIDGETS:
+        setattr(app, name, widget())
+    app.create_tray = VisibleTray
+    app.tray_image = lambda: None
+
+    loop.run_until(1)  # Startup: resume_or_start finds nothing to resume
+    app.start_smart_plan(60)
+    app.start_timer()
+    app.root.state("iconic")
+    app.minimize_to_tray()
+    minutes = app.countdown.remaining() / 60
+    before = loop.fired
+    loop.run_until(clock.t + app.countdown.remaining() - 0.001)
+    return (loop.fired - before) / minutes, app.time_label.config.call_count
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--metrics", action="store_true", help="run with the metrics watchdog on")
+    args = parser.parse_args()
+    for mode in MODES:
+        per_minute, redraws = run(mode, args.metrics)
+        print(f"{mode:10} {per_minute:6.2f} wakeups/min while minimized, {redraws} time label redraws")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark for the rotated distraction log (logstore.py).
+Writes --months of synthetic rows as monthly gzip segments plus the same
+rows as one flat CSV, then times a one-week report, a one-month report
+(answered from the segment index) and the full history against a full
+scan of the flat file, with the number of segments each one decompressed.
+
+Usage: python benchmarks/bench_logstore.py [--months 24] [--rows-per-hour 120]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import analyze
+from logstore import LOG_HEADER, LogManager
+
+HEADER = (",".join(LOG_HEADER) + "\r\n").encode()
+
+
+def month_rows(month_start, rows_per_hour):
+    rows = []
+    hour = month_start
+    while hour.month == month_start.month:
+        if 9 <= hour.hour < 18:
+            prefix = hour.strftime("%Y-%m-%d %H")
+            step = 3600 // rows_per_hour
+            for i in range(rows_per_hour):
+                second = i * step
+                elapsed = second % (25 * 60)
+                remaining = 25 * 60 - elapsed
+                rows.append(f"{prefix}:{second // 60:02}:{second % 60:02},"
+                            f"{remaining // 60:02}:{remaining % 60:02},{elapsed // 60:02}:{elapsed % 60:02}\r\n")
+        hour += timedelta(hours=1)
+    return "".join(rows).encode()
+
+
+def build(directory, flat_path, months, rows_per_hour):
+    manager = LogManager(directory)
+    manager.prepare()
+    month = datetime(2024, 1, 1)
+    with open(flat_path, "wb") as flat:
+        flat.write(HEADER)
+        for _ in range(months):
+            block = month_rows(month, rows_per_hour)
+            flat.write(block)
+            with open(manager.path, "wb") as f:
+                f.write(HEADER + block)
+            manager.rotate()
+            month = (month + timedelta(days=32)).replace(day=1)
+    return month
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--rows-per-hour", type=int, default=120)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = os.path.join(tmp, "data")
+        flat = os.path.join(tmp, "flat.csv")
+        end = build(directory, flat, args.months, args.rows_per_hour)
+        last_month = (end - timedelta(days=1)).replace(day=1)
+        week = (last_month + timedelta(days=9)).strftime("%Y-%m-%d")
+        week_end = (last_month + timedelta(days=16)).strftime("%Y-%m-%d")
+
+        flat_mb = os.path.getsize(flat) / 2 ** 20
+        segment_mb = sum(os.path.getsize(os.path.join(directory, s["file"]))
+                         for s in LogManager(directory).segments()) / 2 ** 20
+        print(f"history: {args.months} months, flat {flat_mb:.1f} MB, segments {segment_mb:.1f} MB gzip")
+
+        cases = [
+            ("one week (partial segment)", week, week_end),
+            ("one month (index only)", last_month.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")),
+            ("full history (index only)", None, None),
+        ]
+        print(f"{'range':28} {'rows':>9} {'ms':>8} {'opened':>7}")
+        for label, start, stop in cases:
+            manager = LogManager(directory)  # Cold: indexes loaded inside the timing
+            report, ms = timed(lambda: manager.report(start, stop))
+            print(f"{label:28} {report.total:9d} {ms:8.1f} {manager.opened:7d}")
+        report, ms = timed(lambda: analyze(flat))
+        print(f"{'flat file full scan':28} {report.total:9d} {ms:8.1f} {'-':>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Performance benchmark for SessionPlanner, checked against a stored baseline.
+
+Measures single-call latency (cold / cached), batch throughput and
+allocations per schedule, and verifies that the schedules for every
+duration in the baseline range still hash to the recorded digest.
+
+Usage:
+    python benchmarks/bench_planner.py            # compare with baseline
+    python benchmarks/bench_planner.py --update   # rewrite the baseline
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import planner
+from planner import SessionPlanner
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "planner_baseline.json")
+DURATIONS = range(0, 10001)
+# A timing may be this much worse than the baseline before we call it a regression
+# (timings are machine specific: re-run with --update on new hardware)
+TOLERANCE = 2.0
+WEEK_MINUTES = 7 * 24 * 60
+
+
+def schedule_digest(schedules):
+    """sha256 over a canonical text form of every schedule, in order."""
+    h = hashlib.sha256()
+    for schedule in schedules:
+        h.update(repr([(s['type'], s['duration'], s['label']) for s in schedule]).encode())
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def load_baseline():
+    with open(BASELINE_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _best(func, repeat=5, number=1):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def measure():
+    sp = SessionPlanner()
+
+    def cold():
+        planner._cached_schedule.cache_clear()
+        sp.generate_schedule(600)
+
+    results = {
+        "single_cold_us": _best(cold, number=2000) * 1e6,
+        "single_cached_us": _best(lambda: sp.generate_schedule(600), number=20000) * 1e6,
+        "batch_25_600_ms": _best(lambda: sp.generate_schedules(range(25, 601)), repeat=7, number=500) * 1e3,
+    }
+    planner._cached_schedule.cache_clear()
+    results["batch_cold_per_sec"] = len(DURATIONS) / _best(
+        lambda: (planner._cached_schedule.cache_clear(), sp.generate_schedules(DURATIONS)), repeat=3)
+
+    # Allocations of one generate_schedule() call (cached path, what the UI pays)
+    sp.generate_schedule(600)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    keep = sp.generate_schedule(600)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    results["alloc_blocks_per_schedule"] = sum(max(0, s.count_diff) for s in stats)
+    results["alloc_bytes_per_schedule"] = sum(max(0, s.size_diff) for s in stats)
+    del keep
+
+    # Week-long plan: random access and size of the lazy cached schedule
+    week = sp.schedule_for(WEEK_MINUTES)
+    middle = len(week) // 2
+    results["week_index_us"] = _best(lambda: week[middle], number=20000) * 1e6
+    planner._cached_schedule.cache_clear()
+    tracemalloc.start()
+    week = sp.schedule_for(WEEK_MINUTES)
+    results["week_schedule_bytes"] = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--update", action="store_true", help="rewrite the stored baseline")
+    args = parser.parse_args()
+
+    sp = SessionPlanner()
+    digest = schedule_digest(sp.generate_schedule(m) for m in DURATIONS)
+    results = measure()
+    for name, value in results.items():
+        print(f"{name:28} {value:12.2f}")
+
+    if args.update:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump({"durations": [DURATIONS.start, DURATIONS.stop - 1], "digest": digest,
+                       "timings": {k: round(v, 3) for k, v in results.items()}}, f, indent=2)
+            f.write("\n")
+        print(f"baseline written to {BASELINE_PATH}")
+        return 0
+
+    baseline = load_baseline()
+    failures = []
+    if digest != baseline["digest"]:
+        failures.append("schedules differ from baseline (behavior change)")
+    for name, base in baseline["timings"].items():
+        value = results.get(name)
+        if value is None:
+            continue
+        # Throughput is higher-is-better, everything else lower-is-better
+        worse = value < base / TOLERANCE if name.endswith("_per_sec") else value > base * TOLERANCE
+        if worse:
+            failures.append(f"{name}: {value:.2f} vs baseline {base:.2f}")
+    for failure in failures:
+        print("REGRESSION:", failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
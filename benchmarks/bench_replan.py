@@ -0,0 +1,77 @@
+"""
+Latency benchmark for re-planning the rest of a schedule (SessionEngine._refit).
+Runs a plan step by step on a virtual clock, idling --overtime seconds after
+every step so each work step loads behind budget and is re-fitted, and times
+every load_step() (the transition the app runs on the UI thread). The same
+walk without re-planning (a planner with no replan()) is the baseline.
+
+Usage: python benchmarks/bench_replan.py [--minutes 60 480 10080] [--overtime 120] [--repeat 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clock import VirtualClock
+from engine import SessionEngine
+from optimal_planner import OptimalPlanner
+from planner import SessionPlanner
+
+
+class FixedPlanner:
+    """The greedy planner without replan(): plans are never re-fitted."""
+
+    def __init__(self):
+        self._planner = SessionPlanner()
+
+    def schedule_for(self, minutes):
+        return self._planner.schedule_for(minutes)
+
+
+def walk(planner, minutes, overtime):
+    """Per-transition load_step() times (seconds) and the number of re-fits for one plan."""
+    clock = VirtualClock()
+    engine = SessionEngine(planner, clock=clock)
+    session = engine.create()
+    engine.load_plan(session, minutes)
+    engine.start(session)  # The budget counts from the first start
+    engine.stop(session)
+    times = []
+    while session.schedule:
+        clock.advance(session.countdown.remaining() + overtime)
+        start = time.perf_counter()
+        engine.load_step(session, session.index + 1)
+        times.append(time.perf_counter() - start)
+    return times, len(session.replans)
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--minutes", type=int, nargs="+", default=[60, 480, 10080])
+    parser.add_argument("--overtime", type=float, default=120)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    planners = (("greedy", SessionPlanner()), ("optimal", OptimalPlanner()), ("no re-plan", FixedPlanner()))
+    for _, planner in planners:
+        planner.schedule_for(max(args.minutes))  # Warm the caches / DP table, as a running app has
+    print(f"{'planner':11} {'minutes':>7} {'steps':>6} {'refits':>6} {'p50 us':>8} {'p99 us':>8} {'max us':>8}")
+    for name, planner in planners:
+        for minutes in args.minutes:
+            times, refits = [], 0
+            for _ in range(args.repeat):
+                run, refits = walk(planner, minutes, args.overtime)
+                times += run
+            print(f"{name:11} {minutes:7d} {len(run):6d} {refits:6d} {percentile(times, 0.5) * 1e6:8.1f} "
+                  f"{percentile(times, 0.99) * 1e6:8.1f} {max(times) * 1e6:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
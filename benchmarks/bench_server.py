@@ -0,0 +1,150 @@
+"""
+Load test for the session server (main.py --serve).
+Opens many subscriber connections on one shared session, then drives step
+transitions from a separate client and measures how fast the events fan out.
+
+Usage: python benchmarks/bench_server.py [--clients 2000] [--rounds 200] [--address HOST:PORT]
+Without --address a server is spawned on a free local port.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def raise_fd_limit(needed):
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < needed:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(needed, hard), hard))
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def open_client(host, port, retries=100):
+    for _ in range(retries):
+        try:
+            return await asyncio.open_connection(host, port)
+        except OSError:
+            await asyncio.sleep(0.05)
+    raise RuntimeError("server did not come up")
+
+
+async def request(reader, writer, **fields):
+    writer.write(json.dumps(fields).encode() + b"\n")
+    await writer.drain()
+    while True:
+        message = json.loads(await reader.readline())
+        if "event" not in message:
+            return message
+
+
+class Round:
+    """Tracks delivery of one transition to every subscriber."""
+
+    def __init__(self, clients):
+        self.clients = clients
+        self.sent_at = {}
+        self.received = 0
+        self.done = asyncio.Event()
+
+    def deliver(self, index, latencies):
+        latencies.append(time.perf_counter() - self.sent_at[index])
+        self.received += 1
+        if self.received % self.clients == 0:
+            self.done.set()
+
+
+async def subscriber(reader, session_id, rounds, tracker, latencies):
+    got = 0
+    while got < rounds:
+        message = json.loads(await reader.readline())
+        if message.get("event") == "step" and message["session"] == session_id:
+            tracker.deliver(message["state"]["index"], latencies)
+            got += 1
+
+
+async def run(host, port, clients, rounds):
+    reader, writer = await open_client(host, port)
+    session_id = (await request(reader, writer, op="create", minutes=600))["session"]["id"]
+
+    # Idle subscribers; all set up before we start timing
+    connections = []
+    connect_start = time.perf_counter()
+    for _ in range(clients):
+        r, w = await open_client(host, port)
+        await request(r, w, op="subscribe", session=session_id)
+        connections.append((r, w))
+    connect_time = time.perf_counter() - connect_start
+
+    tracker = Round(clients)
+    latencies = []
+    tasks = [asyncio.create_task(subscriber(r, session_id, rounds, tracker, latencies))
+             for r, _ in connections]
+
+    start = time.perf_counter()
+    for i in range(rounds):
+        # Alternate between step 1 and 0; the index identifies the send time
+        op = "skip" if i % 2 == 0 else "prev"
+        tracker.done.clear()
+        tracker.sent_at[1 if op == "skip" else 0] = time.perf_counter()
+        await request(reader, writer, op=op, session=session_id)
+        # Wait for this round to reach everyone so send times stay unambiguous
+        await tracker.done.wait()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    for _, w in connections:
+        w.close()
+    writer.close()
+    return connect_time, elapsed, tracker.received, sorted(latencies)
+
+
+def percentile(values, p):
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--address", help="HOST:PORT of a running server")
+    args = parser.parse_args()
+
+    raise_fd_limit(2 * args.clients + 64)
+    server = None
+    if args.address:
+        host, _, port = args.address.rpartition(":")
+        port = int(port)
+    else:
+        host, port = "127.0.0.1", free_port()
+        server = subprocess.Popen([sys.executable, os.path.join(ROOT, "main.py"), "--serve", f"{host}:{port}"],
+                                  stdout=subprocess.DEVNULL)
+    try:
+        connect_time, elapsed, events, latencies = asyncio.run(run(host, port, args.clients, args.rounds))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(f"clients:        {args.clients} (connected + subscribed in {connect_time:.2f} s)")
+    print(f"events:         {events} in {elapsed:.2f} s ({events / elapsed:,.0f} events/s)")
+    print(f"fan-out latency p50 {percentile(latencies, 0.5) * 1000:.1f} ms, "
+          f"p99 {percentile(latencies, 0.99) * 1000:.1f} ms, max {latencies[-1] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
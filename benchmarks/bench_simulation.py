@@ -0,0 +1,53 @@
+"""
+Throughput of the timer logic on virtual time (simulation.py).
+Replays seeded days of plans (skips, pauses, distractions, overtime)
+through PomodoroApp with no display and no real waiting, and reports
+simulated days per second and event-loop callbacks per second. The
+low-power run wakes only at deadlines; --redraw-days also runs a few days
+with every per-second label tick, for comparison.
+
+Usage: python benchmarks/bench_simulation.py [--days 2000] [--redraw-days 3] [--seed 0] [--plan-minutes 240]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulation import DayScript, Simulation
+
+
+def run(days, seed, plan_minutes, redraw):
+    sim = Simulation(seed=seed, script=DayScript(plan_minutes=plan_minutes), redraw=redraw)
+    start = time.perf_counter()
+    summary = sim.run_days(days)
+    elapsed = time.perf_counter() - start
+    return summary, sim.scheduler.fired, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=2000)
+    parser.add_argument("--redraw-days", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--plan-minutes", type=int, default=240)
+    args = parser.parse_args()
+
+    print(f"{'mode':10} {'days':>6} {'steps':>7} {'callbacks':>10} {'seconds':>8} {'days/s':>8} {'callbacks/s':>12}")
+    summaries = []
+    for label, days, redraw in (("low-power", args.days, False), ("redraw", args.redraw_days, True)):
+        if days <= 0:
+            continue
+        summary, fired, elapsed = run(days, args.seed, args.plan_minutes, redraw)
+        summaries.append((label, summary))
+        print(f"{label:10} {days:6d} {summary['steps']:7d} {fired:10d} {elapsed:8.2f} "
+              f"{days / elapsed:8.1f} {fired / elapsed:12.0f}")
+    print()
+    for label, summary in summaries:
+        print(f"{label:10} {summary.get('distractions', 0)} distractions, {summary.get('pauses', 0)} pauses, "
+              f"{summary.get('skips', 0)} skips, {summary['overtime'] / 3600:.1f} h overtime")
+
+
+if __name__ == "__main__":
+    main()
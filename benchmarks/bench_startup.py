@@ -0,0 +1,135 @@
+"""
+Startup timing harness for main.py and the terminal CLI (cli.py).
+
+Reports per-module import cost (python -X importtime), checks that the
+tray/imaging stack stays off the startup path, and measures
+time-to-first-frame (process spawn -> root window mapped) when a display
+is available. For the CLI: process spawn -> exit of `python -m cli --list`,
+and that no GUI module gets imported at all. Exits non-zero when a budget
+is exceeded.
+
+Usage: python benchmarks/bench_startup.py [--import-budget-ms 80] [--frame-budget-ms 400] [--cli-budget-ms 100] [--runs 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Must not be imported before the first minimize
+DEFERRED_MODULES = ("PIL", "pystray", "csv", "sqlite3", "threading")
+# Must never be imported by the CLI
+GUI_MODULES = ("tkinter", "_tkinter", "PIL", "pystray", "main")
+
+FRAME_PROBE = """
+import sys, time
+spawned = float(sys.argv[1])
+import tkinter as tk
+import main
+root = tk.Tk()
+app = main.PomodoroApp(root)
+def mapped(event):
+    if event.widget is root:
+        print(f"{(time.time() - spawned) * 1000:.1f}", flush=True)
+        root.after_idle(app.perform_quit)
+root.bind("<Map>", mapped, add="+")
+root.mainloop()
+"""
+
+
+def run_python(args, **kwargs):
+    # The probed app opens its store and journal: keep them out of the real data directory
+    with tempfile.TemporaryDirectory() as data:
+        return subprocess.run([sys.executable] + args, cwd=ROOT, capture_output=True, text=True,
+                              env=dict(os.environ, FOCUS_DATA_DIR=data), **kwargs)
+
+
+def import_profile():
+    """Returns (total_us, [(cumulative_us, self_us, module)]) for `import main`."""
+    result = run_python(["-X", "importtime", "-c", "import main"])
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+    total = next((c for c, _, n in rows if n.strip() == "main"), 0)
+    return total, rows
+
+
+def loaded_modules(module="main"):
+    result = run_python(["-c", f"import {module}, sys; print('\\n'.join(sys.modules))"])
+    return set(result.stdout.split())
+
+
+def cli_run_ms():
+    start = time.perf_counter()
+    result = run_python(["-m", "cli", "--list", "60"])
+    elapsed = (time.perf_counter() - start) * 1000
+    return elapsed if result.returncode == 0 else None
+
+
+def time_to_first_frame():
+    result = run_python(["-c", FRAME_PROBE, repr(time.time())], timeout=30)
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--import-budget-ms", type=float, default=80)
+    parser.add_argument("--frame-budget-ms", type=float, default=400)
+    parser.add_argument("--cli-budget-ms", type=float, default=100)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+    failures = []
+
+    totals = []
+    for _ in range(args.runs):
+        total, rows = import_profile()
+        totals.append(total)
+    import_ms = min(totals) / 1000
+    print(f"import main: {import_ms:.1f} ms (best of {args.runs})")
+    print(f"{'cumulative':>12} {'self':>8}  module")
+    for cumulative, self_us, name in sorted(rows, reverse=True)[:args.top]:
+        print(f"{cumulative / 1000:10.1f}ms {self_us / 1000:6.1f}ms {name}")
+    if import_ms > args.import_budget_ms:
+        failures.append(f"import main {import_ms:.1f} ms > budget {args.import_budget_ms} ms")
+
+    eager = sorted(m for m in loaded_modules() if m.split(".")[0] in DEFERRED_MODULES)
+    if eager:
+        failures.append("deferred modules imported at startup: " + ", ".join(eager))
+
+    frames = [f for f in (time_to_first_frame() for _ in range(args.runs)) if f is not None]
+    if frames:
+        frame_ms = min(frames)
+        print(f"time-to-first-frame: {frame_ms:.1f} ms (best of {len(frames)})")
+        if frame_ms > args.frame_budget_ms:
+            failures.append(f"first frame {frame_ms:.1f} ms > budget {args.frame_budget_ms} ms")
+    else:
+        print("time-to-first-frame: skipped (no display)")
+
+    runs = [ms for ms in (cli_run_ms() for _ in range(args.runs)) if ms is not None]
+    if runs:
+        cli_ms = min(runs)
+        print(f"python -m cli --list: {cli_ms:.1f} ms spawn -> exit (best of {len(runs)})")
+        if cli_ms > args.cli_budget_ms:
+            failures.append(f"cli {cli_ms:.1f} ms > budget {args.cli_budget_ms} ms")
+    else:
+        failures.append("python -m cli --list failed")
+    gui = sorted(m for m in loaded_modules("cli") if m.split(".")[0] in GUI_MODULES)
+    if gui:
+        failures.append("GUI modules imported by the CLI: " + ", ".join(gui))
+
+    for failure in failures:
+        print("OVER BUDGET:", failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Benchmark for the stats cache (stats.py).
+Fills a session DB with --years of synthetic history, then times opening
+the today / this week view: rebuilding the cache from the raw tables
+(first run, or a stale snapshot), loading the saved snapshot, and the
+per-event update plus today()/week() reads the UI does afterwards.
+
+Usage: python benchmarks/bench_stats.py [--years 5] [--steps-per-day 10] [--distractions-per-day 12]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from store import SessionStore
+
+LABELS = (("WORK", "기본 집중 🚀", 1500), ("BREAK", "짧은 휴식 ☕", 300), ("WORK", "깊은 집중 🔥", 2100),
+          ("BREAK", "휴식 🌿", 600))
+
+
+def fill(path, years, steps_per_day, distractions_per_day):
+    rng = random.Random(1)
+    store = SessionStore(path)
+    sessions, distractions = [], []
+    day = datetime(2026, 1, 1, 9, 0) - timedelta(days=365 * years)
+    session_id = 0
+    for _ in range(365 * years):
+        ts = day.timestamp()
+        for index in range(steps_per_day):
+            session_id += 1
+            step_type, label, duration = LABELS[index % len(LABELS)]
+            status = "skipped" if rng.random() < 0.1 else "completed"
+            sessions.append((session_id, None, index, step_type, label, duration, ts, ts + duration, status))
+            ts += duration
+        for _ in range(distractions_per_day):
+            distractions.append((day.timestamp() + rng.randrange(8 * 3600), rng.randint(1, session_id), 600))
+        day += timedelta(days=1)
+    with store.conn:
+        store.conn.executemany("INSERT INTO sessions (id, plan_id, step_index, type, label, duration, started_at, "
+                               "ended_at, status) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", sessions)
+        store.conn.executemany("INSERT INTO distractions (ts, session_id, time_remaining) VALUES (?, ?, ?)",
+                               distractions)
+    store.close()
+    return len(sessions), len(distractions)
+
+
+def timed(func, repeat=1):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--steps-per-day", type=int, default=10)
+    parser.add_argument("--distractions-per-day", type=int, default=12)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "focus.db")
+        sessions, distractions = fill(path, args.years, args.steps_per_day, args.distractions_per_day)
+        print(f"history: {args.years} years, {sessions} sessions, {distractions} distractions")
+
+        store = SessionStore(path)
+        _, rebuild_ms = timed(store.load_stats)
+        store.close()
+        print(f"open, rebuild from tables:   {rebuild_ms:8.2f} ms")
+
+        store = SessionStore(path)
+        stats, load_ms = timed(store.load_stats)
+        print(f"open, saved snapshot:        {load_ms:8.2f} ms")
+
+        now = time.time()
+        _, read_ms = timed(lambda: (stats.today(now), stats.week(now)), repeat=1000)
+        print(f"today() + week():            {read_ms * 1000:8.2f} us")
+        _, event_ms = timed(lambda: stats.distraction(1, now), repeat=1000)
+        print(f"one distraction update:      {event_ms * 1000:8.2f} us")
+        header = stats.dumps()
+
+        def log_and_flush():
+            store.log_distraction(1, 600)
+            store.flush()
+        _, save_ms = timed(log_and_flush, repeat=20)
+        print(f"flush with snapshot:         {save_ms:8.2f} ms (1 day row + {len(header.encode()) / 1024:.1f} KB header)")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark for the live tray icon.
+Compares a sprite-atlas update (copy + mask pastes) against redrawing the
+icon with ImageDraw every time, and reports the memory each one holds.
+
+Usage: python benchmarks/bench_trayicon.py [--updates 5000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw
+
+from trayicon import (SpriteAtlas, ICON_SIZE, RING_WIDTH, RING_STEPS, BACKGROUND, RING_TRACK,
+                      WORK_COLOR, DIGIT_COLOR, _load_font)
+
+
+def naive_render(font, minutes, progress):
+    """What each update would cost without the atlas."""
+    image = Image.new("RGBA", (ICON_SIZE, ICON_SIZE), (0, 0, 0, 0))
+    dc = ImageDraw.Draw(image)
+    box = (1, 1, ICON_SIZE - 2, ICON_SIZE - 2)
+    dc.ellipse(box, fill=BACKGROUND)
+    dc.arc(box, 0, 360, fill=RING_TRACK, width=RING_WIDTH)
+    dc.arc(box, -90, -90 + int(360 * progress), fill=WORK_COLOR, width=RING_WIDTH)
+    dc.text((ICON_SIZE // 2, ICON_SIZE // 2), str(minutes), font=font, fill=DIGIT_COLOR, anchor="mm")
+    return image
+
+
+def max_rss_kib():
+    try:
+        import resource
+    except ImportError:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def states(updates):
+    # Every update shows a new minute, so the atlas cache never hits
+    for i in range(updates):
+        minutes = 99 - i % 100
+        yield minutes, (i % (RING_STEPS + 1)) / RING_STEPS
+
+
+def measure(render, updates):
+    start = time.perf_counter()
+    for minutes, progress in states(updates):
+        render(minutes, progress)
+    return (time.perf_counter() - start) / updates
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--updates", type=int, default=5000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    atlas = SpriteAtlas()
+    build = time.perf_counter() - start
+
+    font = _load_font(ICON_SIZE * 9 // 16)
+    rss_before = max_rss_kib()
+    atlas_time = measure(atlas.render, args.updates)
+    rss_growth = max_rss_kib() - rss_before
+    naive_time = measure(lambda m, p: naive_render(font, m, p), args.updates)
+
+    # Each update allocates one icon and keeps only the latest one
+    print(f"atlas build:    {build * 1000:.1f} ms, {atlas.nbytes / 1024:.0f} KiB of pixels")
+    print(f"atlas update:   {atlas_time * 1e6:.1f} us/update, "
+          f"{4 * ICON_SIZE * ICON_SIZE / 1024:.0f} KiB per icon, "
+          f"max RSS +{rss_growth} KiB over {args.updates} updates")
+    print(f"ImageDraw:      {naive_time * 1e6:.1f} us/update ({naive_time / atlas_time:.1f}x slower)")
+    # One update per minute: the tray thread's CPU share
+    print(f"idle cost:      {atlas_time / 60 * 100:.6f} % of one core at one update per minute")
+
+
+if __name__ == "__main__":
+    main()
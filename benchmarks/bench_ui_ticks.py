@@ -0,0 +1,104 @@
+"""
+Counts the Tk calls PomodoroApp makes per second of timer time.
+Runs a 1 hour plan against a virtual clock and event loop (no display
+needed): every step is started, runs out, and sits in overtime for a while
+before the next one starts. Three update paths are compared:
+- per-job loops: the design before ticker.py, reproduced by PerJobLoops
+  (each periodic job keeps its own root.after() chain) and a renderer
+  without the dirty check (every config/pack goes to Tk)
+- always redraw: the Ticker with the dirty check disabled
+- dirty-checked: what the app ships
+While the window is visible only one periodic job is due at a time, so
+all three wake the loop equally often; the ticker saves wakeups only
+where jobs share a boundary (tray updates, see bench_idle.py).
+
+Usage: python benchmarks/bench_ui_ticks.py [--minutes 60] [--overtime 90]
+"""
+import argparse
+import os
+import sys
+from unittest.mock import MagicMock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clock import VirtualClock, VirtualScheduler
+from simulation import WIDGETS, build_app
+from ticker import Renderer
+
+MODES = ("per-job loops", "always redraw", "dirty-checked")
+
+
+class PerJobLoops:
+    """
+    The Ticker interface on the pre-ticker update path: one root.after()
+    per job and re-arm, no shared wakeups for jobs on the same boundary.
+    """
+
+    def __init__(self, root, stats):
+        self.root = root
+        self.stats = stats
+        self.jobs = {}  # name -> after id
+
+    def schedule(self, name, delay_ms, callback):
+        self.cancel(name)
+
+        def run():
+            del self.jobs[name]
+            callback()
+        self.jobs[name] = self.root.after(max(1, int(delay_ms)), run)
+        self.stats.count("after")
+
+    def cancel(self, name):
+        after_id = self.jobs.pop(name, None)
+        if after_id is not None:
+            self.root.after_cancel(after_id)
+            self.stats.count("after_cancel")
+
+    def pending(self, name):
+        return name in self.jobs
+
+
+def widget():
+    # Widgets count their own Tk calls; cget is what the app reads back
+    return MagicMock(**{"cget.return_value": ""})
+
+
+def run(minutes, overtime, mode):
+    clock = VirtualClock()
+    loop = VirtualScheduler(clock)
+    app = build_app(clock, loop)
+    app.ui = Renderer(app.tk_stats, dirty_check=mode == "dirty-checked")
+    if mode == "per-job loops":
+        app.ticker = PerJobLoops(loop, app.tk_stats)
+    for name in WIDGETS:
+        setattr(app, name, widget())
+
+    loop.run_until(1)  # Startup: resume_or_start finds nothing to resume
+    app.start_smart_plan(minutes)
+    app.tk_stats.reset()
+    fired = loop.fired
+    while app.schedule:
+        app.start_timer()
+        loop.run_until(clock.t + app.countdown.duration + overtime)
+
+    tk_calls = sum(len(getattr(app, name).method_calls) for name in WIDGETS)
+    return clock.t, tk_calls, loop.fired - fired, app.tk_stats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--minutes", type=int, default=60)
+    parser.add_argument("--overtime", type=int, default=90, help="seconds spent in overtime per step")
+    args = parser.parse_args()
+
+    # Text changes every second while counting down, so the dirty check
+    # mostly saves the redundant updates on step transitions.
+    for mode in MODES:
+        elapsed, tk_calls, wakeups, stats = run(args.minutes, args.overtime, mode)
+        print(f"{mode:14} {tk_calls:6} widget calls over {elapsed / 60:.0f} min "
+              f"({tk_calls / elapsed:.3f}/s)  after() {stats.counts['after'] / elapsed:.3f}/s  "
+              f"wakeups {wakeups / elapsed:.3f}/s")
+        print(f"{'':14} {stats.format()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Compares the greedy SessionPlanner with the dynamic-programming
+OptimalPlanner over a range of durations: focused minutes, idle minutes,
+how often and by how much the optimum beats greedy, and what planning
+costs (cold table fill vs. warm queries on the reused table).
+
+Usage: python benchmarks/compare_planners.py [--min 25] [--max 600] [--show 10]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import planner
+from optimal_planner import OptimalPlanner
+from planner import SessionPlanner
+
+
+def summarize(schedule, minutes):
+    work = sum(s['duration'] for s in schedule if s['type'] == 'WORK') // 60
+    used = sum(s['duration'] for s in schedule) // 60
+    return work, minutes - used
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - start) * 1e3, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--min", type=int, default=25)
+    parser.add_argument("--max", type=int, default=600)
+    parser.add_argument("--show", type=int, default=10, help="largest gains to list")
+    args = parser.parse_args()
+    durations = range(args.min, args.max + 1)
+
+    greedy = SessionPlanner()
+    optimal = OptimalPlanner()
+    planner._cached_schedule.cache_clear()
+    greedy_ms, greedy_plans = timed(lambda: greedy.generate_schedules(durations))
+    cold_ms, optimal_plans = timed(lambda: optimal.generate_schedules(durations))
+    fresh = OptimalPlanner()
+    fresh.focus_minutes(args.max)
+    warm_ms, _ = timed(lambda: fresh.generate_schedules(durations))
+    replan_ms, _ = timed(lambda: [optimal.schedule_for(m) for m in durations])
+
+    totals = {"greedy": [0, 0], "optimal": [0, 0]}
+    gains = []
+    for minutes in durations:
+        g_work, g_idle = summarize(greedy_plans[minutes], minutes)
+        o_work, o_idle = summarize(optimal_plans[minutes], minutes)
+        totals["greedy"][0] += g_work
+        totals["greedy"][1] += g_idle
+        totals["optimal"][0] += o_work
+        totals["optimal"][1] += o_idle
+        if o_work != g_work:
+            gains.append((o_work - g_work, minutes, g_work, o_work))
+
+    n = len(durations)
+    print(f"{n} durations, {args.min}..{args.max} min")
+    for name, (work, idle) in totals.items():
+        print(f"{name:8} focus {work / n:7.1f} min/plan   idle {idle / n:5.2f} min/plan")
+    better = sum(1 for gain, *_ in gains if gain > 0)
+    worse = sum(1 for gain, *_ in gains if gain < 0)
+    print(f"optimal better on {better} durations, worse on {worse}")
+    for gain, minutes, g_work, o_work in sorted(gains, reverse=True)[:args.show]:
+        print(f"  {minutes:5} min: {g_work} -> {o_work} focused (+{gain})")
+    print(f"planning all: greedy {greedy_ms:.2f} ms, optimal cold {cold_ms:.2f} ms, "
+          f"optimal on a filled table {warm_ms:.2f} ms, cached re-plan {replan_ms:.3f} ms")
+    return 1 if worse else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
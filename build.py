@@ -1,39 +1,123 @@
+import argparse
+import base64
+import glob
+import io
 import os
 import subprocess
 import sys
 
-def build():
-    print("Building FocusTimer.exe...")
-    
-    # Check if assets exist
-    if not os.path.exists(os.path.join("assets", "icon.ico")):
-        print("Warning: assets/icon.ico not found. Icon options might fail.")
+ICON_ICO = os.path.join("assets", "icon.ico")
+ASSETS_MODULE = "icon_assets.py"
+WINDOW_ICON_SIZES = (16, 32, 48)  # Tk picks the best fit per use (title bar, taskbar)
+TRAY_ICON_SIZE = 64
+
+# Never imported by the app (or by PIL / pystray on its behalf); left out of
+# the standalone profile so there is less to unpack and scan at startup.
+TRIMMED_STDLIB = ("unittest", "doctest", "pydoc", "pydoc_data", "lib2to3", "distutils", "ensurepip",
+                  "idlelib", "tkinter.test", "test", "turtle", "turtledemo", "xmlrpc")
+# The icons are baked as raw pixels, so PIL needs no decoder at runtime.
+# pystray's Windows backend still writes the tray icon as ICO (PNG/BMP inside).
+KEEP_PIL_PLUGINS = ("BmpImagePlugin", "IcoImagePlugin", "PngImagePlugin")
+
+
+def bake_assets(output=ASSETS_MODULE):
+    """
+    Pre-decodes assets/icon.ico into an importable module: PNG variants of
+    the window icon (for Tk's iconphoto, no file needed) and the tray icon
+    as raw RGBA bytes (Image.frombuffer, no decoding at all).
+    """
+    from PIL import Image
+    icon = Image.open(ICON_ICO)
+    icon.load()
+    window_icons = []
+    for size in WINDOW_ICON_SIZES:
+        buf = io.BytesIO()
+        icon.convert("RGBA").resize((size, size), Image.LANCZOS).save(buf, format="PNG", optimize=True)
+        window_icons.append(base64.b64encode(buf.getvalue()).decode("ascii"))
+    tray = icon.convert("RGBA").resize((TRAY_ICON_SIZE, TRAY_ICON_SIZE), Image.LANCZOS)
+
+    lines = [
+        f"# Generated by build.py from {ICON_ICO.replace(os.sep, '/')}. Do not edit;",
+        "# re-run `python build.py --bake-only` when the icon changes.",
+        "",
+        "# Base64 PNGs for tk.PhotoImage(data=...), smallest first",
+        "WINDOW_ICONS = (",
+    ]
+    lines += [f"    {chunk!r}," for chunk in window_icons]
+    lines += [
+        ")",
+        "",
+        f"TRAY_ICON_SIZE = ({TRAY_ICON_SIZE}, {TRAY_ICON_SIZE})",
+        "TRAY_ICON_RGBA = (",
+    ]
+    raw = tray.tobytes()
+    lines += [f"    {raw[i:i + 48]!r}" for i in range(0, len(raw), 48)]
+    lines += [")", ""]
+    with open(output, "w", encoding="utf-8", newline="\n") as f:
+        f.write("\n".join(lines))
+    print(f"Baked {len(window_icons)} window icons and a {TRAY_ICON_SIZE}px tray icon -> {output}")
+
+
+def trimmed_imports():
+    """Modules the standalone build does not follow: unused stdlib and PIL plugins."""
+    import PIL
+    plugins = sorted(os.path.basename(path)[:-3]
+                     for path in glob.glob(os.path.join(os.path.dirname(PIL.__file__), "*ImagePlugin.py")))
+    return list(TRIMMED_STDLIB) + [f"PIL.{name}" for name in plugins if name not in KEEP_PIL_PLUGINS]
 
-    # Nuitka command
+
+def nuitka_command(profile):
     # Using sys.executable ensures we use the same python interpreter (e.g. from conda env)
     command = [
         sys.executable, "-m", "nuitka",
         "--assume-yes-for-downloads",
         "--standalone",
-        "--onefile",
         "--enable-plugin=tk-inter",
         "--windows-console-mode=disable",
-        "--include-data-file=assets/icon.ico=assets/icon.ico",
         "--windows-icon-from-ico=assets/icon.ico",
         "--output-filename=FocusTimer.exe",
-        "main.py"
     ]
-    
+    if profile == "onefile":
+        # One self-extracting file: unpacks itself to a temp dir on every launch
+        command += ["--onefile", "--include-data-file=assets/icon.ico=assets/icon.ico"]
+    else:
+        # A plain directory: nothing to unpack, icons come from icon_assets
+        command += ["--output-dir=dist/standalone", "--python-flag=no_docstrings"]
+        command += [f"--nofollow-import-to={name}" for name in trimmed_imports()]
+    command.append("main.py")
+    return command
+
+
+def build(profile="onefile"):
+    print(f"Building FocusTimer.exe ({profile})...")
+
+    # Check if assets exist
+    if not os.path.exists(ICON_ICO):
+        print("Warning: assets/icon.ico not found. Icon options might fail.")
+    else:
+        bake_assets()
+
+    command = nuitka_command(profile)
+
     print(f"Running command: {' '.join(command)}")
     print("-" * 50)
-    
+
     try:
         subprocess.check_call(command)
         print("-" * 50)
-        print("\nBuild successful! -> FocusTimer.exe")
+        output = "FocusTimer.exe" if profile == "onefile" else os.path.join("dist", "standalone", "main.dist")
+        print(f"\nBuild successful! -> {output}")
     except subprocess.CalledProcessError as e:
         print(f"\nBuild failed with error: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
-    build()
+    parser = argparse.ArgumentParser(description="FocusTimer build")
+    parser.add_argument("--profile", choices=("onefile", "standalone"), default="onefile",
+                        help="onefile: single self-extracting exe; standalone: trimmed directory build")
+    parser.add_argument("--bake-only", action="store_true", help="only regenerate icon_assets.py")
+    args = parser.parse_args()
+    if args.bake_only:
+        bake_assets()
+    else:
+        build(args.profile)
@@ -0,0 +1,104 @@
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+from planner import SessionPlanner
+
+MIN_GAP = 25 * 60  # Shorter free gaps can't hold a single warm-up block
+
+# One planned step placed on the calendar (times in epoch seconds)
+TimedStep = namedtuple("TimedStep", ("start", "end", "step"))
+
+
+class IntervalIndex:
+    """
+    Busy intervals as two parallel sorted lists of starts and ends, kept
+    merged (no overlaps, no touching neighbours). Lookups are a bisect,
+    so finding the gaps in a window costs O(log n + gaps in the window)
+    no matter how many weeks of calendar the index holds.
+    Intervals are half-open [start, end), in seconds.
+    """
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, intervals=()):
+        self.starts = []
+        self.ends = []
+        # Bulk load: one sort + linear merge instead of n inserts
+        for start, end in sorted(intervals):
+            if end <= start:
+                continue
+            if self.ends and start <= self.ends[-1]:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+
+    def add(self, start, end):
+        """Adds one busy interval, merging it with any it overlaps or touches."""
+        if end <= start:
+            return
+        lo = bisect_left(self.ends, start)     # First interval ending at/after start
+        hi = bisect_right(self.starts, end)    # Past the last one starting at/before end
+        if lo < hi:
+            start = min(start, self.starts[lo])
+            end = max(end, self.ends[hi - 1])
+        self.starts[lo:hi] = [start]
+        self.ends[lo:hi] = [end]
+
+    def is_busy(self, t):
+        i = bisect_right(self.starts, t) - 1
+        return i >= 0 and t < self.ends[i]
+
+    def free(self, window_start, window_end):
+        """Yields the free (start, end) gaps inside the window, in order."""
+        cursor = window_start
+        i = bisect_right(self.ends, window_start)  # Skip everything over before the window
+        starts, ends = self.starts, self.ends
+        while cursor < window_end:
+            if i >= len(starts) or starts[i] >= window_end:
+                yield cursor, window_end
+                return
+            if starts[i] > cursor:
+                yield cursor, starts[i]
+            cursor = max(cursor, ends[i])
+            i += 1
+
+
+class CalendarPlanner:
+    """
+    Plans focus blocks around a calendar. Every free gap of at least
+    MIN_GAP gets its own plan from SessionPlanner (25m warm-up, 35m peaks,
+    ...), sized to the whole minutes of the gap, so the plans of a day
+    line up back to back with the meetings in between. Windows may span
+    any number of days; nights are just busy intervals like any other.
+    """
+
+    def __init__(self, busy=(), planner=None):
+        self.busy = busy if isinstance(busy, IntervalIndex) else IntervalIndex(busy)
+        self.planner = planner or SessionPlanner()
+
+    def gaps(self, window_start, window_end, min_gap=MIN_GAP):
+        for start, end in self.busy.free(window_start, window_end):
+            if end - start >= min_gap:
+                yield start, end
+
+    def iter_plan(self, window_start, window_end):
+        """Yields TimedSteps for the window, in time order."""
+        schedule_for = self.planner.schedule_for
+        for start, end in self.gaps(window_start, window_end):
+            t = start
+            for step in schedule_for(int(end - start) // 60):
+                yield TimedStep(t, t + step.duration, step)
+                t += step.duration
+
+    def plan(self, window_start, window_end):
+        return list(self.iter_plan(window_start, window_end))
+
+    def plans(self, window_start, window_end):
+        """(gap start, plan minutes) per gap: what start_custom_plan would be given."""
+        return [(start, int(end - start) // 60) for start, end in self.gaps(window_start, window_end)]
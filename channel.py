@@ -0,0 +1,51 @@
+import collections
+from enum import Enum
+
+
+class Message(Enum):
+    SHOW = "SHOW"
+    QUIT = "QUIT"
+
+
+class UIChannel:
+    """
+    Thread-safe message channel into the Tk event loop.
+    Messages are queued and the UI thread is woken with a virtual event, so
+    the loop only runs when something was actually posted (no polling).
+    The queue is a deque (append / popleft are atomic), not queue.SimpleQueue,
+    which would pull threading onto the startup path.
+    """
+    EVENT = "<<FocusTimerMessage>>"
+
+    def __init__(self, root, on_wakeup):
+        self.root = root
+        self._queue = collections.deque()
+        self._on_wakeup = on_wakeup
+        self.root.bind(self.EVENT, on_wakeup)
+
+    def post(self, message, payload=None):
+        """
+        Callable from any thread (e.g. the pystray thread). Returns False if
+        no wakeup could be arranged (the message waits for the next drain).
+        """
+        self._queue.append((Message(message), payload))
+        try:
+            # With threaded Tcl, tkinter marshals this call onto the UI thread
+            self.root.event_generate(self.EVENT, when="tail")
+        except Exception:
+            # The event couldn't be raised: drain from an after() callback instead
+            try:
+                self.root.after(0, self._on_wakeup)
+            except Exception:
+                # No main loop at all (startup/shutdown): the message stays
+                # queued for the next drain
+                return False
+        return True
+
+    def drain(self):
+        """Yields all pending (message, payload) pairs. UI thread only."""
+        while True:
+            try:
+                yield self._queue.popleft()
+            except IndexError:
+                return
@@ -0,0 +1,318 @@
+"""
+Terminal timer for machines without a display (SSH, containers):
+
+    python -m cli [MINUTES] [--planner greedy|optimal] [--auto] [--list]
+
+Runs the same SessionPlanner plans on the headless SessionEngine and
+writes the same distraction log and session DB (focus.db), both in
+logstore.data_dir(), as the window. Only stdlib modules are loaded -
+never main.py, tkinter, PIL or pystray - so it starts in a few tens of
+milliseconds.
+
+Keys (a single keypress on a terminal, one command per line when piped):
+    space/s  start / pause      n  next step     p  previous step
+    d        log a distraction  r  reset step    q  quit
+"""
+import os
+import sys
+import time
+
+from clock import SYSTEM_CLOCK
+from engine import SessionEngine, STEP, PLAN_DONE, START, STOP, FINISH, OVERTIME, OVERTIME_END
+from logstore import data_path, open_log
+from stats import format_summary
+from store import SessionStore
+
+HELP = "[space/s] 시작/일시정지  [n] 다음  [p] 이전  [d] 딴짓  [r] 리셋  [q] 종료"
+
+
+def format_time(seconds):
+    mins, secs = divmod(int(seconds), 60)
+    return f"{mins:02}:{secs:02}"
+
+
+class KeyReader:
+    """
+    Commands from stdin without blocking the countdown. On a terminal every
+    keypress is a command (cbreak mode, restored on exit); piped input is
+    read a line at a time, an empty line meaning start/pause.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdin
+        self.eof = False
+        self._saved = None
+        self._partial = ""
+
+    def __enter__(self):
+        if os.name != "nt" and self.stream.isatty():
+            import termios
+            import tty
+            fd = self.stream.fileno()
+            self._saved = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+        return self
+
+    def __exit__(self, *exc):
+        if self._saved is not None:
+            import termios
+            termios.tcsetattr(self.stream.fileno(), termios.TCSADRAIN, self._saved)
+            self._saved = None
+
+    def read(self, timeout):
+        """
+        Commands typed within `timeout` seconds (None waits for input).
+        Returns None once the input is closed.
+        """
+        if self.eof:
+            if timeout is not None:
+                time.sleep(timeout)
+            return None
+        if os.name == "nt":
+            return self._read_console(timeout)
+        import select
+        ready, _, _ = select.select([self.stream], [], [], timeout)
+        if not ready:
+            return []
+        data = os.read(self.stream.fileno(), 1024).decode(errors="ignore")
+        if not data:
+            self.eof = True
+            return None
+        if self._saved is not None:
+            return list(data.lower())
+        *lines, self._partial = (self._partial + data).split("\n")
+        return [line.strip()[:1].lower() or " " for line in lines]
+
+    def _read_console(self, timeout):
+        import msvcrt
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not msvcrt.kbhit():
+            if deadline is not None and time.monotonic() >= deadline:
+                return []
+            time.sleep(0.02)
+        keys = []
+        while msvcrt.kbhit():
+            keys.append(msvcrt.getwch().lower())
+        return keys
+
+
+class TerminalTimer:
+    """
+    The window's timer flow on a terminal: one engine session, the same
+    store/log bookkeeping as PomodoroApp, and a status line redrawn on each
+    second boundary. The only blocking call is keys.read(timeout), which
+    is timed to wake at the next second (or the step deadline).
+    """
+
+    def __init__(self, keys, planner=None, store=None, log_writer=None, out=None, clock=SYSTEM_CLOCK, auto=False):
+        self.keys = keys
+        self.clock = clock
+        self.engine = SessionEngine(planner, clock=clock.monotonic)
+        self.timer = self.engine.create()
+        self.engine.subscribe(self._on_event, self.timer.id)
+        self.store = store or SessionStore(data_path("focus.db"), clock=clock.wall)
+        self.log_writer = log_writer or open_log()
+        self.out = out or sys.stdout
+        self.live = self.out.isatty()  # Redraw a status line in place; otherwise print events only
+        self.auto = auto
+        self.done = False
+        self.plan_id = None
+        self.session_id = None
+        self.finished_session_id = None
+        self.commands = {
+            " ": self.toggle, "s": self.toggle, "\n": self.toggle,
+            "n": self.skip_step,
+            "p": self.prev_step,
+            "d": self.log_distraction,
+            "r": lambda: self.engine.reset(self.timer),
+            "q": self.quit,
+            "h": lambda: self.say(HELP), "?": lambda: self.say(HELP),
+        }
+        self._handlers = {
+            STEP: self._on_step, PLAN_DONE: self._on_plan_done, START: self._on_start,
+            STOP: lambda: self.say("일시정지"), FINISH: self._on_finish,
+            OVERTIME: lambda: self.say("단계 종료 - 다음 단계를 시작하세요"), OVERTIME_END: self._on_overtime_end,
+        }
+
+    # --- Loop ---
+    def run(self, minutes):
+        stats = self.store.load_stats()
+        now = self.clock.wall()
+        self.say(f"오늘: {format_summary(stats.today(now))} | 이번 주: {format_summary(stats.week(now))}")
+        if not self.start_plan(minutes):
+            return 1
+        self.say(HELP)
+        try:
+            while not self.done:
+                if self.engine.advance() and self.auto and self.timer.schedule:
+                    self.engine.start(self.timer)
+                self.render()
+                if self.done:
+                    break
+                commands = self.keys.read(self._wait())
+                if commands is None and not self.timer.running:
+                    break  # Input closed and nothing left to wait for
+                for command in commands or ():
+                    action = self.commands.get(command)
+                    if action is not None:
+                        action()
+        finally:
+            self.close()
+        return 0
+
+    def _wait(self):
+        if self.timer.running:
+            return self.timer.countdown.next_tick_ms() / 1000
+        if self.live:
+            return 1.0  # Keeps the overtime counter moving
+        return None
+
+    def start_plan(self, minutes):
+        if not self.engine.planner.schedule_for(minutes):
+            self.say("의미 있는 세션을 갖기에 시간이 너무 짧습니다.")
+            return False
+        self.plan_id = self.store.start_plan(minutes)
+        self.engine.load_plan(self.timer, minutes)
+        return True
+
+    # --- Commands ---
+    def toggle(self):
+        if self.timer.running:
+            self.engine.stop(self.timer)
+        else:
+            self.engine.start(self.timer)
+
+    def skip_step(self):
+        timer = self.timer
+        if timer.schedule and timer.index < len(timer.schedule) - 1:
+            if self.session_id is None:  # A step skipped before it was started counts too
+                self.session_id = self.store.start_session(self.plan_id, timer.index, timer.step)
+            self._end_session("skipped")
+            self.engine.skip_step(timer)
+
+    def prev_step(self):
+        if self.timer.schedule and self.timer.index > 0:
+            self._end_session("interrupted")  # Going back leaves the step unfinished, not skipped
+            self.engine.prev_step(self.timer)
+
+    def log_distraction(self):
+        if self.timer.is_break or not self.timer.running:
+            return
+        countdown = self.timer.countdown
+        left = countdown.seconds_left()
+        now = self.clock.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.log_writer.write([now, format_time(left), format_time(max(0, countdown.duration - left))])
+        self.store.log_distraction(self.session_id, left)
+        self.say(f"딴짓 기록됨 ({now[11:]})")
+
+    def quit(self):
+        self.done = True
+
+    def close(self):
+        self._end_session("aborted")
+        self.store.close()
+        self.log_writer.close(timeout=2.0)
+        if self.live:
+            self.out.write("\n")
+            self.out.flush()
+
+    # --- Output ---
+    def say(self, message):
+        self.out.write(("\r\x1b[K" if self.live else "") + message + "\n")
+        self.out.flush()
+
+    def status(self):
+        step = self.timer.step
+        label = step.label if step is not None else "-"
+        text = f"{label}  {format_time(self.timer.countdown.seconds_left())}"
+        if self.timer.overtime_since is not None:
+            text += f"  +{format_time(self.engine.overtime(self.timer))}"
+        elif not self.timer.running:
+            text += "  (대기)"
+        return text
+
+    def render(self):
+        if self.live:
+            self.out.write("\r\x1b[K" + self.status())
+            self.out.flush()
+
+    # --- Engine events ---
+    def _on_event(self, event, timer):
+        handler = self._handlers.get(event)
+        if handler is not None:
+            handler()
+
+    def _on_step(self):
+        self._end_session("skipped")
+        step = self.timer.step
+        self.say(f"단계 {self.timer.index + 1}/{len(self.timer.schedule)}: {step.label} ({format_time(step.duration)})")
+        self.flush_store()
+
+    def _on_plan_done(self):
+        self._end_session("skipped")
+        self.say("플랜 완료! 🎉")
+        self.flush_store()
+        self.done = True
+
+    def _on_start(self):
+        if self.session_id is None:
+            self.session_id = self.store.start_session(self.plan_id, self.timer.index, self.timer.step)
+        self.flush_store()
+
+    def _on_finish(self):
+        self._end_session("completed")
+        self.out.write("\a")  # Terminal bell instead of raising the window
+
+    def _on_overtime_end(self):
+        if self.finished_session_id is not None:
+            self.store.add_overtime(self.finished_session_id, self.engine.overtime(self.timer))
+            self.finished_session_id = None
+
+    def flush_store(self):
+        # A failed commit keeps the rows queued for the next transition
+        import sqlite3
+        try:
+            self.store.flush()
+        except sqlite3.Error as e:
+            self.say(f"기록 저장 실패 (다음 단계에서 다시 시도): {e}")
+
+    def _end_session(self, status):
+        if self.session_id is not None:
+            self.store.end_session(self.session_id, status)
+            if status == "completed":
+                self.finished_session_id = self.session_id  # Collects the overtime that follows
+            self.session_id = None
+
+
+def parse_args(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog="python -m cli", description="집중 타이머 (터미널)")
+    parser.add_argument("minutes", nargs="?", type=int, default=60, help="플랜 길이 (분)")
+    parser.add_argument("--planner", choices=("greedy", "optimal"), default="greedy",
+                        help="플랜 생성 방식 (optimal: 블록 카탈로그 동적 계획법)")
+    parser.add_argument("--auto", action="store_true", help="단계가 끝나면 다음 단계를 바로 시작합니다")
+    parser.add_argument("--list", action="store_true", help="플랜을 출력하고 종료합니다")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    planner = None
+    if args.planner == "optimal":
+        from optimal_planner import OptimalPlanner
+        planner = OptimalPlanner()
+    if args.list:
+        from planner import SessionPlanner
+        steps = (planner or SessionPlanner()).schedule_for(args.minutes)
+        for index, step in enumerate(steps, 1):
+            print(f"{index:2}. {format_time(step.duration)}  {step.label}")
+        return 0 if steps else 1
+    with KeyReader() as keys:
+        try:
+            return TerminalTimer(keys, planner, auto=args.auto).run(args.minutes)
+        except KeyboardInterrupt:
+            return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+import heapq
+import time
+from datetime import datetime
+
+
+class SystemClock:
+    """
+    The clocks the app reads, behind one object so a simulation can swap
+    them all at once (see VirtualClock below):
+    monotonic() for deadlines, wall() for stored timestamps, now() for
+    local datetimes written to logs.
+    """
+
+    def monotonic(self):
+        return time.monotonic()
+
+    def wall(self):
+        return time.time()
+
+    def now(self):
+        return datetime.now()
+
+
+SYSTEM_CLOCK = SystemClock()
+
+
+EPOCH = datetime(2026, 1, 5, 9, 0).timestamp()  # Monday, 09:00 local time
+
+
+class VirtualClock:
+    """
+    Deterministic stand-in for SystemClock, for tests, benchmarks and the
+    simulation. Time only moves when a VirtualScheduler runs a callback or
+    the caller advances it; monotonic 0.0 is the wall-clock `epoch`.
+    Callable, so it also fits `clock=` parameters.
+    """
+
+    def __init__(self, epoch=EPOCH, start=0.0):
+        self.t = start
+        self.epoch = epoch
+
+    def __call__(self):
+        return self.t
+
+    monotonic = __call__
+
+    def wall(self):
+        return self.epoch + self.t
+
+    def now(self):
+        return datetime.fromtimestamp(self.epoch + self.t)
+
+    def advance(self, seconds):
+        self.t += seconds
+
+
+class VirtualScheduler:
+    """
+    root.after()/after_cancel()/after_idle() on a VirtualClock: callbacks run
+    in due order, instantly. `lag` delays every callback past its due time and
+    `cost` is how long each one takes, to model a slow or busy Tk loop.
+    """
+
+    def __init__(self, clock, lag=0.0, cost=0.0):
+        self.clock = clock
+        self.lag = lag
+        self.cost = cost
+        self.fired = 0
+        self._heap = []
+        self._seq = 0
+        self._live = set()
+        self._stopped = False
+
+    def after(self, ms, func=None, *args):
+        self._seq += 1
+        heapq.heappush(self._heap, (self.clock.t + ms / 1000 + self.lag, self._seq, func, args))
+        self._live.add(self._seq)
+        return self._seq
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, after_id):
+        self._live.discard(after_id)
+
+    def pending(self):
+        """Number of callbacks scheduled and not yet run or cancelled."""
+        return len(self._live)
+
+    def next_due(self):
+        """When the earliest pending callback runs, or None."""
+        heap = self._heap
+        while heap and heap[0][1] not in self._live:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def run_next(self):
+        """Runs the earliest pending callback, moving the clock to its due time; False if none is left."""
+        if self.next_due() is None:
+            return False
+        when, seq, func, args = heapq.heappop(self._heap)
+        self._live.discard(seq)
+        if when > self.clock.t:
+            self.clock.t = when
+        func(*args)
+        self.fired += 1
+        self.clock.t += self.cost
+        return True
+
+    def run_until(self, until):
+        """Runs every callback due by `until`, then leaves the clock there."""
+        while True:
+            when = self.next_due()
+            if when is None or when > until:
+                break
+            self.run_next()
+        if until > self.clock.t:
+            self.clock.t = until
+
+    def run_for(self, seconds):
+        self.run_until(self.clock.t + seconds)
+
+    def run(self, max_events=None):
+        """Like mainloop(): runs callbacks until none are left, stop() is called or `max_events` ran."""
+        self._stopped = False
+        ran = 0
+        while not self._stopped and (max_events is None or ran < max_events) and self.run_next():
+            ran += 1
+        return ran
+
+    def stop(self):
+        self._stopped = True
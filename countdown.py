@@ -0,0 +1,88 @@
+import math
+import time
+
+
+class Countdown:
+    """
+    Deadline based countdown.
+    Instead of decrementing a counter on every tick, we store the monotonic
+    deadline and derive the remaining time from it. Late ticks, sleeps and
+    event loop stalls therefore never accumulate drift - the next tick simply
+    catches up with the clock.
+    """
+    __slots__ = ("clock", "duration", "_remaining", "deadline")
+
+    def __init__(self, duration, clock=time.monotonic):
+        self.clock = clock
+        self.duration = duration
+        self._remaining = float(duration)  # Frozen value while stopped
+        self.deadline = None               # Monotonic deadline while running
+
+    @property
+    def running(self):
+        return self.deadline is not None
+
+    def start(self):
+        if self.deadline is None:
+            self.deadline = self.clock() + self._remaining
+
+    def stop(self):
+        if self.deadline is not None:
+            self._remaining = max(0.0, self.deadline - self.clock())
+            self.deadline = None
+
+    def reset(self, duration=None):
+        """Stops the countdown and rewinds it to `duration` (or the current duration)."""
+        if duration is not None:
+            self.duration = duration
+        self.deadline = None
+        self._remaining = float(self.duration)
+
+    def set_remaining(self, seconds):
+        """Stops the countdown with `seconds` left, keeping its duration."""
+        self.deadline = None
+        self._remaining = max(0.0, float(seconds))
+
+    def remaining(self):
+        """Exact remaining time in seconds (float, never negative)."""
+        if self.deadline is None:
+            return self._remaining
+        return max(0.0, self.deadline - self.clock())
+
+    def seconds_left(self):
+        # Round up so "25:00" is shown at start and "00:00" only once expired.
+        return int(math.ceil(self.remaining()))
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    def next_tick_ms(self):
+        """Milliseconds until the displayed second changes."""
+        remaining = self.remaining()
+        fraction = remaining - (math.ceil(remaining) - 1)
+        return max(1, int(math.ceil(fraction * 1000)))
+
+    def deadline_ms(self):
+        """Milliseconds until the countdown runs out."""
+        return max(1, int(math.ceil(self.remaining() * 1000)))
+
+
+class Stopwatch:
+    """Counts up from a monotonic start point (used for the overtime display)."""
+    __slots__ = ("clock", "start")
+
+    def __init__(self, start=None, clock=time.monotonic):
+        self.clock = clock
+        self.start = clock() if start is None else start
+
+    def elapsed(self):
+        return max(0.0, self.clock() - self.start)
+
+    def seconds(self):
+        return int(self.elapsed())
+
+    def next_tick_ms(self):
+        """Milliseconds until the next whole second of elapsed time."""
+        elapsed = self.elapsed()
+        fraction = math.floor(elapsed) + 1 - elapsed
+        return max(1, int(math.ceil(fraction * 1000)))
@@ -0,0 +1,326 @@
+import heapq
+import itertools
+import time
+
+from countdown import Countdown
+from planner import SessionPlanner, StepType, seconds_from
+
+WORK_TIME = 25 * 60
+BREAK_TIME = 5 * 60
+# How far (seconds) the rest of a plan may run past its budget before it is re-fitted
+REPLAN_SLACK = 60
+
+# Events published to subscribers as callback(event, session)
+STEP = "step"              # A plan step was loaded (not started)
+PLAN_DONE = "plan_done"    # Moved past the last plan step
+MODE = "mode"              # Legacy 25/5 loop switched work <-> break
+START = "start"
+STOP = "stop"
+RESET = "reset"
+FINISH = "finish"          # Countdown reached zero (before the next step loads)
+OVERTIME = "overtime"      # Overtime started counting
+OVERTIME_END = "overtime_end"
+
+
+class FocusSession:
+    """
+    Compact per-session state. Schedules are the planner's shared immutable
+    tuples, so thousands of sessions on the same plan share one schedule.
+    """
+    __slots__ = ("id", "schedule", "index", "is_break", "running",
+                 "countdown", "overtime_since", "plan_minutes", "plan_deadline", "replans",
+                 "__weakref__")
+
+    def __init__(self, session_id, clock):
+        self.id = session_id
+        self.schedule = ()
+        self.index = -1
+        self.is_break = False
+        self.running = False
+        self.countdown = Countdown(WORK_TIME, clock=clock)
+        self.overtime_since = None  # Monotonic time overtime started counting from
+        self.plan_minutes = None
+        self.plan_deadline = None  # Monotonic time the plan's budget runs out (set on its first start)
+        self.replans = []          # (index, minutes) of every re-fit, to rebuild the schedule
+
+    @property
+    def step(self):
+        if self.schedule and 0 <= self.index < len(self.schedule):
+            return self.schedule[self.index]
+        return None
+
+    @property
+    def in_plan(self):
+        return bool(self.schedule)
+
+
+class SessionEngine:
+    """
+    Headless timer state machine for any number of focus sessions.
+    Running sessions are kept in a deadline min-heap; advance() finishes every
+    session whose deadline has passed. The engine never sleeps or ticks by
+    itself: hosts (the Tk app, the socket server, tests) drive it and
+    subscribe to its events. When a plan falls behind its budget (overtime,
+    pauses, a step skipped while under way) the steps not yet started are
+    re-fitted to the time left as the next work step loads.
+    """
+
+    def __init__(self, planner=None, clock=time.monotonic):
+        self.planner = planner or SessionPlanner()
+        self.clock = clock
+        self.sessions = {}
+        self._ids = itertools.count(1)
+        self._heap = []  # (deadline, session_id) - stale entries skipped lazily
+        self._subscribers = []
+        self._session_subscribers = {}
+
+    # --- Subscriptions ---
+    def subscribe(self, callback, session_id=None):
+        """callback(event, session) for one session, or all if session_id is None."""
+        if session_id is None:
+            self._subscribers.append(callback)
+        else:
+            self._session_subscribers.setdefault(session_id, []).append(callback)
+        return callback
+
+    def unsubscribe(self, callback, session_id=None):
+        subscribers = self._subscribers if session_id is None else self._session_subscribers.get(session_id, [])
+        if callback in subscribers:
+            subscribers.remove(callback)
+
+    def _emit(self, event, session):
+        for callback in self._subscribers:
+            callback(event, session)
+        for callback in self._session_subscribers.get(session.id, ()):
+            callback(event, session)
+
+    # --- Lifecycle ---
+    def create(self):
+        session = FocusSession(next(self._ids), self.clock)
+        self.sessions[session.id] = session
+        return session
+
+    def remove(self, session):
+        self.sessions.pop(session.id, None)
+        self._session_subscribers.pop(session.id, None)
+
+    def load_plan(self, session, minutes):
+        """Loads a fresh plan. Returns False if `minutes` is too short for one."""
+        schedule = self.planner.schedule_for(minutes)
+        if not schedule:
+            return False
+        session.schedule = schedule
+        session.plan_minutes = minutes
+        session.plan_deadline = None
+        session.replans = []
+        session.index = -1
+        self.next_step(session)
+        return True
+
+    def load_step(self, session, index, now=None):
+        self.stop_overtime(session)
+        if session.index < index < len(session.schedule):
+            self._refit(session, index, self.clock() if now is None else now)
+        if index < len(session.schedule):
+            session.index = index
+            step = session.schedule[index]
+            session.is_break = step.type is StepType.BREAK
+            session.countdown.reset(step.duration)
+            if session.running:
+                # Navigating while running keeps the clock going on the new step
+                self._arm(session)
+            self._emit(STEP, session)
+        else:
+            session.schedule = ()
+            self._emit(PLAN_DONE, session)
+
+    def _refit(self, session, index, now):
+        """
+        Re-plans schedule[index:] into the time left if it would run more
+        than REPLAN_SLACK past the budget. Only at a work step, so a break
+        stays with the block it belongs to, and only forwards, so the steps
+        already done are kept as they are. O(1) with the bundled planners.
+        """
+        replan = getattr(self.planner, "replan", None)
+        if (replan is None or session.plan_deadline is None or index == 0
+                or session.schedule[index].type is not StepType.WORK):
+            return
+        left = session.plan_deadline - now
+        if seconds_from(session.schedule, index) - left < REPLAN_SLACK:
+            return
+        minutes = max(0, int(left // 60))
+        session.schedule = replan(session.schedule, index, minutes)
+        session.replans.append((index, minutes))
+
+    def next_step(self, session, now=None):
+        self.load_step(session, session.index + 1, now)
+
+    def prev_step(self, session):
+        if session.schedule and session.index > 0:
+            self.load_step(session, session.index - 1)
+            return True
+        return False
+
+    def skip_step(self, session):
+        if session.schedule and session.index < len(session.schedule) - 1:
+            self.load_step(session, session.index + 1)
+            return True
+        return False
+
+    # --- Timer ---
+    def start(self, session):
+        if session.running:
+            return False
+        session.running = True
+        if session.schedule and session.plan_deadline is None and session.plan_minutes:
+            # The budget counts from the first start, not from when the plan was loaded
+            session.plan_deadline = self.clock() + session.plan_minutes * 60
+        self.stop_overtime(session)
+        self._arm(session)
+        self._emit(START, session)
+        return True
+
+    def stop(self, session):
+        if not session.running:
+            return False
+        session.running = False
+        session.countdown.stop()
+        self._emit(STOP, session)
+        return True
+
+    def reset(self, session):
+        self.stop(session)
+        self.stop_overtime(session)
+        step = session.step
+        if step is not None:
+            session.countdown.reset(step.duration)
+        else:
+            # Fallback to standard 25/5
+            session.countdown.reset(BREAK_TIME if session.is_break else WORK_TIME)
+        self._emit(RESET, session)
+
+    def finish(self, session):
+        # Overtime counts from the real deadline, not from when we noticed
+        finished_at = session.countdown.deadline
+        session.running = False
+        session.countdown.stop()
+        self._emit(FINISH, session)
+
+        if session.schedule:
+            # Re-fit as of the deadline too, however late the finish was noticed
+            self.next_step(session, finished_at)
+            if session.schedule:  # Not past the last step (or re-fitted to none)
+                self.start_overtime(session, finished_at)
+        else:
+            self.toggle_mode(session)
+            self.start_overtime(session, finished_at)
+
+    def toggle_mode(self, session):
+        """Legacy 25/5 loop without a plan."""
+        session.is_break = not session.is_break
+        session.countdown.reset(BREAK_TIME if session.is_break else WORK_TIME)
+        self._emit(MODE, session)
+
+    # --- Overtime ---
+    def start_overtime(self, session, since=None):
+        self.stop_overtime(session)
+        session.overtime_since = session.countdown.clock() if since is None else since
+        self._emit(OVERTIME, session)
+
+    def stop_overtime(self, session):
+        if session.overtime_since is not None:
+            self._emit(OVERTIME_END, session)
+            session.overtime_since = None
+
+    def overtime(self, session):
+        if session.overtime_since is None:
+            return 0.0
+        return max(0.0, session.countdown.clock() - session.overtime_since)
+
+    # --- Persistence ---
+    def snapshot(self, session, wall_clock=time.time):
+        """JSON-friendly state of a session; deadlines are stored as wall-clock times."""
+        offset = wall_clock() - session.countdown.clock()
+        deadline = session.countdown.deadline if session.running else None
+        return {
+            "plan": session.plan_minutes if session.schedule else None,
+            "index": session.index,
+            "is_break": session.is_break,
+            "remaining": round(session.countdown.remaining(), 3),
+            "deadline": None if deadline is None else round(deadline + offset, 3),
+            "overtime_since": None if session.overtime_since is None else round(session.overtime_since + offset, 3),
+            "plan_deadline": None if session.plan_deadline is None else round(session.plan_deadline + offset, 3),
+            "replans": session.replans,
+        }
+
+    def restore(self, session, state, wall_clock=time.time):
+        """
+        Puts a session back into a snapshot() state. A deadline that passed
+        in the meantime is kept as is, so the next advance() finishes the
+        step and counts overtime from the real deadline.
+        """
+        offset = session.countdown.clock() - wall_clock()
+        self.stop_overtime(session)
+        schedule = self.planner.schedule_for(state["plan"]) if state.get("plan") else ()
+        replans = [tuple(replan) for replan in state.get("replans") or ()] if schedule else []
+        for replan_index, minutes in replans:
+            schedule = self.planner.replan(schedule, replan_index, minutes)
+        index = state.get("index", -1)
+        if not 0 <= index < len(schedule):
+            schedule, index = (), -1
+        session.schedule = schedule
+        session.plan_minutes = state.get("plan") if schedule else None
+        plan_deadline = state.get("plan_deadline") if schedule else None
+        session.plan_deadline = None if plan_deadline is None else plan_deadline + offset
+        session.replans = replans if schedule else []
+        session.index = index
+        session.running = False
+        step = session.step
+        session.is_break = step.type is StepType.BREAK if step is not None else bool(state.get("is_break"))
+        session.countdown.reset(step.duration if step is not None else
+                                (BREAK_TIME if session.is_break else WORK_TIME))
+        if state.get("remaining") is not None:
+            session.countdown.set_remaining(state["remaining"])
+        self._emit(STEP if schedule else MODE, session)
+
+        if state.get("deadline") is not None:
+            session.running = True
+            session.countdown.deadline = state["deadline"] + offset
+            self._arm(session)
+            self._emit(START, session)
+        elif state.get("overtime_since") is not None:
+            self.start_overtime(session, state["overtime_since"] + offset)
+
+    # --- Scheduling ---
+    def _arm(self, session):
+        session.countdown.start()
+        heapq.heappush(self._heap, (session.countdown.deadline, session.id))
+        if len(self._heap) > 2 * len(self.sessions) + 64:
+            self._compact()
+
+    def _compact(self):
+        self._heap = [(s.countdown.deadline, s.id) for s in self.sessions.values()
+                      if s.running and s.countdown.deadline is not None]
+        heapq.heapify(self._heap)
+
+    def next_deadline(self):
+        """Earliest pending deadline (monotonic seconds) or None."""
+        while self._heap:
+            deadline, session_id = self._heap[0]
+            session = self.sessions.get(session_id)
+            if session is not None and session.running and session.countdown.deadline == deadline:
+                return deadline
+            heapq.heappop(self._heap)
+        return None
+
+    def advance(self, now=None):
+        """Finishes every session whose deadline is <= now. Returns how many."""
+        now = self.clock() if now is None else now
+        finished = 0
+        while True:
+            deadline = self.next_deadline()
+            if deadline is None or deadline > now:
+                return finished
+            _, session_id = heapq.heappop(self._heap)
+            self.finish(self.sessions[session_id])
+            finished += 1
@@ -0,0 +1,355 @@
+# Generated by build.py from assets/icon.ico. Do not edit;
+# re-run `python build.py --bake-only` when the icon changes.
+
+# Base64 PNGs for tk.PhotoImage(data=...), smallest first
+WINDOW_ICONS = (
+    'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAB5ElEQVR42rWTPWsUURSGn3NmZndczIdxDURQ0SyKNoKIwUJZsQmxdfIL9HcsW1mIlcHOMk0GEqsYTLNBbKzsNERFQQ3sgGQT485md+6xGBMWTBCRnObCve97OO/DufCfJftdRnORd+lEU2hUHUC9XnccVu1NYIaIYDNz0dGkoDMaBhudTX3ofrQuVxJ7Ob7YajdWVlwd3P4RDDGBaasFZ168+1QeCsd+Jp0vX9s7T55Ozz/4+wQgYrBx487wq1v+szdXi9e3Qw1uz288v7KWbaUl7333yMCj03H83UAErL+BGMja5GRQst5K2enE51Lm0lA5tYUGGZQCn2/d7uv2ef/m7OOlbj1vYApgUaQCLjSrDvveRCK9bGgbHUsyTbtZ1jLXW+90do75/rXwo1Xr4CyKFMAHoNkUABU7B+IEsZ4H4gkYngiA9DBzuabPA9DY42CJA8XyTHnK/DTAgRqa9HtkFyDAejRZts3eh6IwkGZuR0TyiGYu9LTQMbbaJamMLywnv805AwGLo0hPxkuJed49VU1HioXCoO/7g4HvjxQLBVVNLdD7lYXlZpwzsz9W2UAF3OrU1MXjkt3tOncBQTy81W00Pru4+HZXc+BqWq2m//ImBwobDWV01PaIV6tODuNT/QKuedOmJibV0AAAAABJRU5ErkJggg==',
+    'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAEPElEQVR42u1WTWxUVRg957vvTTvlp9BKTUSQBBJIjVjWGqcmIhoVQ3CImhDSDYkhLFwZVs9JQ9gYEyMrVioLSAdDwKYLXQAu1LgyCKgh/hA1kFZGoLXtzHvvHhfzpvwNnZYoiZFvM3lz3/u+851z7r0fcD/+78G5vlgcKrreZaN8dKxHxWLZk1BjTQJvfL4nURwquvk2cdchiYMjA08Ofjrw2r7PBp7ZN/zGUgCIosgAIDq6Y8m/IoEkktTekd3LpuOxX9sWB21JzYPiJR+7vaWXPtr/5gdb3iLx6rs7jm6AQMxTihYA6tq+N7J78Vg8ep6mrjT1CEILcrkQ8YTtulL5c1+e4Z5NH1YOTK3Pu4lLi5JiueyJuQFpqV+kyN4mEB0/PxLmsan6V5x6imbmnVlQ+WPy9Ps7jj9+63dDxaLbVi6nrfIHrV546MBFRxyIB/3AO7GqG+M2IqzCmMhbB7Qkdt9d27j5qdF8vLpDjJ2FP53r6/v66VIpURQZSyV/1ww0uvhxy+YXlo1PD55e69afeqLDxjsdQWAqBPpHrqbPfuNd2mGggKoEmZ29FrTtWX3s2CetmGCr4r+8/OLWzjg+Ankkkwkm84bRBwNMdRiCqsfyiwlyNe9FekkUyQ5nZs7hioWvrBoe/ng2EE0BKPv/9+3buzR26Yd2+e6aVwJjAA+EsYcJEIE4IMSbE3ogaSODmrnL40u71609dOhytnabMa1p+4WCI6C0MratK3Dd014JycAAkEC1zTCdd6i1O8gIgvWFOniQCKahZImz7oUT14oEhELBNSvVHEBPjwDAvO/33sss29y+XsA8YMr2KXidxwYOEgbCS1KS9t+Yc267oFz22UGwIgEoiQbCU/UqlnUq1YHxdkUFMZUIaMVNOefEQCMdGSjj1UMzAlLIDjyC2XNjUdkvPSAJ5OxbvTmAaKaVSsA6xfWizJwkSIBuoT/DBCiTyggJldkM3xzAyYIBgMgzjhRAZTggaSYXmQHhdQYg1f1hVEATzM5mxrZ5mzAJ24drAiHR13XFda836byOCt4ASKxBRFtueDYTNgXAcjkVYKv6+j4fl75cHATOA0ldhMZ1pzobDZNohgJ4KVkcBm7c66uHH9twSoDxDgfRnU0YRWCp5LFowc4qObHIuUBQ7AFPUCAzPhrtU4K894gXOAtq4AQWdu5kqeQRRfM0IQCWSl5RZCuHjp652p57zpv7uTuXC/NGI0FJHlIqIRXkSTBvZg+05cLUBReu5vLPryyXv211IbW8jhvn+BfFYtea6cld8EkxTdN17WZhwDr+RB5TXokz+15BeKTSuXR/78GDl+dyJc9pnruxC0n87fWta8Jq8ohidaUmBsZKkuu4sPzw4fMkdes3/8xcCPBEodByfjhRKASax6B6NxMtFUXEuXM8OTpKAOjv6RF6e8VSScA9Hs/vx38+/gZPSBAn0+vi6QAAAABJRU5ErkJggg==',
+    'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAHeUlEQVR42u1ZbYxcZRV+znnvndlpd9lu223XVD7EtmLbREIwICpbBVL8YW1ibkmwNVgMMSaKSTWaGHM7mqgBIUINKKaVj0DrDgQDUaqWtPvDhsSYiCmrDR9iqaV0G9rt7nS+7j2PP947O7P1g93uEIrZk9zMzL0z7/l6znPO+w4wJ3MyJ3MyJ7MQme0CJAQgBAII+K6ORhxDhxi5swMTDUUuGorceZmBR//yg74TR44GH17z8YlrLtpYaWWGIiLMksPzCUICAPFTtxVUKk8gsCsbiamKTKgLX8hL7vFvnX7gIdkoacxYi1K0rb+IvuFCd+qOTbt/HsfQYhHWKQd05pgnALAndYsaVr8xYbIYSBdSk4vgGp+yfHXH93o+P/zD33zlvUUp2jcfuukz8wfkjkZav+XtyICea9Lmhb0TAh1FamRqZg2zRqWRlk+dabgufrSSvPn40O9/1ltJyj+qjDWq8wuLvwQA2BafBzVACEHET2/6o+bSK5JaagAcAFAAGi2XCzWZ0N9W0vF1rIQ77t7yxBf3xYPB2uJw2qac70AGgHj/oBMR5un2dOUDIUGKNx4ARESTRkrma+ssEfQFhZ0A8InicJJ9jQKQUeSGotmxU3BOv9q/1oaiJe6B9avuvOLZg5/Lh3KJNcygoq0kkeqEEDn8nS27Dvw9jrsqr7/eF46NBd19fbWB++8/ISIpADCOFcUizyUjMnP0QJqKTqz/7FUHV6Q/3n9d11VlNeaqVGW2KMk0p1J4tXr81l83/pwyuQxEnwnDQFxVwaMM8wdq3YUHL3ls6A9nr/22ONC07Zl77sl9aN/eu/O12pdztRSHLnQ88JH5cmxZiCQUUAg1oJoTrH5uHJufraMcEmb01okgFEE+cKgaUesq/LS89pNfW3H77fWZ1obMxPhSFOml11+v/U8/+dQAceNorWZ0gnyNmqrg+ECAN/odKvMclEDXeIKLX2uwZ8IsdSJKCFuaaSImqWl/oUuPAXtGP71h/St791pUKtl0nZh2Aa2OIrexVEq/DX5/ALhltF6vi2rgIGIqoBP0jKVYdjTBxYcbWHakjveMpggTCJ2oEiKAUCAQ/14BhYiUk6S+NAg+kL70Yv5jT/7qd6ujyJVGRtixDDCOVYpFe3nz5pWF0WMHxVJNAVWDQP2cwGbpTq4qED/sQdmyhQII/UXNXv1tQxiwOtC/5tKdjx5q6uwMje7frwAQnnxzS69zYQJQCKF4IxWAL16BiEAhUAocWwr8tCpTQkcAJp53UwF7RQM3eurWdp2dcWB4OCUpkibrapZSAKUfn70BaNkm1nSEsMxBybLRlhxQxDueraMmWkuNaukNcUzFcKvhzcqBGFAB+NdNmwZAW143HzNVr1jMY8CyOUkmcSkePyKgthxtZYGgSLNzgwqpMxUk6fKbXtq0VADG07DvLb+wLfazS6FaHQiI7oQeK2wroDTjFsmMZbMamF1ZlP1LlhORSUqSrDpSAk6lu5CmA+26Z+VAaWREACAXoDtUAUn6kjPQ2IrsWYwgbPvcXsTkv1OHeKeMxlAEOcfudt0dGSWIILWzlLJJ1WwLxaSBMmmoABAS5nnJNwG2GgyMGbL8mjRNOjbMRatWEQDKwMm6mamotHYF0irKJlrQolVCvAZpIqltWJC2lElGpQKpG20CONmue3YsVCwSAE4uWfJPqp4IPe1l9EnfmUQzu7wXHttZJdBHmxlMwOao5wte6XedEEEgAoic0MWLj7brnpUDWfD06u3bTwv0hbxTgrRmU4J4eNBaYZ0S4CZWso7V1hUAaxW4kJZXR6r+beX27aeZsV9n+sDgoAKA5cI9gTjfS6XFNpaNeQLf4SDMnGuxj2/Bk15lzwSmzcfC0KlYmHumXWdHHNg2PGwAUOtatGvM7IzLMt/sriICFZkcKDxLcWqRN7PBduL09wgwEOpYYmeSnt7H2nV2xIEiYIwit+KXD75WC/P3LQhDBS1pYhlkCynNHiAthvEPOQUQbHOGYLIgzGkjDO97/yOPHGYUuSKmd3Ixo3EacSzPT0wU+g+NPHeBpWtOJWlDgbAJCZlK+WDrxG5qQwNBmySkxgUuCMfVjZxeuubqyy6cV57J7mzae+LmgpffdVe5vLB/Q8UFry4Mg5BAQhGbREobPQr85sbb3uoLWT2YAUlvEITVwP2jcsGCDR/ceef4TDc0M9rUS7FojGNd+fDDL7+xaMm1ZQ329uVyQUFEzYwkEpIpySZwCPo9P0Hzz5AYyIJzujCXD8643L7jCxZfu3zXrhenO0LP+lhlUpEIjmzY8IVco/pVtfTygihSMyQ0JE1+z4LvAISqcKKokDB1z1vXvJ8MlEo7IMJzMX5WZ6NxHOt3i0UjgJjU226++RqplK9jklxJS94nwEIQXd4BrabkKeeCVyQM/lTPde39+u7dB0rZqUQcx1o8B+M7c7weRU5KpamzuypGt27tqY+N5cuNhqC7u7by3nvHIcK3/O07IQRkKIocBweDof+xzyagHBwMhqLIsQPB60gG/tu6/M+K3t1/gMzJnMzJnPz/yb8Ap93OIeaQveoAAAAASUVORK5CYII=',
+)
+
+TRAY_ICON_SIZE = (64, 64)
+TRAY_ICON_RGBA = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\xaaU\x03\xaa\xaaU\x03U\xaaU\x03U\xaaU\x03\xaa\xaaU\x03\x7f\xbf?\x04\x7f\xff\x7f\x02\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x7f\x7f\x02\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x01U\xaaU\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x01\x00\x00\x00\x00'
+    b'\x8a\xb6gQ\x89\xbec\x9a\x81\xb5]\xab\x81\xb4]\xab\x85\xb9a\x97\x8b\xbcgl\x8d\xbdq/\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\x7f\x02\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\xff\xff\x00\x01\x00\x00\x00\x00\x88\xaei)\xbf\xbf\x7f\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\xff\xff\xff\x01\x00\x00\x00\x00\x90\xb1n\x17~\xb2Y\xf9\x84\xc0\\\xff\x80\xbbZ\xff\x81\xbcZ\xff\x82\xbd[\xff\x83\xbe]\xff|\xb3X\xfe\x84\xbaa\xbe'
+    b'\x8b\xb9o>\x00\x00\x00\x00U\xaaU\x03UUU\x03\x00\x00\x00\x00v\xa2Vvz\xafV\xfbw\xa4V\x93\x00\x00\x00\x00U\xaaU\x03\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x7f\x7f\x02\x00\x00\x00\x00\x8f\xb7o |\xb0W\xf5{\xb1U\xfbz\xb0U\xfb{\xb1U\xfc'
+    b'z\xb1T\xfbz\xb0S\xfcy\xb1U\xff\x81\xb9Z\xff\x81\xb8[\xfe\x85\xb2dk\x00\x00\x00\x00\x7f\x7f\x00\x02z\xa3_8r\xa3N\xfcv\xacP\xffv\xa2V\xa2'
+    b'\x00\x00\x00\x00U\xaaU\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\x00\x01\x00\x00\x00\x00\x9d\xb6\x85\x15'
+    b'~\xb2Z\xee}\xb3V\xff{\xb0U\xfe|\xb1U\xff|\xb1U\xff|\xb1U\xff{\xb1U\xff{\xb0S\xfc{\xb1T\xfd\x86\xbc^\xff\x87\xb4fU\x00\x00\x00\x00'
+    b'q\x9eR\xc3t\xa7N\xfft\xa3Q\xe1\x91\xaay\x15\x00\x00\x00\x01\x7f\x7f\x7f\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\xaa\xff\x03~\xb4]\xd3\x7f\xb7W\xff{\xb0T\xfd|\xb1U\xff|\xb1U\xff|\xb1U\xff{\xb1U\xff{\xb1U\xff'
+    b'{\xb0U\xfd\x7f\xb6V\xfe\x80\xb4]\xde\x85\xabiRo\xa0K\xfet\xa7Q\xffw\xa2\\`\x00\x00\x00\x00\xaa\xaaU\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\xaaU\x03\x00\x00\x00\x00\x82\xb4_\xa0\x84\xbc[\xfe{\xb0T\xfb|\xb2V\xff'
+    b'|\xb2V\xff|\xb1U\xff|\xb1U\xff{\xb2U\xff|\xb2U\xff{\xb0U\xff~\xb3X\xffv\xa6T\xefn\xa2K\xfft\xa4R\xde\x9f\xbf\x9f\x08\x7f\x7f\x00\x02'
+    b'\xff\xff\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\xaaU\x03\x00\x00\x00\x00'
+    b'\x8c\xb7kG\x83\xba[\xffz\xb0S\xfd|\xb2U\xff{\xb2U\xff{\xb2U\xff{\xb2U\xff{\xb2U\xff{\xb2U\xff{\xb1V\xff|\xb2V\xffw\xadQ\xfe'
+    b't\xa8P\xffx\x9fV\x90\xffUU\x03\xb6mH\x07\xff\x00\x00\x02\xff\x00\x00\x02\xff\x00\x00\x02\xffUU\x03\xff??\x04\xffUU\x03\xff\x00\x00\x01\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\xaaU\x03\xb6mm\x07}\xb3[\xc5\x81\xbaZ\xff{\xb0S\xfc{\xb2U\xff{\xb2U\xff{\xb2U\xff{\xb2U\xff'
+    b'{\xb1U\xff|\xb1U\xff|\xb1U\xffz\xb1S\xfcw\xaaQ\xffh\xad\\B\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xffUU\x03\xff\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x7f\x7f\x02\x00\x00\x00\x00\x00\x00\x00\x00\xa2\xa2lB\x81\xb4Z\xfaw\xb4U\xfd'
+    b'~\xafU\xff|\xb1U\xff|\xb1U\xff{\xb1U\xff{\xb1U\xff{\xb1U\xff|\xb1U\xff{\xb1U\xfft\xa4O\xfa\xbbz\\^\xe6MMi\xe5NL\x96'
+    b'\xe3ML\xb1\xdfJH\xbd\xe1JI\xbc\xe4NN\xad\xe4NN\x89\xe3SSR\xc6\x7f\x7f\x12\x00\x00\x00\x00\x00\x00\x00\x00\xff\x7f\x7f\x02\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xffUU\x03\x00\x00\x00\x00\xc8m\x7f\x0e'
+    b'\xe4RN\x85\xeeEH\xdf\xc9bG\xfc\x80\xafV\xfft\xb9W\xffz\xb2U\xff|\xafU\xff~\xafU\xff~\xafU\xff}\xafT\xff~\xafU\xff|\xb2V\xff'
+    b'x\x99L\xfe\xe0NE\xff\xf7JH\xff\xf5HF\xff\xf3HE\xff\xf0IE\xff\xf1IF\xff\xf2IG\xff\xf4IG\xff\xf0IG\xff\xe7OK\xe5\xe6PP\x85'
+    b'\xcfoo\x10\x00\x00\x00\x00\xffUU\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\xaaUU\x03\x00\x00\x00\x00\xd9\\\\7\xe9OM\xd7\xf6IF\xff\xeaFB\xff\xebBA\xff\xd8TE\xff\x9e\x89N\xff~\xadU\xffv\xb8W\xfft\xb9V\xff'
+    b'u\xb8V\xfft\xb8V\xffu\xb7V\xffq\xbcW\xff\x82\x97L\xff\xe0DA\xfe\xe4EB\xfb\xe5EB\xfb\xe5DA\xfc\xe5DA\xfc\xe4DA\xfc\xe4DA\xfc'
+    b'\xe5FC\xfb\xe4FC\xfc\xe9GC\xff\xf5JG\xff\xebNM\xd9\xd6b]9\x00\x00\x00\x00\xaaUU\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaaUU\x03\x00\x00\x00\x00\xd8\\XB\xeaJG\xf5\xeeGD\xff\xe4EB\xfa\xe4EB\xfe\xe4GB\xff\xe7BB\xff'
+    b'\xea?A\xff\xdaRE\xff\xbflI\xff\xaa~L\xff\xa2\x88O\xff\xa1\x8bO\xff\xa7\x84N\xff\xb0uI\xff\xd2UD\xff\xe9CB\xff\xe5EB\xff\xe5EB\xff'
+    b'\xe7DB\xff\xe6DB\xff\xe6DB\xff\xe7DB\xff\xe6EB\xff\xe4FD\xff\xe3EC\xfe\xe5DB\xfa\xeeGD\xff\xe9KI\xf5\xd8XXB\x00\x00\x00\x00'
+    b'\xaaUU\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x7f\x7f\x02\xff\x00\x00\x01\xd5jj\x1f\xe7KI\xeb\xecFB\xff\xe3FB\xfb'
+    b'\xe5FC\xff\xe6FC\xff\xe6EB\xff\xe6EB\xff\xe4GC\xff\xe7BA\xff\xea>A\xff\xec>A\xff\xeb?A\xff\xeb?A\xff\xeb?A\xff\xec>A\xff'
+    b'\xeaAB\xff\xe6DB\xff\xe6DB\xff\xe6DB\xff\xe7DB\xff\xe6DB\xff\xe4EB\xff\xe6DB\xff\xe6EB\xff\xe5FB\xff\xe5EC\xff\xe5EB\xff'
+    b'\xe4EB\xfb\xebFC\xff\xe7KJ\xec\xdejj\x1f\xff\x00\x00\x01\xff\x7f\x7f\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x7f\x7f\x02\x00\x00\x01\x00'
+    b'\xdfJI\xb2\xf4JG\xff\xe4FC\xfb\xe5FC\xff\xe6EB\xff\xe6EC\xff\xe7EC\xff\xe6EC\xff\xe5FC\xff\xe3GB\xff\xe3FB\xff\xe5FB\xff'
+    b'\xe4FB\xff\xe3GB\xff\xe3GB\xff\xe3GB\xff\xe3FB\xff\xe5EB\xff\xe7DB\xff\xe6DB\xff\xe6DB\xff\xe5EB\xff\xe5FB\xff\xe5EB\xff'
+    b'\xe6DB\xff\xe5FB\xff\xe6EB\xff\xe4EB\xff\xe6DB\xff\xe4EB\xfb\xf3JF\xff\xdfMK\xb4\x00\x01\x01\x00\xff\x7f\x7f\x02\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\xffUU\x03\x00\x00\x00\x00\xd9^Z>\xebJG\xff\xe4EA\xfc\xe4FB\xff\xe5EB\xff\xe6DB\xff\xe6EB\xff\xe6GC\xff\xe5FC\xff'
+    b'\xe4FD\xff\xe4FB\xff\xe6EB\xff\xe4EB\xff\xe4FB\xff\xe6FB\xff\xe5EB\xff\xe7FB\xff\xe5FB\xff\xe4EC\xff\xe5EB\xff\xe5EB\xff'
+    b'\xe5EB\xff\xe4FB\xff\xe4FB\xff\xe5EB\xff\xe6DB\xff\xe5EB\xff\xe5FB\xff\xe6DB\xff\xe5EB\xff\xe5EC\xff\xe3DA\xfc\xedKH\xff'
+    b'\xdeaa?\x00\x00\x00\x00\xffUU\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xffUU\x03\x00\x00\x00\x00\xe0LK\xa6\xf3JG\xfe\xe4FC\xfb\xe4FB\xff\xe6EB\xff'
+    b'\xe5EB\xff\xe7FC\xff\xe8FC\xff\xe7FC\xff\xe6EC\xff\xe5FC\xff\xe5GC\xff\xe4GC\xff\xe5GC\xff\xe5GC\xff\xe6GC\xff\xe7FC\xff'
+    b'\xe5GC\xff\xe5FB\xff\xe5EB\xff\xe5FC\xff\xe5FC\xff\xe4FB\xff\xe4FC\xff\xe5EB\xff\xe6EB\xff\xe4FB\xff\xe4FB\xff\xe5FB\xff'
+    b'\xe5FB\xff\xe4FB\xff\xe3FC\xfb\xf3JG\xfe\xe0MM\xa8\x00\x00\x00\x00\xaaUU\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x01\x00\x00\x00\x00\xcfoo\x10\xe2FE\xea'
+    b'\xeaGC\xff\xe4GC\xfe\xe4FB\xff\xe4EB\xff\xe5EB\xff\xe5GC\xff\xe5GC\xff\xe7FC\xff\xe8EC\xff\xe6EC\xff\xe5FC\xff\xe4FC\xff'
+    b'\xe5GC\xff\xe5FD\xff\xe5GC\xff\xe6GD\xff\xe5FC\xff\xe6EB\xff\xe7EC\xff\xe7EC\xff\xe5ED\xff\xe5FC\xff\xe5FC\xff\xe5EB\xff'
+    b'\xe5EB\xff\xe5FB\xff\xe5FB\xff\xe5FC\xff\xe5GC\xff\xe5FC\xff\xe4FD\xfe\xe9FD\xff\xe2JG\xea\xcf\x7fo\x10\x00\x00\x00\x00\xff\x00\x00\x01'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\xaaUU\x03\x00\x00\x00\x00\xda]Y?\xebKH\xff\xe3EB\xfe\xe4FB\xff\xe5FC\xff\xe5FD\xff\xe5FC\xff\xe6FC\xff\xe5FB\xff\xe7EC\xff'
+    b'\xe6GD\xff\xe4FC\xff\xe5FC\xff\xe6EB\xff\xe7GC\xff\xe7GD\xff\xe5GC\xff\xe6GC\xff\xe7FC\xff\xe6FD\xff\xe5FC\xff\xe6EB\xff'
+    b'\xe5FC\xff\xe5FC\xff\xe5FB\xff\xe5FB\xff\xe6FC\xff\xe5FC\xff\xe6FC\xff\xe6FD\xff\xe5FC\xff\xe6DC\xff\xe5ED\xff\xe4EB\xfe'
+    b'\xebKH\xff\xdaYY?\x00\x00\x00\x00\xaaUU\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff??\x04\x00\x00\x00\x00\xddMMl\xf4KG\xff\xe5GC\xfb\xe4EB\xff\xe5GC\xff\xe6HD\xff'
+    b'\xe4GC\xff\xe5FC\xff\xe7EB\xff\xe6FC\xff\xe5FD\xff\xe4FB\xff\xe4EC\xff\xe5EC\xff\xe6GD\xff\xe6HD\xff\xe5GC\xff\xe5FC\xff'
+    b'\xe5GD\xff\xe6GC\xff\xe5GC\xff\xe5FC\xff\xe5FC\xff\xe5GC\xff\xe5GC\xff\xe5FC\xff\xe6FB\xff\xe5FB\xff\xe5GC\xff\xe5FC\xff'
+    b'\xe4EB\xff\xe4FB\xff\xe5GC\xff\xe5FC\xfb\xf3JH\xff\xe0NNk\x00\x00\x00\x00\xff??\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff??\x04\x00\x00\x00\x00\xe1NL\x89\xf5IG\xff'
+    b'\xe4FC\xfb\xe5GC\xff\xe5GC\xff\xe5HD\xff\xe5GC\xff\xe7FC\xff\xe5FB\xff\xe4FB\xff\xe4FC\xff\xe5FC\xff\xe5FB\xff\xe5FC\xff'
+    b'\xe6GC\xff\xe6HD\xff\xe5FC\xff\xe5EB\xff\xe6FC\xff\xe5GC\xff\xe5GC\xff\xe5GC\xff\xe5GC\xff\xe5GC\xff\xe6GD\xff\xe5FC\xff'
+    b'\xe5GC\xff\xe6FC\xff\xe5GC\xff\xe5GC\xff\xe4FB\xff\xe4FB\xff\xe5GC\xff\xe4FD\xfb\xf4KH\xff\xe1QN\x89\x00\x00\x00\x00\xff??\x04'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\xffUU\x03\x00\x00\x00\x00\xe6PN\x9c\xf4IF\xff\xe3FB\xfb\xe5GC\xff\xe4FB\xff\xe5EC\xff\xe5ED\xff\xe5FB\xff\xe4FB\xff\xe4FB\xff'
+    b'\xe5FC\xff\xe5FC\xff\xe5GC\xff\xe5GC\xff\xe5FC\xff\xe5GC\xff\xe6FB\xff\xe6EB\xff\xe6FC\xff\xe5FC\xff\xe5FC\xff\xe5GC\xff'
+    b'\xe5GC\xff\xe5GD\xff\xe6GD\xff\xe6GD\xff\xe6HD\xff\xe7GD\xff\xe5FC\xff\xe5GD\xff\xe5FC\xff\xe4FB\xff\xe5GC\xff\xe4FB\xfb'
+    b'\xf4KG\xff\xe4SP\x9b\x00\x00\x00\x00\xffUU\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xffUU\x03\x00\x00\x00\x00\xe5NK\x9f\xf3IF\xff\xe4FB\xfb\xe4FC\xff\xe5FC\xff\xe5EB\xff'
+    b'\xe5EB\xff\xe4FB\xff\xe4FB\xff\xe4EB\xff\xe5FC\xff\xe6FC\xff\xe6FC\xff\xe6FC\xff\xe6GD\xff\xe7FC\xff\xe6FC\xff\xe6EB\xff'
+    b'\xe6EC\xff\xe5FC\xff\xe5FB\xff\xe6FB\xff\xe5GC\xff\xe5FC\xff\xe5FB\xff\xe5GC\xff\xe5GC\xff\xe5FB\xff\xe6FC\xff\xe5GC\xff'
+    b'\xe5FC\xff\xe4EC\xff\xe5EC\xff\xe4FB\xfb\xf3KF\xff\xe6SP\x9f\x00\x00\x00\x00\xffUU\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xffUU\x03\x00\x00\x00\x00\xe2QO\x9a\xf3JF\xff'
+    b'\xe4FB\xfb\xe4FB\xff\xe5FC\xff\xe5FC\xff\xe4FC\xff\xe4EB\xff\xe5EB\xff\xe4EB\xff\xe5FC\xff\xe6GD\xff\xe5FC\xff\xe5FB\xff'
+    b'\xe5GC\xff\xe6FC\xff\xe6FC\xff\xe6FC\xff\xe7FD\xff\xe6FC\xff\xe7FC\xff\xe7EB\xff\xe5FC\xff\xe5FB\xff\xe5FC\xff\xe5FC\xff'
+    b'\xe5FC\xff\xe4FC\xff\xe5GC\xff\xe5FC\xff\xe6DB\xff\xe6DB\xff\xe5EB\xff\xe4FC\xfb\xf4KG\xff\xe4RP\x98\x00\x00\x00\x00\xbf??\x04'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\xff??\x04\x00\x00\x00\x00\xe2OM\x84\xf4KG\xff\xe4FC\xfb\xe5FB\xff\xe5GC\xff\xe5FC\xff\xe4ED\xff\xe4FB\xff\xe5FB\xff\xe4FB\xff'
+    b'\xe4FD\xff\xe5FC\xff\xe5GC\xff\xe5GC\xff\xe5GC\xff\xe5GD\xff\xe6FD\xff\xe5FC\xff\xe6HD\xff\xe5GC\xff\xe6FC\xff\xe7EC\xff'
+    b'\xe5FB\xff\xe5GB\xff\xe5GC\xff\xe5FC\xff\xe5FC\xff\xe5GC\xff\xe5GC\xff\xe4FC\xff\xe5FB\xff\xe5EB\xff\xe4FB\xff\xe4FC\xfb'
+    b'\xf5KH\xff\xe1PN\x82\x00\x00\x00\x00\xff??\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbf??\x04\x00\x00\x00\x00\xe2ROc\xf3LH\xff\xe4EB\xfc\xe5GC\xff\xe5GC\xff\xe4FC\xff'
+    b'\xe5EB\xff\xe5EB\xff\xe4EC\xff\xe5GC\xff\xe5GD\xff\xe5GC\xff\xe4FB\xff\xe5EB\xff\xe6FB\xff\xe5GD\xff\xe5FD\xff\xe5FC\xff'
+    b'\xe6HD\xff\xe5FC\xff\xe5FB\xff\xe5FC\xff\xe5GB\xff\xe5GC\xff\xe5FC\xff\xe5FB\xff\xe5GB\xff\xe5GC\xff\xe6GC\xff\xe6EB\xff'
+    b'\xe5EC\xff\xe5FD\xff\xe5GC\xff\xe4EB\xfb\xf3KH\xff\xe2URc\x00\x00\x00\x00\xbf??\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaaUU\x03\x00\x00\x00\x00\xdf[[8\xe9IF\xff'
+    b'\xe4FB\xfe\xe5FC\xff\xe5FC\xff\xe5FC\xff\xe6FC\xff\xe7FC\xff\xe6FD\xff\xe5GC\xff\xe5FC\xff\xe5GB\xff\xe4FC\xff\xe5EB\xff'
+    b'\xe6FC\xff\xe6FD\xff\xe6FC\xff\xe5FC\xff\xe5GD\xff\xe5EC\xff\xe5GC\xff\xe5GC\xff\xe5FC\xff\xe5FC\xff\xe5EC\xff\xe5FB\xff'
+    b'\xe4FC\xff\xe5GB\xff\xe7FC\xff\xe7EB\xff\xe4EC\xff\xe4FC\xff\xe5FC\xff\xe4EB\xfe\xe9JG\xff\xe0\\\\:\x00\x00\x00\x00\xaaUU\x03'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\xff\x00\x00\x01\x00\x00\x00\x00\xdamm\x0e\xe2IF\xe8\xeaGC\xff\xe3FB\xfe\xe5FC\xff\xe5FC\xff\xe5FB\xff\xe5FB\xff\xe6FC\xff\xe5FB\xff'
+    b'\xe4EB\xff\xe4FC\xff\xe5FC\xff\xe5EC\xff\xe5FD\xff\xe5GC\xff\xe6FC\xff\xe6GD\xff\xe5FB\xff\xe5EC\xff\xe5GC\xff\xe4FB\xff'
+    b'\xe5FC\xff\xe5FC\xff\xe5FC\xff\xe5FC\xff\xe5FC\xff\xe5FB\xff\xe7EB\xff\xe6EC\xff\xe5FC\xff\xe5FC\xff\xe4EC\xfe\xeaGC\xff'
+    b'\xe2JG\xea\xcfoo\x10\x00\x00\x00\x00\xff\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\x00\x00\x03\x00\x00\x00\x00\xe2OL\xab\xf3JF\xfe\xe5FC\xfb\xe5GC\xff\xe5FC\xff'
+    b'\xe4EB\xff\xe4FB\xff\xe5FB\xff\xe4FB\xff\xe4FB\xff\xe5FC\xff\xe5FB\xff\xe4FB\xff\xe4GB\xff\xe5GC\xff\xe6GD\xff\xe6GD\xff'
+    b'\xe5GC\xff\xe5GC\xff\xe5GC\xff\xe4FC\xff\xe5FC\xff\xe5GC\xff\xe4FC\xff\xe5FB\xff\xe5FC\xff\xe5FC\xff\xe6FC\xff\xe5GC\xff'
+    b'\xe5FC\xff\xe5FC\xff\xe4FC\xfb\xf2KF\xfe\xe4PM\xac\x00\x00\x00\x00\xaaUU\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xffUU\x03\x00\x00\x00\x00\xddVVM'
+    b'\xf0KH\xff\xe4EB\xfc\xe5GC\xff\xe5GC\xff\xe4FB\xff\xe5GC\xff\xe5GC\xff\xe4GC\xff\xe5GC\xff\xe5GC\xff\xe5FB\xff\xe4FB\xff'
+    b'\xe5GC\xff\xe6FC\xff\xe5FC\xff\xe5GC\xff\xe5GC\xff\xe5GC\xff\xe5FC\xff\xe5FB\xff\xe5GC\xff\xe5GC\xff\xe5GC\xff\xe5FC\xff'
+    b'\xe5GC\xff\xe5HD\xff\xe5GC\xff\xe5FB\xff\xe5FC\xff\xe4GC\xff\xe4FB\xfc\xf0LH\xff\xdfVVP\x00\x00\x00\x00\xffUU\x03\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x01\xcc\x99\x99\x05\xe0LI\xd3\xeeIE\xfe\xe4EB\xfc\xe4FC\xff\xe5FC\xff\xe4FB\xff\xe4GB\xff\xe5FC\xff'
+    b'\xe6FC\xff\xe5FB\xff\xe5FB\xff\xe4FB\xff\xe4FB\xff\xe5EB\xff\xe6EB\xff\xe5GC\xff\xe5FC\xff\xe5DB\xff\xe5FC\xff\xe5FB\xff'
+    b'\xe4EB\xff\xe5EB\xff\xe5FC\xff\xe4FC\xff\xe5GC\xff\xe5GC\xff\xe5FC\xff\xe5FC\xff\xe5FC\xff\xe4FB\xfc\xeeHE\xfe\xe0JH\xd3'
+    b'\xaa\x7f\x7f\x06\xff\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaaUU\x03\x00\x00\x00\x00\xdeXXN\xf0KH\xff\xe5FB\xfb\xe5FC\xff'
+    b'\xe5FB\xff\xe4FB\xff\xe4FB\xff\xe4EB\xff\xe5FC\xff\xe5FB\xff\xe5FB\xff\xe5FB\xff\xe4FB\xff\xe4FB\xff\xe5FC\xff\xe5FC\xff'
+    b'\xe5EB\xff\xe5EB\xff\xe4FB\xff\xe5FB\xff\xe5FB\xff\xe5FC\xff\xe5FC\xff\xe5FB\xff\xe4FB\xff\xe4FB\xff\xe5EC\xff\xe5FC\xff'
+    b'\xe4GC\xff\xe5FB\xfb\xf2LI\xff\xdeWSO\x00\x00\x00\x00\xffUU\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaaUU\x03'
+    b'\x00\x00\x00\x00\xdePN\x9f\xf8LH\xff\xe3FB\xfa\xe5FC\xff\xe5FC\xff\xe5FC\xff\xe5FB\xff\xe5FC\xff\xe6FC\xff\xe5FC\xff\xe5FC\xff'
+    b'\xe5FB\xff\xe5GC\xff\xe4FB\xff\xe4FB\xff\xe5FB\xff\xe5FC\xff\xe5GC\xff\xe5FB\xff\xe5FC\xff\xe5FC\xff\xe5FC\xff\xe5GB\xff'
+    b'\xe4EB\xff\xe4EB\xff\xe5FB\xff\xe5FC\xff\xe3EB\xfa\xf8KH\xff\xe1PN\xa2\x00\x00\x00\x00\xaaUU\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x01\xff\x00\x00\x02\xd0\x8b\x8b\x0b\xe5NL\xc5\xf6LH\xff\xe4GC\xfa\xe5GD\xff\xe5GC\xff\xe5GC\xff'
+    b'\xe5GC\xff\xe6GD\xff\xe5FC\xff\xe5FC\xff\xe5GC\xff\xe5GC\xff\xe5FC\xff\xe4FC\xff\xe4FB\xff\xe5GC\xff\xe5GC\xff\xe5GC\xff'
+    b'\xe5GC\xff\xe5GC\xff\xe5GC\xff\xe5FB\xff\xe5FB\xff\xe5GB\xff\xe4GC\xff\xe3FB\xfa\xf6KG\xff\xe5OL\xc7\xd4\x7f\x7f\x0c\xff\x00\x00\x02'
+    b'\xff\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x00\x00\x02\x00\x00\x00\x00\xd4qq\x12\xe8QM\xbf'
+    b'\xf8LI\xff\xe5FC\xfd\xe4FB\xfc\xe4HC\xff\xe5GB\xff\xe5GC\xff\xe5GC\xff\xe5GC\xff\xe4GB\xff\xe5GC\xff\xe5FC\xff\xe5FC\xff'
+    b'\xe5GB\xff\xe4FB\xff\xe5FB\xff\xe5GC\xff\xe5GC\xff\xe5GC\xff\xe5FC\xff\xe5FC\xff\xe5GC\xff\xe4FB\xfc\xe4FB\xfd\xf7LH\xff'
+    b'\xe8ON\xc0\xceym\x15\x00\x00\x00\x00\xff\x7f\x7f\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\xff\x7f\x7f\x02\x00\x00\x00\x00\xb6\x91\x91\x07\xe6PP\x92\xedKH\xff\xf1IE\xff\xe4EA\xfe\xe4FB\xfb\xe3EB\xfd\xe4FC\xfe\xe5GC\xff'
+    b'\xe5FB\xff\xe5FC\xff\xe5GC\xff\xe4GC\xff\xe5GC\xff\xe5FC\xff\xe5FB\xff\xe5GB\xff\xe5GC\xff\xe5GD\xfe\xe4FC\xfd\xe4FC\xfb'
+    b'\xe3FB\xfe\xf1IE\xff\xeeKI\xff\xe7SQ\x96\x9f\x7f\x9f\x08\x00\x00\x00\x00\xff\x7f\x7f\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x7f\x7f\x02\x00\x00\x00\x00\x00\x00\x00\x00\xdfZZA\xe9NK\xba\xebJH\xff'
+    b'\xf4JG\xff\xedGD\xff\xe6FC\xff\xe4EA\xfc\xe5FB\xfb\xe4GB\xfb\xe4EB\xfc\xe4FC\xfc\xe5FC\xfc\xe4FB\xfc\xe4GC\xfb\xe4FB\xfb'
+    b'\xe4EA\xfc\xe6FB\xff\xedHD\xff\xf4KG\xff\xebJG\xff\xeaPO\xbe\xe0__C\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x7f\x7f\x02\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x01'
+    b'\xffUU\x03\x00\x00\x00\x00\x00\x00\x00\x00\xe5]]<\xe4PN\x92\xe5MK\xd5\xe6IE\xfa\xf1KH\xff\xf5LH\xff\xf4KG\xff\xf4JG\xff\xf3JG\xff'
+    b'\xf3JG\xff\xf3KG\xff\xf4KG\xff\xf5KG\xff\xf1KI\xff\xe5HF\xfc\xe5LK\xd6\xe6RR\x92\xe1[[=\x00\x01\x01\x00\x00\x00\x00\x00\xff\x7f\x00\x02'
+    b'\xff\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaaUU\x03\xff\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\xaa\xff\xff\x03\xdf_Y(\xe5XXQ'
+    b'\xe2OMv\xe4PN\x92\xe7OM\xa4\xe3ML\xae\xe3ML\xae\xe6PN\xa5\xe3PO\x94\xe1PMy\xe6YYS\xe0aa*\xbf\xbf\xff\x04\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\xff\x00\x00\x01\xaaUU\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaaUU\x03'
+    b'\xffUU\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xffUU\x03\xaaUU\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x01\xff\x7f\x7f\x02\xffUU\x03\xff??\x04\xbf??\x04\xffUU\x03\xffUU\x03'
+    b'\xffUU\x03\xffUU\x03\xbf??\x04\xff??\x04\xffUU\x03\xff\x7f\x7f\x02\xff\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+)
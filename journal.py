@@ -0,0 +1,76 @@
+import json
+import os
+
+COMPACT_EVERY = 256  # Records appended before the file is rewritten
+
+
+class Journal:
+    """
+    Crash-safe, append-only journal of timer state snapshots (JSON lines).
+    Each record is a single os.write() on an O_APPEND descriptor: once it
+    returns, the data is in the OS and survives the process dying
+    (os._exit, crashes, kill), at the cost of a few microseconds. There is
+    no fsync, so a power loss may drop the newest records.
+    Only the last intact line matters on load, so every `compact_every`
+    records the file is atomically replaced by just that line.
+    """
+
+    def __init__(self, path="focus.journal", compact_every=COMPACT_EVERY):
+        self.path = path
+        self.compact_every = compact_every
+        self._fd = None
+        self._records = 0
+        self._last = None
+        self._torn = False  # File ends in a partial line
+
+    def load(self):
+        """Latest intact snapshot, or None."""
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        self._torn = bool(data) and not data.endswith(b"\n")
+        lines = data.splitlines()
+        # Records left by earlier runs count towards the next compaction
+        self._records = len(lines)
+        for line in reversed(lines):
+            try:
+                state = json.loads(line)
+            except ValueError:
+                continue  # Torn last write
+            self._last = line + b"\n"
+            return state
+        return None
+
+    def record(self, snapshot):
+        line = json.dumps(snapshot, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+        if self._fd is None:
+            self._open()
+        # Start on a fresh line after a torn write, or this record is lost too
+        os.write(self._fd, b"\n" + line if self._torn else line)
+        self._torn = False
+        self._last = line
+        self._records += 1
+        if self._records >= self.compact_every:
+            self.compact()
+
+    def compact(self):
+        if self._last is None:
+            return
+        self.close()  # Windows can't replace a file that is still open
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(self._last)
+        os.replace(tmp, self.path)
+        self._open()
+        self._records = 1
+
+    def _open(self):
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        self._fd = os.open(self.path, flags, 0o644)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
@@ -0,0 +1,317 @@
+import os
+import sys
+
+LOG_NAME = "focus_log"
+LOG_HEADER = ["Timestamp", "TimeRemaining", "TimeElapsed"]
+MAX_BYTES = 1 << 20     # Rotate the active log past this size, or when the month changes
+COMPRESS_LEVEL = 6
+CHUNK_SIZE = 1 << 20
+STAMP_LEN = 19          # "YYYY-MM-DD HH:MM:SS"
+
+
+def data_dir():
+    """
+    Per-user directory for the app's data, independent of the working
+    directory: %LOCALAPPDATA%\\FocusTimer, ~/Library/Application Support/FocusTimer
+    or $XDG_DATA_HOME/focustimer. FOCUS_DATA_DIR overrides it.
+    """
+    if os.environ.get("FOCUS_DATA_DIR"):
+        return os.environ["FOCUS_DATA_DIR"]
+    home = os.path.expanduser("~")
+    if os.name == "nt":
+        return os.path.join(os.environ.get("LOCALAPPDATA") or os.path.join(home, "AppData", "Local"), "FocusTimer")
+    if sys.platform == "darwin":
+        return os.path.join(home, "Library", "Application Support", "FocusTimer")
+    return os.path.join(os.environ.get("XDG_DATA_HOME") or os.path.join(home, ".local", "share"), "focustimer")
+
+
+def data_path(name):
+    """
+    Path of the data file `name` in data_dir(), which is created if missing.
+    A file of that name left in the working directory by older versions is
+    moved there first; a SQLite database is checkpointed into one file
+    before it moves, and is used where it is while another process still
+    has it open.
+    """
+    directory = data_dir()
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, name)
+    if not os.path.exists(path) and os.path.isfile(name) and os.path.abspath(name) != os.path.abspath(path):
+        if not _settle_wal(name):
+            return os.path.abspath(name)
+        import shutil
+        shutil.move(name, path)
+    return path
+
+
+def _settle_wal(name):
+    """
+    Folds a SQLite write-ahead log (name-wal) back into `name`. False if the
+    log stays, i.e. the database is still open somewhere.
+    """
+    if not os.path.isfile(name + "-wal"):
+        return True
+    import sqlite3
+    try:
+        conn = sqlite3.connect(name)
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()  # The last connection to close removes -wal and -shm
+    except sqlite3.Error:
+        return False
+    return not os.path.exists(name + "-wal")
+
+
+def _stamp(line):
+    return line[:STAMP_LEN].decode() if line[4:5] == b"-" else None
+
+
+def _first_stamp(chunk):
+    pos = 0
+    while pos < len(chunk):
+        end = chunk.find(b"\n", pos)
+        end = len(chunk) if end == -1 else end
+        stamp = _stamp(chunk[pos:end])
+        if stamp:
+            return stamp
+        pos = end + 1
+    return None
+
+
+def _last_stamp(chunk):
+    end = len(chunk.rstrip(b"\r\n"))
+    while end > 0:
+        start = chunk.rfind(b"\n", 0, end) + 1
+        stamp = _stamp(chunk[start:end])
+        if stamp:
+            return stamp
+        end = start - 1
+    return None
+
+
+def _clip(chunk, start, end):
+    """Rows of `chunk` stamped within [start, end) (bytes bounds, None = open)."""
+    return b"".join(line for line in chunk.splitlines(True)
+                    if line[4:5] == b"-" and (start is None or line[:STAMP_LEN] >= start)
+                    and (end is None or line[:STAMP_LEN] < end))
+
+
+def _stream_chunks(f, chunk_size=CHUNK_SIZE):
+    """Whole-row byte chunks from an open binary file."""
+    tail = b""
+    while True:
+        block = f.read(chunk_size)
+        if not block:
+            break
+        block = tail + block
+        cut = block.rfind(b"\n") + 1
+        tail = block[cut:]
+        if cut:
+            yield block[:cut]
+    if tail:
+        yield tail + b"\n"
+
+
+class LogManager:
+    """
+    The distraction log in one directory: an active CSV that LogWriter
+    appends to, rotated by size or calendar month into gzip segments.
+    Every segment has a JSON sidecar index (time range, row count, per-day
+    counts, and the hour / elapsed-minute counters of analytics'
+    DistractionReport), so range reads open only the segments that overlap
+    the range, and segments fully inside it are answered from the index.
+
+    Timestamps and bounds are "YYYY-MM-DD[ HH:MM:SS]" strings; rows are in
+    local time and sort as text.
+    """
+
+    def __init__(self, directory=None, max_bytes=MAX_BYTES, legacy=None):
+        self.directory = directory or data_dir()
+        self.max_bytes = max_bytes
+        self.legacy = legacy  # Old working-directory log adopted as a segment on first use
+        self.path = os.path.join(self.directory, LOG_NAME + ".csv")
+        self.opened = 0       # Segments decompressed by range reads (for tests / benchmarks)
+        self._segments = None
+        self._month = None
+
+    # --- Writer side (called from LogWriter's worker thread) ---
+    def prepare(self):
+        """Creates the directory and adopts a legacy log. Called before the active log is opened."""
+        os.makedirs(self.directory, exist_ok=True)
+        if self.legacy and os.path.isfile(self.legacy) and os.path.abspath(self.legacy) != os.path.abspath(self.path):
+            self.rotate(self.legacy)
+
+    def due(self, size, row):
+        """True if the active log should be rotated before appending `row`."""
+        if size >= self.max_bytes:
+            return True
+        month = self._active_month()
+        return month is not None and str(row[0])[:7] != month
+
+    def _active_month(self):
+        if self._month is None:
+            try:
+                with open(self.path, "rb") as f:
+                    stamp = _first_stamp(f.read(4096))
+            except OSError:
+                return None
+            self._month = stamp[:7] if stamp else None
+        return self._month
+
+    def rotate(self, source=None):
+        """
+        Compresses the active log (or `source`) into a segment, writes its
+        index and removes the source. Returns the index, or None if the
+        source held no rows.
+        """
+        import gzip
+        import json
+        import shutil
+        from analytics import DistractionReport, iter_chunks
+
+        source = source or self.path
+        if source == self.path:
+            self._month = None
+        if not os.path.isfile(source):
+            return None
+        report, first, last, size = DistractionReport(), None, None, 0
+        for chunk in iter_chunks(source, chunk_size=CHUNK_SIZE):
+            report.add_chunk(chunk)
+            first = first or _first_stamp(chunk)
+            last = _last_stamp(chunk) or last
+            size += len(chunk)
+        if first is None:
+            os.remove(source)
+            return None
+
+        segments = self._load()
+        if segments and segments[-1]["first"] == first and segments[-1]["bytes"] == size:
+            os.remove(source)  # Already rotated; the process stopped before removing it
+            return segments[-1]
+        name = self._segment_name(first)
+        gz_path = os.path.join(self.directory, name + ".csv.gz")
+        with open(source, "rb") as src, gzip.open(gz_path + ".tmp", "wb", compresslevel=COMPRESS_LEVEL) as dst:
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+        os.replace(gz_path + ".tmp", gz_path)
+
+        hours, minutes = report.counts()
+        index = {"file": name + ".csv.gz", "first": first, "last": last, "rows": report.total,
+                 "bytes": size, "days": report.by_day, "hours": hours, "minutes": minutes}
+        index_path = os.path.join(self.directory, name + ".idx.json")
+        with open(index_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(index_path + ".tmp", index_path)
+        os.remove(source)
+
+        segments.append(index)
+        segments.sort(key=lambda s: (s["first"], s["file"]))
+        return index
+
+    def _segment_name(self, first):
+        base = f"{LOG_NAME}-{first[:10].replace('-', '')}-{first[11:].replace(':', '')}"
+        name, n = base, 1
+        while os.path.exists(os.path.join(self.directory, name + ".csv.gz")):
+            n += 1
+            name = f"{base}-{n}"  # Rotated twice within one second
+        return name
+
+    # --- Reader side ---
+    def _load(self):
+        if self._segments is None:
+            import json
+            segments = []
+            try:
+                names = os.listdir(self.directory)
+            except OSError:
+                names = []
+            for name in names:
+                if not (name.startswith(LOG_NAME + "-") and name.endswith(".csv.gz")):
+                    continue
+                index_path = os.path.join(self.directory, name[:-len(".csv.gz")] + ".idx.json")
+                try:
+                    with open(index_path, encoding="utf-8") as f:
+                        segments.append(json.load(f))
+                except (OSError, ValueError):
+                    segments.append(self._reindex(name))  # Index lost: rebuild it once
+            segments.sort(key=lambda s: (s["first"], s["file"]))
+            self._segments = segments
+        return self._segments
+
+    def _reindex(self, name):
+        import json
+        from analytics import DistractionReport
+        report, first, last, size = DistractionReport(), None, None, 0
+        for chunk in self._segment_chunks({"file": name}):
+            report.add_chunk(chunk)
+            first = first or _first_stamp(chunk)
+            last = _last_stamp(chunk) or last
+            size += len(chunk)
+        hours, minutes = report.counts()
+        index = {"file": name, "first": first or "", "last": last or "", "rows": report.total,
+                 "bytes": size, "days": report.by_day, "hours": hours, "minutes": minutes}
+        with open(os.path.join(self.directory, name[:-len(".csv.gz")] + ".idx.json"), "w", encoding="utf-8") as f:
+            json.dump(index, f, separators=(",", ":"))
+        return index
+
+    def segments(self, start=None, end=None):
+        """Indexes of the segments overlapping [start, end), oldest first. Reads only the sidecars."""
+        return [s for s in self._load()
+                if (start is None or s["last"] >= start) and (end is None or s["first"] < end)]
+
+    def _segment_chunks(self, index):
+        import gzip
+        self.opened += 1
+        with gzip.open(os.path.join(self.directory, index["file"]), "rb") as f:
+            yield from _stream_chunks(f)
+
+    def iter_chunks(self, start=None, end=None):
+        """Row chunks (bytes) stamped within [start, end): overlapping segments, then the active log."""
+        lo = start.encode() if start is not None else None
+        hi = end.encode() if end is not None else None
+        ranged = start is not None or end is not None
+        for index in self.segments(start, end):
+            covered = (start is None or index["first"] >= start) and (end is None or index["last"] < end)
+            for chunk in self._segment_chunks(index):
+                yield chunk if covered else _clip(chunk, lo, hi)
+        if os.path.isfile(self.path):
+            from analytics import iter_chunks
+            for chunk in iter_chunks(self.path, chunk_size=CHUNK_SIZE):
+                yield _clip(chunk, lo, hi) if ranged else chunk
+
+    def report(self, start=None, end=None):
+        """
+        DistractionReport over [start, end). Segments fully inside the range
+        are merged from their indexes without decompressing them.
+        """
+        from analytics import DistractionReport
+        report = DistractionReport()
+        lo = start.encode() if start is not None else None
+        hi = end.encode() if end is not None else None
+        for index in self.segments(start, end):
+            if (start is None or index["first"] >= start) and (end is None or index["last"] < end):
+                report.add_counts(index["hours"], index["minutes"])
+            else:
+                for chunk in self._segment_chunks(index):
+                    report.add_chunk(_clip(chunk, lo, hi))
+        if os.path.isfile(self.path):
+            report_file(self.path, start, end, report)
+        return report
+
+
+def report_file(path, start=None, end=None, report=None):
+    """Adds the rows of a plain CSV log stamped within [start, end) to `report` (a new one if None)."""
+    from analytics import DistractionReport, iter_chunks
+    report = DistractionReport() if report is None else report
+    lo = start.encode() if start is not None else None
+    hi = end.encode() if end is not None else None
+    for chunk in iter_chunks(path, chunk_size=CHUNK_SIZE):
+        report.add_chunk(_clip(chunk, lo, hi) if lo or hi else chunk)
+    return report
+
+
+def open_log(directory=None, legacy=LOG_NAME + ".csv", **kwargs):
+    """The app's LogWriter: the active log in the data directory, rotated by a LogManager."""
+    from logwriter import LogWriter
+    manager = LogManager(directory, legacy=legacy)
+    return LogWriter(manager.path, header=LOG_HEADER, rotation=manager, **kwargs)
@@ -0,0 +1,172 @@
+import collections
+import os
+import time
+
+
+class LogWriter:
+    """
+    Buffered, append-only CSV writer drained by a background thread.
+    `write()` only appends to an in-memory ring buffer, so the UI thread never
+    touches the file system. The worker keeps one long-lived file handle and
+    writes whatever is buffered in a single batch.
+
+    Flush policy:
+    - flush_interval=0    -> flush after every batch (default)
+    - flush_interval=N    -> flush at most every N seconds
+    - flush_interval=None -> only flush on flush()/close()
+    - fsync=True          -> additionally fsync after each flush
+
+    With a `rotation` (logstore.LogManager) the worker asks it before each
+    batch whether the file is due for rotation, and if so closes the file,
+    lets it compress the file into a segment and starts a new one.
+
+    threading is imported, and the worker started, with the first row, so a
+    writer created at startup costs nothing until something is logged.
+    """
+
+    def __init__(self, path, header=None, capacity=4096, flush_interval=0, fsync=False, rotation=None):
+        self.path = path
+        self.header = header
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.rotation = rotation
+        self.dropped = 0  # Rows lost to ring buffer overflow
+
+        self._buffer = collections.deque(maxlen=capacity)
+        self._cond = None   # threading.Condition, created with the worker
+        self._pending = 0   # Rows buffered or being written
+        self._closing = False
+        self._flush_requested = False
+        self._thread = None
+        self._file = None
+        self._writer = None
+        self._last_flush = time.monotonic()
+
+    def write(self, row):
+        """Queue one row. Never blocks on I/O."""
+        if self._cond is None:
+            if self._closing:
+                return False
+            self._start()
+        with self._cond:
+            if self._closing:
+                return False
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped += 1
+                self._pending -= 1
+            self._buffer.append(row)
+            self._pending += 1
+            self._cond.notify()
+        return True
+
+    def _start(self):
+        import threading
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+        self._thread.start()
+
+    def flush(self, timeout=None):
+        """Blocks until every queued row has been written and flushed."""
+        if self._cond is None:
+            return True
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify()
+            return self._cond.wait_for(lambda: self._pending == 0 and not self._flush_requested, timeout)
+
+    def close(self, timeout=5.0):
+        """Flushes and stops the worker. Safe to call more than once."""
+        if self._cond is None:
+            self._closing = True
+            return True
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+            thread = self._thread
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    # --- Worker ---
+    def _wait_timeout(self):
+        if self.flush_interval and self._file is not None:
+            return max(0.0, self._last_flush + self.flush_interval - time.monotonic())
+        return None
+
+    def _run(self):
+        dirty = False
+        while True:
+            with self._cond:
+                while not self._buffer and not self._closing and not self._flush_requested:
+                    timeout = self._wait_timeout() if dirty else None
+                    if not self._cond.wait(timeout) and dirty:
+                        break  # Interval elapsed with unflushed data
+                batch = list(self._buffer)
+                self._buffer.clear()
+                closing = self._closing
+                force = self._flush_requested or closing
+
+            if batch:
+                self._write_batch(batch)
+                dirty = True
+            if dirty and (force or self._flush_due()):
+                self._flush()
+                dirty = False
+
+            with self._cond:
+                self._pending -= len(batch)
+                if force:
+                    self._flush_requested = False
+                self._cond.notify_all()
+                if closing and not self._buffer:
+                    break
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _flush_due(self):
+        if self.flush_interval is None:
+            return False
+        return time.monotonic() - self._last_flush >= self.flush_interval
+
+    def _open(self):
+        import csv  # Worker thread only; keeps csv off the startup path
+        if self.rotation is not None:
+            self.rotation.prepare()
+        self._file = open(self.path, "a", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        if self.header and self._file.tell() == 0:
+            self._writer.writerow(self.header)
+
+    def _write_batch(self, batch):
+        try:
+            if self._file is None:
+                self._open()
+            if self.rotation is not None and self.rotation.due(self._file.tell(), batch[0]):
+                self._file.close()
+                self._file = None
+                try:
+                    self.rotation.rotate()
+                except OSError:
+                    pass  # Keep appending to the unrotated file
+                self._open()
+            self._writer.writerows(batch)
+        except OSError:
+            # Disk/network failure: keep the app running, rows are lost
+            self.dropped += len(batch)
+            if self._file is not None:
+                try:
+                    self._file.close()
+                except OSError:
+                    pass  # Buffered data can't be written either
+                self._file = None
+
+    def _flush(self):
+        self._last_flush = time.monotonic()
+        if self._file is None:
+            return
+        try:
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+        except OSError:
+            pass
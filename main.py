@@ -1,16 +1,25 @@
 import tkinter as tk
 from tkinter import messagebox
-import threading
-import time
-from PIL import Image, ImageDraw
-import pystray
 import os
-import queue
-import csv
-from datetime import datetime
-from planner import SessionPlanner
+from planner import Schedule, SessionPlanner, Step, StepType
+from countdown import Stopwatch
+from engine import (SessionEngine, WORK_TIME, BREAK_TIME, STEP, PLAN_DONE, MODE, START, STOP,
+                    RESET, FINISH, OVERTIME, OVERTIME_END)
+from channel import UIChannel, Message
+from logstore import LOG_NAME, LogManager, data_path, open_log, report_file
+from store import SessionStore
+from journal import Journal
+from trayicon import next_update_ms
+from ticker import Renderer, Ticker, TkStats
+from metrics import NULL_METRICS
+from clock import SYSTEM_CLOCK
+from stats import format_summary
 import random
 import sys
+try:
+    import icon_assets  # Icons pre-baked by `python build.py --bake-only`
+except ImportError:
+    icon_assets = None
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller/Nuitka """
@@ -23,36 +32,102 @@ def resource_path(relative_path):
 
     return os.path.join(base_path, relative_path)
 
+def _timer_attr(name):
+    """Forwards an attribute to the engine session (keeps the old app API)."""
+    return property(lambda self: getattr(self.timer, name),
+                    lambda self, value: setattr(self.timer, name, value))
+
+# PIL, pystray and threading are only needed once the window is minimized
+# to the tray, so they are imported there (or in warm_up_tray) rather than
+# at module import, keeping them off the startup path.
+
 class PomodoroApp:
-    def __init__(self, root):
+    # Preload the tray stack this long after startup, on an idle callback.
+    # None disables the warm-up (the first minimize then pays the import).
+    TRAY_WARMUP_MS = 3000
+    # With metrics on, a no-op job keeps the ticker waking this often so
+    # Tk loop stalls show up as tick lag even while nothing else is scheduled
+    WATCHDOG_MS = 1000
+    # While withdrawn to the tray, skip all per-second redraws and wake only
+    # at the step deadline (plus the tray icon's once-a-minute update)
+    LOW_POWER_WHEN_HIDDEN = True
+
+    # Timer state lives in the headless engine; this window is one subscriber
+    current_step_index = _timer_attr("index")
+    is_break = _timer_attr("is_break")
+    running = _timer_attr("running")
+
+    @property
+    def schedule(self):
+        return self.timer.schedule
+
+    @schedule.setter
+    def schedule(self, steps):
+        # Legacy step dicts are converted, the engine reads Step attributes
+        if not isinstance(steps, Schedule):
+            steps = tuple(Step.coerce(step) for step in steps)
+        self.timer.schedule = steps
+        # A hand-made schedule has no budget to re-fit to, nor a plan to rebuild on resume
+        self.timer.plan_minutes = None
+        self.timer.plan_deadline = None
+        self.timer.replans = []
+
+    def __init__(self, root, planner=None, metrics=None, metrics_path="focus_metrics.json",
+                 clock=None, scheduler=None, store=None, journal=None, log_writer=None):
         self.root = root
+        # Time sources and the after() loop; simulation.py swaps both for virtual ones
+        self.clock = clock or SYSTEM_CLOCK
+        self.scheduler = scheduler or root
         self.root.title("집중 타이머")
-        self.root.geometry("350x550") # Increased height for new UI
+        self.root.geometry("350x590") # Increased height for new UI
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
-        # Icon Setup
-        icon_path = resource_path(os.path.join("assets", "icon.ico"))
-        if os.path.exists(icon_path):
-            self.root.iconbitmap(icon_path)
-            self.icon_path = icon_path # Store for tray
-        else:
-            self.icon_path = None
+        self.window_icons = None
+        self.icon_path = None
+        self.setup_icons()
+
+        # Tick lag / handler timings; a no-op unless enabled (--metrics)
+        self.metrics = metrics or NULL_METRICS
+        self.metrics_path = metrics_path
 
         # Logic / State 
-        self.planner = SessionPlanner()
-        self.schedule = [] # List of steps
-        self.current_step_index = -1
+        self.planner = planner or SessionPlanner()
+        self.engine = SessionEngine(self.planner, clock=self.clock.monotonic)
+        self.timer = self.engine.create()
+        self._timer_handlers = {
+            STEP: self._on_step, PLAN_DONE: self._on_plan_done, MODE: self._on_mode,
+            START: self._on_start, STOP: self._on_stop, RESET: self._on_reset,
+            FINISH: self._on_finish, OVERTIME: self._on_overtime, OVERTIME_END: self._on_overtime_end,
+        }
+        self.engine.subscribe(self._on_timer_event, self.timer.id)
+        
+        self.work_time = WORK_TIME
+        self.break_time = BREAK_TIME
+        
+        self.overtime = None
+        self.low_power = False
+        
+        # All periodic UI work runs off one ticker; widgets are only
+        # touched when their rendered text/colour actually changes
+        self.tk_stats = TkStats(clock=self.clock.monotonic)
+        self.ui = Renderer(self.tk_stats)
+        self.ticker = Ticker(self.scheduler, clock=self.clock.monotonic, stats=self.tk_stats, metrics=self.metrics)
         
-        self.work_time = 25 * 60 
-        self.break_time = 5 * 60
+        # Distraction log (written by a background thread)
+        self.log_writer = log_writer or open_log()
         
-        self.is_break = False 
-        self.running = False
-        self.timer_id = None
-        self.time_left = self.work_time
+        # Session history (SQLite, committed on step transitions)
+        self.store = store or SessionStore(data_path("focus.db"), clock=self.clock.wall)
+        self.plan_id = None
+        self.stats = None               # StatsCache, loaded with the first store access
+        self.session_id = None          # Step currently being worked on
+        self.finished_session_id = None # Last completed step (collects overtime)
         
-        # Thread safety queue
-        self.queue = queue.Queue()
+        # Timer state snapshots on every transition, for resume after a crash
+        self.journal = journal or Journal(data_path("focus.journal"))
+        
+        # Tray thread -> UI messages (woken by a virtual event, no polling)
+        self.channel = UIChannel(self.root, self.process_queue)
 
         self.WORKOUT_TIPS = [
             "팔굽혀펴기 20회 실시! 💪",
@@ -67,10 +142,27 @@ class PomodoroApp:
 
         self.setup_ui()
         self.setup_tray_icon()
-        self.process_queue()
         
-        # Default to 1 Hour Plan
-        self.root.after(100, lambda: self.start_smart_plan(60))
+        # Resume where the last run stopped, or default to 1 Hour Plan
+        self.scheduler.after(100, self.resume_or_start)
+        
+        if self.TRAY_WARMUP_MS is not None:
+            self.scheduler.after(self.TRAY_WARMUP_MS, lambda: self.scheduler.after_idle(self.warm_up_tray))
+
+        if self.metrics.enabled:
+            self.root.bind("<Control-M>", self.export_metrics)  # Ctrl+Shift+M
+            self.watchdog()
+
+    def setup_icons(self):
+        # Baked icons need no file lookup (or _MEIPASS) and no decoding
+        if icon_assets is not None:
+            self.window_icons = [tk.PhotoImage(master=self.root, data=data) for data in icon_assets.WINDOW_ICONS]
+            self.root.iconphoto(True, *self.window_icons)
+        else:
+            icon_path = resource_path(os.path.join("assets", "icon.ico"))
+            if os.path.exists(icon_path):
+                self.root.iconbitmap(icon_path)
+                self.icon_path = icon_path # Store for tray
 
     def setup_ui(self):
         # --- Mode / Status (Step Info) ---
@@ -104,7 +196,7 @@ class PomodoroApp:
 
         # --- Distraction ---
         self.distraction_btn = tk.Button(self.root, text="딴짓 했음... 😓", command=self.log_distraction, bg="#ffebee", fg="#c62828")
-        self.distraction_btn.pack(pady=10, fill=tk.X, padx=50)
+        self.ui.pack(self.distraction_btn, pady=10, fill=tk.X, padx=50)
 
         # --- Smart Plan Section ---
         plan_frame = tk.LabelFrame(self.root, text="스마트 세션 플래너 🎓", padx=10, pady=10)
@@ -141,6 +233,10 @@ class PomodoroApp:
         self.plan_status_label = tk.Label(self.root, text="활성 플랜 없음", font=("Arial", 9), fg="gray")
         self.plan_status_label.pack(pady=5)
 
+        # Today / this week, from the incrementally kept stats cache
+        self.stats_label = tk.Label(self.root, text="", font=("Arial", 9), fg="#555", justify=tk.LEFT)
+        self.stats_label.pack(pady=2)
+
         # --- Footer ---
         self.info_label = tk.Label(self.root, text="최소화하면 트레이로 숨겨집니다", font=("Arial", 8), fg="gray")
         self.info_label.pack(side=tk.BOTTOM, pady=5)
@@ -149,17 +245,25 @@ class PomodoroApp:
 
     # ... [Keep process_queue, format_time provided earlier] ...
 
-    def process_queue(self):
-        try:
-            while True:
-                msg = self.queue.get_nowait()
-                if msg == "SHOW":
-                    self.perform_restore()
-                elif msg == "QUIT":
-                    self.perform_quit()
-        except queue.Empty:
-            pass
-        self.root.after(100, self.process_queue)
+    def process_queue(self, event=None):
+        for msg, _payload in self.channel.drain():
+            if msg is Message.SHOW:
+                self.perform_restore()
+            elif msg is Message.QUIT:
+                self.perform_quit()
+
+    @property
+    def countdown(self):
+        return self.timer.countdown
+
+    @property
+    def time_left(self):
+        # Derived from the countdown deadline, never decremented by hand
+        return self.countdown.seconds_left()
+
+    @time_left.setter
+    def time_left(self, seconds):
+        self.countdown.reset(seconds)
 
     def format_time(self, seconds):
         mins, secs = divmod(seconds, 60)
@@ -174,206 +278,308 @@ class PomodoroApp:
             messagebox.showerror("오류", "유효한 분(숫자)을 입력해주세요.")
 
     def start_smart_plan(self, minutes):
-        self.schedule = self.planner.generate_schedule(minutes)
-        if not self.schedule:
+        if not self.planner.schedule_for(minutes):
             messagebox.showwarning("시간 부족", "의미 있는 세션을 갖기에 시간이 너무 짧습니다.")
             return
             
-        self.current_step_index = -1
-        self.next_step() 
+        self.plan_id = self.store.start_plan(minutes)
+        self.engine.load_plan(self.timer, minutes)
 
     def next_step(self):
         self._load_step_by_index(self.current_step_index + 1)
 
     def prev_step(self):
         if self.schedule and self.current_step_index > 0:
+            # Going back leaves the step unfinished, not skipped
+            self._end_session("interrupted")
             self._load_step_by_index(self.current_step_index - 1)
             
     def skip_step(self):
         if self.schedule and self.current_step_index < len(self.schedule) - 1:
+            self._begin_session()  # A step skipped before it was started counts too
+            self._end_session("skipped")
             self._load_step_by_index(self.current_step_index + 1)
             
     def _load_step_by_index(self, index):
-        if index < len(self.schedule):
-            self.current_step_index = index
-            step = self.schedule[self.current_step_index]
-            
-            # Reset Overtime (Navigation should clear it)
-            self.stop_overtime()
+        with self.metrics.timer("handler.load_step"):
+            self.engine.load_step(self.timer, index)
 
-            # Set State
-            self.is_break = (step['type'] == 'BREAK')
-            self.time_left = step['duration']
-            
-            # Update UI
-            label_text = f"단계 {self.current_step_index + 1}/{len(self.schedule)}: {step['label']}"
-            self.mode_label.config(text=label_text, fg="#00796b" if not self.is_break else "#c62828")
-            self.time_label.config(text=self.format_time(self.time_left), fg="black")
-            
-            # Workout Tip
-            if self.is_break:
-                tip = random.choice(self.WORKOUT_TIPS)
-                self.workout_label.config(text=f"팁: {tip}")
-            else:
-                self.workout_label.config(text="")
+    def update_stats(self):
+        if self.stats is None:
+            return
+        now = self.clock.wall()
+        self.ui.config(self.stats_label, text=f"오늘: {format_summary(self.stats.today(now))}\n"
+                                              f"이번 주: {format_summary(self.stats.week(now))}")
+
+    def update_plan_status(self):
+        remaining = len(self.schedule) - (self.current_step_index + 1)
+        self.ui.config(self.plan_status_label, text=f"남은 단계: {remaining}개")
+
+    # --- Engine Events -> UI ---
+    def _on_timer_event(self, event, timer):
+        self._timer_handlers[event]()
+        self.journal.record(self._journal_state(event))
+
+    # --- Crash-safe Journal ---
+    def _journal_state(self, event):
+        state = self.engine.snapshot(self.timer, wall_clock=self.clock.wall)
+        state.update(event=event, plan_id=self.plan_id, session_id=self.session_id)
+        return state
+
+    def resume_or_start(self):
+        """Restores the journaled plan, step and deadline, or starts the default plan."""
+        self.stats = self.store.load_stats()
+        self.update_stats()
+        state = self.journal.load()
+        if state and (state.get("plan") is not None or state.get("deadline") is not None):
+            self.resume(state)
+        else:
+            self.start_smart_plan(60)
+
+    def resume(self, state):
+        if state.get("session_id") is not None:
+            # The step was cut off by the crash; the resumed part is a new session
+            self.store.end_session(state["session_id"], "interrupted")
+        self.plan_id = state.get("plan_id")
+        self.engine.restore(self.timer, state, wall_clock=self.clock.wall)
+        if self.running:
+            self.run_timer()
+
+    def _on_step(self):
+        # Leaving a step that was started but not finished
+        self._end_session("skipped")
+        step = self.schedule[self.current_step_index]
+        
+        label_text = f"단계 {self.current_step_index + 1}/{len(self.schedule)}: {step.label}"
+        self.ui.config(self.mode_label, text=label_text, fg="#00796b" if not self.is_break else "#c62828")
+        self.ui.config(self.time_label, text=self.format_time(self.time_left), fg="black")
+        
+        # Workout Tip
+        if self.is_break:
+            tip = random.choice(self.WORKOUT_TIPS)
+            self.ui.config(self.workout_label, text=f"팁: {tip}")
+        else:
+            self.ui.config(self.workout_label, text="")
+        
+        # Update Buttons
+        btn_text = ("휴식" if self.is_break else "집중") + " 시작"
+        self.ui.config(self.start_button, text=btn_text, state=tk.NORMAL, bg="#c8e6c9" if self.is_break else "#e1e1e1")
+        
+        # Distraction Button Visibilty
+        if self.is_break:
+            self.ui.pack_forget(self.distraction_btn)
+        else:
+            self.ui.pack(self.distraction_btn, pady=10, fill=tk.X, padx=50)
+
+        self.update_plan_status()
+        self.flush_store()
+
+    def _on_plan_done(self):
+        self._end_session("skipped")
+        self.ui.config(self.mode_label, text="플랜 완료! 🎉", fg="blue")
+        self.ui.config(self.time_label, text="00:00", fg="black")
+        self.ui.config(self.start_button, text="완료", state=tk.DISABLED)
+        self.ui.config(self.plan_status_label, text="모든 단계 종료.")
+        self.flush_store()
+
+    def _on_mode(self):
+        if self.is_break:
+            self.ui.config(self.mode_label, text="휴식 시간! ☕", fg="green")
+            self.ui.config(self.start_button, text="휴식 시작", state=tk.NORMAL, bg="#c8e6c9")
             
-            # Update Buttons
-            btn_text = ("휴식" if self.is_break else "집중") + " 시작"
-            self.start_button.config(text=btn_text, state=tk.NORMAL, bg="#c8e6c9" if self.is_break else "#e1e1e1")
+            tip = random.choice(self.WORKOUT_TIPS)
+            self.ui.config(self.workout_label, text=f"팁: {tip}")
             
-            # Distraction Button Visibilty
-            if self.is_break:
-                self.distraction_btn.pack_forget()
-            else:
-                self.distraction_btn.pack(pady=10, fill=tk.X, padx=50)
-
-            self.update_plan_status()
+            self.ui.pack_forget(self.distraction_btn)
         else:
-            # Plan Finished
-            self.schedule = []
-            self.stop_overtime()
-            self.mode_label.config(text="플랜 완료! 🎉", fg="blue")
-            self.time_label.config(text="00:00", fg="black")
-            self.start_button.config(text="완료", state=tk.DISABLED)
-            self.workout_label.config(text="")
-            self.plan_status_label.config(text="모든 단계 종료.")
+            self.ui.config(self.mode_label, text="업무 세션 🚀", fg="#333")
+            self.ui.config(self.start_button, text="업무 시작", state=tk.NORMAL, bg="#e1e1e1")
+            self.ui.config(self.workout_label, text="")
+            self.ui.pack(self.distraction_btn, pady=10, fill=tk.X, padx=50)
+
+    def _on_start(self):
+        self.ui.config(self.start_button, state=tk.DISABLED)
+        self.ui.config(self.stop_button, state=tk.NORMAL)
+        self.ui.config(self.reset_button, state=tk.NORMAL)
+        
+        if self.is_break:
+            self.ui.pack_forget(self.distraction_btn) 
+        
+        self._begin_session()
+        self.flush_store()
 
-    def update_plan_status(self):
-        remaining = len(self.schedule) - (self.current_step_index + 1)
-        self.plan_status_label.config(text=f"남은 단계: {remaining}개")
+    def _on_stop(self):
+        self.ui.config(self.start_button, state=tk.NORMAL)
+        self.ticker.cancel("countdown")
 
-    # --- Overtime Logic ---
-    def start_overtime(self):
-        self.overtime_start = datetime.now()
-        self.overtime_label.pack(after=self.mode_label, pady=5) # Show it
-        self.update_overtime()
+    def _on_reset(self):
+        self.ui.config(self.time_label, text=self.format_time(self.time_left), fg="black")
+        self.ui.config(self.reset_button, state=tk.DISABLED)
+
+    def _on_finish(self):
+        self._end_session("completed")
+        self.ui.config(self.stop_button, state=tk.DISABLED)
         
-    def stop_overtime(self):
+        # Restore window
+        if self.root.state() == 'withdrawn':
+            self.perform_restore()
+        
+        with self.metrics.timer("handler.finish_raise"):
+            self.root.deiconify()
+            self.root.attributes("-topmost", True)
+            self.root.lift()
+            self.root.focus_force()
+            self.root.update()
+
+    def _on_overtime(self):
+        self.overtime = Stopwatch(self.timer.overtime_since, clock=self.countdown.clock)
+        self.overtime_start = self.overtime.start
+        self.ui.pack(self.overtime_label, after=self.mode_label, pady=5) # Show it
+        self.update_overtime()
+
+    def _on_overtime_end(self):
+        if self.overtime is not None and self.finished_session_id is not None:
+            self.store.add_overtime(self.finished_session_id, self.overtime.elapsed())
+            self.finished_session_id = None
+        self.ticker.cancel("overtime")
         if hasattr(self, 'overtime_start'):
             del self.overtime_start
-        self.overtime_label.pack_forget() # Hide it
+        self.overtime = None
+        self.ui.pack_forget(self.overtime_label) # Hide it
+
+    # --- Session History ---
+    def _current_step(self):
+        if self.schedule and 0 <= self.current_step_index < len(self.schedule):
+            return self.schedule[self.current_step_index]
+        # Legacy 25/5 loop
+        return Step(StepType.BREAK if self.is_break else StepType.WORK,
+                    self.countdown.duration,
+                    "휴식 시간! ☕" if self.is_break else "업무 세션 🚀")
+
+    def flush_store(self):
+        # A failed commit (disk full, DB locked by another writer) keeps the
+        # rows queued for the next transition instead of breaking the handler
+        import sqlite3
+        try:
+            self.store.flush()
+        except sqlite3.Error:
+            self.metrics.count("store_errors")
+
+    def _begin_session(self):
+        if self.session_id is None:
+            index = self.current_step_index if self.schedule else None
+            self.session_id = self.store.start_session(self.plan_id, index, self._current_step())
+
+    def _end_session(self, status):
+        if self.session_id is not None:
+            self.store.end_session(self.session_id, status)
+            if status == "completed":
+                self.finished_session_id = self.session_id  # Collects the overtime that follows
+            self.session_id = None
+            self.update_stats()
+
+    # --- Overtime Logic ---
+    def start_overtime(self, since=None):
+        # `since` is the monotonic deadline of the finished step, so a late
+        # finish tick doesn't hide overtime that already happened.
+        self.engine.start_overtime(self.timer, since)
+        
+    def stop_overtime(self):
+        self.engine.stop_overtime(self.timer)
 
     def update_overtime(self):
-        if hasattr(self, 'overtime_start'):
-            elapsed = datetime.now() - self.overtime_start
-            total_seconds = int(elapsed.total_seconds())
-            mins, secs = divmod(total_seconds, 60)
-            self.overtime_label.config(text=f"+{mins:02}:{secs:02}")
-            self.root.after(1000, self.update_overtime)
+        if hasattr(self, 'overtime_start') and not self.low_power:
+            mins, secs = divmod(self.overtime.seconds(), 60)
+            self.ui.config(self.overtime_label, text=f"+{mins:02}:{secs:02}")
+            self.ticker.schedule("overtime", self.overtime.next_tick_ms(), self.update_overtime)
 
     # --- Timer Logic Updates ---
     def start_timer(self):
-        if not self.running:
-            self.running = True
-            self.start_button.config(state=tk.DISABLED)
-            self.stop_button.config(state=tk.NORMAL)
-            self.reset_button.config(state=tk.NORMAL)
-            
-            if self.is_break:
-                self.distraction_btn.pack_forget() 
-            
-            # Verify overtime is cleared
-            self.stop_overtime()
-            
+        if self.engine.start(self.timer):
             self.run_timer()
 
     def stop_timer(self):
-        if self.running:
-            self.running = False
-            self.start_button.config(state=tk.NORMAL)
-            if self.timer_id:
-                self.root.after_cancel(self.timer_id)
-                self.timer_id = None
+        self.engine.stop(self.timer)
 
     def reset_timer(self):
-        self.stop_timer()
-        self.stop_overtime()
-        # If in a plan, reset to start of *current step*
-        if self.schedule and 0 <= self.current_step_index < len(self.schedule):
-            step = self.schedule[self.current_step_index]
-            self.time_left = step['duration']
-        else:
-            # Fallback to standard 25/5
-            self.time_left = self.break_time if self.is_break else self.work_time
-            
-        self.time_label.config(text=self.format_time(self.time_left), fg="black")
-        self.reset_button.config(state=tk.DISABLED)
+        # If in a plan, resets to the start of the *current step*
+        self.engine.reset(self.timer)
 
     def run_timer(self):
-        if self.running and self.time_left > 0:
-            self.time_left -= 1
-            self.time_label.config(text=self.format_time(self.time_left))
-            self.timer_id = self.root.after(1000, self.run_timer)
-        elif self.time_left == 0:
+        # Each tick recomputes the remaining time from the deadline and re-arms
+        # itself for the next second boundary, so late ticks catch up.
+        if self.running and not self.countdown.expired():
+            if self.low_power:
+                # Nobody sees the label: sleep through to the deadline
+                self.ticker.schedule("countdown", self.countdown.deadline_ms(), self.run_timer)
+                return
+            self.ui.config(self.time_label, text=self.format_time(self.time_left))
+            self.ticker.schedule("countdown", self.countdown.next_tick_ms(), self.run_timer)
+        elif self.countdown.expired():
             self.finish_timer()
 
     def finish_timer(self):
-        self.running = False
-        self.stop_button.config(state=tk.DISABLED)
-        
-        # Restore window
-        if self.root.state() == 'withdrawn':
-            self.perform_restore()
-        
-        self.root.deiconify()
-        self.root.attributes("-topmost", True)
-        self.root.lift()
-        self.root.focus_force()
-        self.root.update()
-        
-        # Time ended logic:
-        # 1. If in plan -> Move to next step (Prepare it) BUT don't start.
-        if self.schedule:
-             # Check if there is a next step
-             if self.current_step_index < len(self.schedule) - 1:
-                 self.next_step() # Loads next step (Title, Duration)
-                 # Now start Overtime to show "latency since finish"
-                 self.start_overtime()
-             else:
-                 # Plan complete
-                 self.next_step() # Shows "Plan Completed"
-        else:
-            # Legacy loop
-            self.toggle_mode_legacy()
-            self.start_overtime()
+        # Moves to the next step (prepared, not started) and starts overtime
+        with self.metrics.timer("handler.finish"):
+            self.engine.finish(self.timer)
 
     def toggle_mode_legacy(self):
-        if not self.is_break:
-            self.is_break = True
-            self.time_left = self.break_time
-            self.mode_label.config(text="휴식 시간! ☕", fg="green")
-            self.start_button.config(text="휴식 시작", state=tk.NORMAL, bg="#c8e6c9")
-            
-            tip = random.choice(self.WORKOUT_TIPS)
-            self.workout_label.config(text=f"팁: {tip}")
-            
-            self.distraction_btn.pack_forget()
-        else:
-            self.is_break = False
-            self.time_left = self.work_time
-            self.mode_label.config(text="업무 세션 🚀", fg="#333")
-            self.start_button.config(text="업무 시작", state=tk.NORMAL, bg="#e1e1e1")
-            self.workout_label.config(text="")
-            self.distraction_btn.pack(pady=10, fill=tk.X, padx=50)
+        self.engine.toggle_mode(self.timer)
 
     def log_distraction(self):
+        with self.metrics.timer("handler.log_distraction"):
+            self._log_distraction()
+
+    def _log_distraction(self):
         if not self.is_break and self.running:
-            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            now = self.clock.now().strftime("%Y-%m-%d %H:%M:%S")
             remaining = self.format_time(self.time_left)
-            file_exists = os.path.isfile("focus_log.csv")
-            with open("focus_log.csv", "a", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                if not file_exists:
-                    writer.writerow(["Timestamp", "TimeRemaining"])
-                writer.writerow([now, remaining])
+            elapsed = self.format_time(max(0, self.countdown.duration - self.time_left))
+            self.log_writer.write([now, remaining, elapsed])
+            self.store.log_distraction(self.session_id, self.time_left)
+            self.update_stats()
             orig_text = self.distraction_btn.cget("text")
-            self.distraction_btn.config(text="기록됨!", state=tk.DISABLED)
-            self.root.after(1000, lambda: self.distraction_btn.config(text=orig_text, state=tk.NORMAL))
+            self.ui.config(self.distraction_btn, text="기록됨!", state=tk.DISABLED)
+            self.ticker.schedule("distraction_feedback", 1000,
+                                 lambda: self.ui.config(self.distraction_btn, text=orig_text, state=tk.NORMAL))
+
+    # --- Tray Icon Logic ---
+    def warm_up_tray(self):
+        """Imports the imaging/tray stack ahead of the first minimize."""
+        import threading  # noqa: F401
+        from PIL import Image, ImageDraw  # noqa: F401
+        import pystray  # noqa: F401
+        self.create_image()
+        self.tray_sprites()
+
+    def tray_sprites(self):
+        # Rendered once; every live icon update after that is a few pastes
+        if self.tray_atlas is None:
+            from trayicon import SpriteAtlas
+            self.tray_atlas = SpriteAtlas()
+        return self.tray_atlas
+
+    def tray_image(self):
+        if self.running:
+            return self.tray_sprites().render_countdown(self.countdown, self.is_break)
+        return self.create_image()
 
-    # --- Tray Icon Logic (Unchanged) ---
     def create_image(self):
+        # Decoded once and reused by every minimize
+        if self.tray_image_cache is None:
+            self.tray_image_cache = self._load_icon_image()
+        return self.tray_image_cache
+
+    def _load_icon_image(self):
+        from PIL import Image, ImageDraw
+        if icon_assets is not None:
+            # Raw pixels: wraps the module's bytes, no decoder plugin involved
+            return Image.frombuffer("RGBA", icon_assets.TRAY_ICON_SIZE, icon_assets.TRAY_ICON_RGBA,
+                                    "raw", "RGBA", 0, 1)
         if self.icon_path and os.path.exists(self.icon_path):
-            return Image.open(self.icon_path)
+            image = Image.open(self.icon_path)
+            image.load()
+            return image
         
         # Fallback if no icon
         width = 64
@@ -387,43 +593,209 @@ class PomodoroApp:
         return image
 
     def setup_tray_icon(self):
-        self.tray_icon = None
+        self.tray = None  # Long-lived TrayService, created on the first minimize
+        self.tray_image_cache = None
+        self.tray_atlas = None
+
+    def create_tray(self):
+        import pystray
+        from tray import TrayService
+        menu = (pystray.MenuItem('Show', self.on_tray_show, default=True),
+                pystray.MenuItem('Quit', self.on_tray_quit))
+        return TrayService(pystray.Icon("name", None, "Focus Timer", menu))
 
     def minimize_to_tray(self, event=None):
         if self.root.state() == 'iconic':
             self.root.withdraw()
-            if not self.tray_icon:
-                image = self.create_image()
-                menu = (pystray.MenuItem('Show', self.on_tray_show, default=True),
-                        pystray.MenuItem('Quit', self.on_tray_quit))
-                self.tray_icon = pystray.Icon("name", image, "Focus Timer", menu)
-                threading.Thread(target=self.tray_icon.run, daemon=True).start()
+            if self.LOW_POWER_WHEN_HIDDEN:
+                self.enter_low_power()
+            if self.tray is None:
+                self.tray = self.create_tray()
+            if not self.tray.visible:
+                with self.metrics.timer("handler.tray_start"):
+                    self.tray.show(self.tray_image())
+                    self.schedule_tray_update()
+
+    def schedule_tray_update(self):
+        # Re-armed for the moment the shown minute changes, not every second
+        if self.running:
+            self.ticker.schedule("tray", next_update_ms(self.countdown.remaining()), self.update_tray_icon)
+
+    def update_tray_icon(self):
+        if self.tray is not None and self.tray.visible:
+            self.tray.update(self.tray_image())
+            self.schedule_tray_update()
 
     def on_tray_show(self, icon=None, item=None):
-        self.queue.put("SHOW")
+        self.channel.post(Message.SHOW)
 
     def on_tray_quit(self, icon=None, item=None):
-        self.queue.put("QUIT")
+        self.channel.post(Message.QUIT)
+
+    def hide_tray_icon(self):
+        self.ticker.cancel("tray")
+        if self.tray is not None:
+            self.tray.hide()
 
     def stop_tray_icon(self):
-        if self.tray_icon:
-            self.tray_icon.stop()
-            self.tray_icon = None
+        self.hide_tray_icon()
+        if self.tray is not None:
+            self.tray.stop()
+            self.tray = None
+
+    # --- Metrics ---
+    def watchdog(self):
+        if not self.low_power:
+            self.ticker.schedule("watchdog", self.WATCHDOG_MS, self.watchdog)
+
+    def export_metrics(self, event=None):
+        return self.metrics.export(metrics_file(self.metrics_path))
 
     def perform_restore(self):
         self.root.deiconify()
-        self.stop_tray_icon()
+        self.hide_tray_icon()
         self.root.state('normal')
+        self.leave_low_power()
+
+    # --- Low-power mode (withdrawn to the tray) ---
+    def enter_low_power(self):
+        self.low_power = True
+        for name in ("countdown", "overtime", "watchdog"):
+            self.ticker.cancel(name)
+        if self.running:
+            self.run_timer()  # Re-armed for the deadline only
+
+    def leave_low_power(self):
+        if not self.low_power:
+            return
+        self.low_power = False
+        # Nothing was redrawn while hidden: catch up from the clock
+        if self.running:
+            self.run_timer()
+        else:
+            self.ui.config(self.time_label, text=self.format_time(self.time_left))
+        self.update_overtime()
+        if self.metrics.enabled:
+            self.watchdog()
 
     def perform_quit(self):
         self.stop_tray_icon()
+        # os._exit skips atexit/daemon threads, so drain the log first
+        self.log_writer.close(timeout=2.0)
+        self._end_session("aborted")
+        # A clean quit resumes paused, not with a deadline that ran out meanwhile
+        self.stop_timer()
+        self.journal.record(self._journal_state("quit"))
+        self.journal.close()
+        self.store.close()
+        self.export_metrics()
         self.root.destroy()
         os._exit(0)
 
     def on_close(self):
         self.perform_quit()
 
+def parse_args(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="집중 타이머")
+    parser.add_argument("--report", nargs="?", const="", metavar="LOG",
+                        help="딴짓 로그 분석 리포트를 출력하고 종료합니다 (기본: 데이터 폴더의 로그 전체)")
+    parser.add_argument("--from", dest="since", metavar="YYYY-MM-DD",
+                        help="리포트 시작 날짜 (이 날짜 포함)")
+    parser.add_argument("--to", dest="until", metavar="YYYY-MM-DD",
+                        help="리포트 끝 날짜 (이 날짜 포함)")
+    parser.add_argument("--import-log", metavar="LOG",
+                        help="기존 focus_log.csv를 세션 DB(focus.db)로 가져오고 종료합니다")
+    parser.add_argument("--serve", nargs="?", const="127.0.0.1:8765", metavar="ADDR",
+                        help="세션 서버를 실행합니다 (host:port 또는 유닉스 소켓 경로)")
+    parser.add_argument("--planner", choices=("greedy", "optimal"), default="greedy",
+                        help="플랜 생성 방식 (optimal: 블록 카탈로그 동적 계획법)")
+    parser.add_argument("--metrics", nargs="?", const="focus_metrics.json", metavar="PATH",
+                        help="틱 지연 / 처리 시간 지표를 수집해 종료 시(또는 Ctrl+Shift+M) PATH에 저장합니다")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="리포트 분석에 사용할 프로세스 수 (기본 1, 수백 MB 이상의 로그에서 효과)")
+    return parser.parse_args(argv)
+
+def run_report(path, workers=1, since=None, until=None):
+    from datetime import date, timedelta
+    end = None if until is None else (date.fromisoformat(until) + timedelta(days=1)).isoformat()
+    if path and os.path.isfile(path):
+        if since is None and end is None:
+            from analytics import analyze
+            print(analyze(path, workers=workers).format())
+        else:
+            print(report_file(path, since, end).format())
+        return 0
+    # The data directory adopts an old working-directory log first, as the app does
+    manager = LogManager(path or None, legacy=None if path else LOG_NAME + ".csv")
+    if manager.legacy and os.path.isfile(manager.legacy):
+        manager.prepare()
+    if not manager.segments() and not os.path.isfile(manager.path):
+        print(f"로그 파일이 없습니다: {path or manager.path}")
+        return 1
+    # Rotated segments outside the range are never opened
+    print(manager.report(since, end).format())
+    return 0
+
+def install_startup_probe(root, app, path, spawned):
+    """
+    Build comparisons (benchmarks/bench_builds.py): writes the ms from
+    process spawn to the first mapped frame to `path`, then quits. A file,
+    because windowed builds have no stdout.
+    """
+    import time
+    def mapped(event):
+        if event.widget is root:
+            with open(path, "w") as f:
+                f.write(f"{(time.time() - spawned) * 1000:.1f}\n")
+            root.after_idle(app.perform_quit)
+    root.bind("<Map>", mapped, add="+")
+
+def metrics_file(path):
+    # Relative paths land in the data directory, not wherever the app was launched
+    return path if os.path.isabs(path) else data_path(path)
+
+def run_server(address, metrics_path=None):
+    import asyncio
+    from server import serve
+    from metrics import Metrics
+    metrics = Metrics() if metrics_path else None
+    try:
+        asyncio.run(serve(address, metrics))
+    except KeyboardInterrupt:
+        pass
+    if metrics is not None:
+        metrics.export(metrics_file(metrics_path))
+    return 0
+
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["--multiprocessing-fork"]:
+        # A --report worker of a frozen build re-runs this entry point: hand
+        # it to multiprocessing instead of starting the app (Windows spawn).
+        # Checked first so the usual startup doesn't import multiprocessing.
+        import multiprocessing
+        multiprocessing.freeze_support()
+    args = parse_args()
+    if args.serve:
+        sys.exit(run_server(args.serve, args.metrics))
+    if args.report is not None:
+        sys.exit(run_report(args.report, args.workers, args.since, args.until))
+    if args.import_log:
+        store = SessionStore(data_path("focus.db"))
+        print(f"가져온 기록: {store.import_csv(args.import_log)}건")
+        store.close()
+        sys.exit(0)
+    planner = None
+    if args.planner == "optimal":
+        from optimal_planner import OptimalPlanner
+        planner = OptimalPlanner()
+    metrics = None
+    if args.metrics:
+        from metrics import Metrics
+        metrics = Metrics()
     root = tk.Tk()
-    app = PomodoroApp(root)
+    app = PomodoroApp(root, planner, metrics, args.metrics)
+    if os.environ.get("FOCUS_STARTUP_PROBE"):
+        install_startup_probe(root, app, os.environ["FOCUS_STARTUP_PROBE"],
+                              float(os.environ.get("FOCUS_STARTUP_T0", "0")))
     root.mainloop()
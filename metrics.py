@@ -0,0 +1,165 @@
+import bisect
+import collections
+import json
+import os
+import time
+
+# Upper bucket bounds in milliseconds (the last bucket is everything above)
+BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+STALL_SECONDS = 0.1  # A tick this late means the Tk loop was blocked
+
+
+class Histogram:
+    """Fixed-bucket latency histogram. observe() is a bisect and four adds."""
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, ms):
+        self.buckets[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-quantile (max for the overflow bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(BUCKETS_MS, self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(float(bound), self.max)
+        return self.max
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.quantile(0.5),
+            "p99_ms": self.quantile(0.99),
+            "max_ms": round(self.max, 3),
+            "buckets": {str(bound): n for bound, n in zip(BUCKETS_MS + ("inf",), self.buckets) if n},
+        }
+
+
+class _Timer:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = self.metrics.clock()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.observe(self.name, self.metrics.clock() - self.start)
+        return False
+
+
+class Metrics:
+    """
+    In-process counters and latency histograms, cheap enough to leave on:
+    recording is a dict lookup plus Histogram.observe(), nothing is written
+    until export() is asked for. Durations are given in seconds and kept
+    in milliseconds.
+    """
+    enabled = True
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.histograms = {}
+        self.counters = collections.Counter()
+        self.started = time.time()
+
+    def observe(self, name, seconds):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.observe(seconds * 1000)
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+
+    def timer(self, name):
+        """with metrics.timer("handler.x"): ... records how long the block took."""
+        return _Timer(self, name)
+
+    def observe_lag(self, name, seconds):
+        """Scheduling lag of a callback; lags over STALL_SECONDS also count as stalls."""
+        self.observe(name, max(0.0, seconds))
+        if seconds > STALL_SECONDS:
+            self.count("stalls")
+            self.observe("stall", seconds)
+
+    def snapshot(self):
+        return {
+            "started": self.started,
+            "taken": time.time(),
+            "counters": dict(sorted(self.counters.items())),
+            "histograms": {name: h.as_dict() for name, h in sorted(self.histograms.items())},
+        }
+
+    def export(self, path):
+        """Writes the snapshot as JSON, atomically (readers never see half a file)."""
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+        return path
+
+    def format(self):
+        lines = [f"{name:28} n={h.count:<7} p50 {h.quantile(0.5):7.1f} ms  p99 {h.quantile(0.99):7.1f} ms  "
+                 f"max {h.max:8.1f} ms" for name, h in sorted(self.histograms.items())]
+        lines += [f"{name:28} {value}" for name, value in sorted(self.counters.items())]
+        return "\n".join(lines)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class NullMetrics:
+    """Metrics turned off: every call is a no-op and nothing is allocated."""
+    enabled = False
+
+    def observe(self, name, seconds):
+        pass
+
+    def count(self, name, n=1):
+        pass
+
+    def timer(self, name):
+        return _NULL_TIMER
+
+    def observe_lag(self, name, seconds):
+        pass
+
+    def snapshot(self):
+        return {}
+
+    def export(self, path):
+        return None
+
+    def format(self):
+        return ""
+
+
+NULL_METRICS = NullMetrics()
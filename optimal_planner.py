@@ -0,0 +1,187 @@
+from collections import namedtuple
+
+from planner import Spliced, Step, StepType
+
+
+class Block(namedtuple("Block", ("name", "work", "rest", "label", "rest_label",
+                                 "min_work", "opening", "follows", "final"))):
+    """
+    One entry of the block catalog (lengths in minutes).
+    work / rest: focus length and the break that follows it. The break of
+        the last block may be dropped when it doesn't fit.
+    min_work: if set, the block may be shortened to anything in [min_work, work].
+    opening: the block may start a plan. Only opening blocks can.
+    follows: names of the blocks it may come after (None: any block).
+    final: the block ends the plan (no break, nothing after it).
+    """
+    __slots__ = ()
+
+    def __new__(cls, name, work, rest=0, label="", rest_label="", min_work=None,
+                opening=False, follows=None, final=False):
+        if follows is not None:
+            follows = frozenset(follows)
+        return super().__new__(cls, name, work, rest, label, rest_label, min_work, opening, follows, final)
+
+    def lengths(self):
+        return range(self.min_work if self.min_work is not None else self.work, self.work + 1)
+
+
+# The greedy planner's blocks, with the ordering it implies: warm-up first,
+# then peaks, at most one standard block, and a wrap-up at the very end.
+DEFAULT_CATALOG = (
+    Block("warmup", 25, 5, "기본 집중 🚀", "짧은 휴식 ☕", opening=True, follows=()),
+    Block("peak", 35, 10, "깊은 집중 🔥", "휴식 🌿", follows=("warmup", "peak")),
+    Block("standard", 25, 5, "집중 🧠", "휴식 🌿", follows=("warmup", "peak")),
+    Block("wrapup", 24, 0, "마무리 🏁", min_work=10, final=True),
+)
+
+_START = None  # Previous block of an empty plan
+
+
+class OptimalPlanner:
+    """
+    Plans by dynamic programming over a block catalog instead of greedily:
+    for a budget of T minutes it picks the sequence of blocks that
+    maximizes focused minutes, then time used (a trailing break rather than
+    idle time), then prefers fewer blocks.
+
+    best(t, prev) only depends on the minutes left and on which blocks may
+    follow `prev`, so blocks with the same successors share one table row.
+    The table is filled bottom-up and kept on the instance: it only grows
+    to the largest budget asked so far, every later query (and every
+    shorter one) is a walk back through the stored choices, and finished
+    schedules are cached like SessionPlanner.schedule_for's. replan() walks
+    the same table from the row of the last block already done.
+    Same schedule_for / generate_schedule / generate_schedules API as
+    SessionPlanner, so either can drive the engine.
+    """
+
+    def __init__(self, catalog=DEFAULT_CATALOG):
+        self.catalog = tuple(catalog)
+        names = [block.name for block in self.catalog]
+        if len(set(names)) != len(names):
+            raise ValueError("block names must be unique")
+
+        # Rows: one per distinct set of allowed successors
+        rows = {}
+        self._row_of = {}
+        for prev in [_START] + [block for block in self.catalog if not block.final]:
+            moves = tuple(self._moves(prev))
+            self._row_of[None if prev is None else prev.name] = rows.setdefault(moves, len(rows))
+        # Per move: (block index, work, rest, final, next row)
+        self._moves_by_row = [
+            tuple((i, work, block.rest, block.final, None if block.final else self._row_of[block.name])
+                  for i, block in moves for work in block.lengths())
+            for moves in rows
+        ]
+        self._best = []    # _best[t][row] = (focus, used, -blocks)
+        self._choice = []  # _choice[t][row] = (block index, work, rest taken) or None to stop
+        self._cache = {}
+        self._suffixes = {}  # (minutes, row) -> steps after a block of that row
+        self._block_of_label = {}
+        for block in self.catalog:
+            self._block_of_label.setdefault(block.label, block)
+        self._steps = {}   # (block index, work) -> (work Step, break Step), shared by all plans
+
+    def _moves(self, prev):
+        for i, block in enumerate(self.catalog):
+            if prev is _START:
+                if block.opening:
+                    yield i, block
+            elif block.follows is None or prev.name in block.follows:
+                yield i, block
+
+    def _extend(self, total_minutes):
+        """Fills the table up to total_minutes (no-op if already there)."""
+        best, choice, moves_by_row = self._best, self._choice, self._moves_by_row
+        stop = (0, 0, 0)
+        for t in range(len(best), total_minutes + 1):
+            best_t, choice_t = [], []
+            for moves in moves_by_row:
+                value, pick = stop, None
+                for i, work, rest, final, row in moves:
+                    if work > t:
+                        continue
+                    # Ending with this block, without its break
+                    candidate = (work, work, -1)
+                    if candidate > value:
+                        value, pick = candidate, (i, work, 0)
+                    if final or work + rest > t:
+                        continue
+                    f, used, blocks = best[t - work - rest][row]
+                    candidate = (work + f, work + rest + used, blocks - 1)
+                    if candidate > value:
+                        value, pick = candidate, (i, work, rest)
+                best_t.append(value)
+                choice_t.append(pick)
+            best.append(best_t)
+            choice.append(choice_t)
+
+    def focus_minutes(self, total_minutes):
+        """Most focused minutes any plan from the catalog fits into the budget."""
+        if total_minutes < 0:
+            return 0
+        self._extend(total_minutes)
+        return self._best[total_minutes][self._row_of[None]][0]
+
+    def _build(self, total_minutes, row=None):
+        steps = []
+        if total_minutes >= 0:
+            self._extend(total_minutes)
+            t, row = total_minutes, self._row_of[None] if row is None else row
+            while True:
+                pick = self._choice[t][row]
+                if pick is None:
+                    break
+                i, work, rest = pick
+                block = self.catalog[i]
+                pair = self._steps.get((i, work))
+                if pair is None:
+                    pair = self._steps[i, work] = (Step(StepType.WORK, work * 60, block.label),
+                                                   Step(StepType.BREAK, block.rest * 60, block.rest_label))
+                steps.append(pair[0])
+                if not rest:
+                    break
+                steps.append(pair[1])
+                t -= work + rest
+                row = self._row_of[block.name]
+        return tuple(steps)
+
+    def schedule_for(self, total_minutes):
+        """Cached, immutable schedule (tuple of Steps)."""
+        schedule = self._cache.get(total_minutes)
+        if schedule is None:
+            schedule = self._cache[total_minutes] = self._build(total_minutes)
+        return schedule
+
+    def replan(self, schedule, index, minutes_left):
+        """
+        Re-fits schedule[index:] into minutes_left, keeping the steps before
+        `index`. The rest is planned from the table row of the last work
+        step before `index` (known by its label), so it only uses blocks
+        that may follow it.
+        """
+        if index == 0:
+            return self.schedule_for(minutes_left)
+        prev = None
+        for i in range(index - 1, -1, -1):
+            if schedule[i].type is StepType.WORK:
+                prev = self._block_of_label.get(schedule[i].label)
+                break
+        if prev is None:
+            row = self._row_of[None]
+        else:
+            row = self._row_of.get(prev.name)
+            if row is None:  # A final block: nothing may follow it
+                return Spliced(schedule, index, ())
+        steps = self._suffixes.get((minutes_left, row))
+        if steps is None:
+            steps = self._suffixes[minutes_left, row] = self._build(minutes_left, row)
+        return Spliced(schedule, index, steps)
+
+    def generate_schedule(self, total_minutes):
+        """Fresh list of plain step dicts (callers may modify it)."""
+        return [step.as_dict() for step in self.schedule_for(total_minutes)]
+
+    def generate_schedules(self, durations):
+        return {minutes: self.schedule_for(minutes) for minutes in durations}
@@ -1,3 +1,237 @@
+import sys
+from bisect import bisect_right
+from collections import namedtuple
+from collections.abc import Sequence
+from enum import Enum
+from functools import lru_cache
+
+
+class StepType(str, Enum):
+    # str mixin: StepType.WORK == "WORK", so code comparing with strings keeps working
+    WORK = "WORK"
+    BREAK = "BREAK"
+
+
+class Step(namedtuple("Step", ("type", "duration", "label"))):
+    """
+    Immutable plan step (a 3-tuple, no per-instance dict). Fixed steps are
+    shared by every schedule and labels are interned. Read-only dict-style
+    access (step['label'], dict(step)) is kept for older callers.
+    """
+    __slots__ = ()
+
+    def __new__(cls, type, duration, label):
+        return super().__new__(cls, StepType(type), duration, sys.intern(label))
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+    def keys(self):
+        return self._fields
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in self._fields else default
+
+    def as_dict(self):
+        """Plain mutable dict, as generate_schedule always returned."""
+        return {"type": self.type._value_, "duration": self.duration, "label": self.label}
+
+    @classmethod
+    def coerce(cls, step):
+        """Step from a Step or a legacy step dict."""
+        if isinstance(step, cls):
+            return step
+        return cls(step['type'], step['duration'], step['label'])
+
+
+# Fixed steps are shared by all schedules; only the wrap-up varies.
+_WARMUP = Step(StepType.WORK, 25 * 60, "기본 집중 🚀")
+_WARMUP_BREAK = Step(StepType.BREAK, 5 * 60, "짧은 휴식 ☕")
+_PEAK = Step(StepType.WORK, 35 * 60, "깊은 집중 🔥")
+_PEAK_BREAK = Step(StepType.BREAK, 10 * 60, "휴식 🌿")
+_STANDARD = Step(StepType.WORK, 25 * 60, "집중 🧠")
+_STANDARD_BREAK = Step(StepType.BREAK, 5 * 60, "휴식 🌿")
+_WRAPUP_LABEL = "마무리 🏁"
+# Templates for the repeated peak blocks of generate_schedule()
+_PEAK_DICT = _PEAK.as_dict()
+_PEAK_BREAK_DICT = _PEAK_BREAK.as_dict()
+
+CACHE_SIZE = 4096
+
+
+def block_counts(total_minutes):
+    """
+    Closed form of the greedy plan, O(1) in total_minutes.
+    Returns (warmup_break, peaks, standard, standard_break, wrapup_minutes).
+
+    After the 25m warm-up and 5m break, the greedy loop takes a 35+10 peak
+    block while >= 45m remain, so the number of peaks is rem // 45. The rest
+    (< 45m) fits at most one 25m standard block, whose 5m break leaves < 15m,
+    so the loop can never run a second time. Anything >= 10m left is wrap-up.
+    """
+    if total_minutes < 25:
+        return None
+    rem = total_minutes - 25
+    if rem < 5:
+        return (False, 0, False, False, 0)
+    rem -= 5
+    peaks, rem = divmod(rem, 45)
+    standard = standard_break = False
+    if rem >= 25:
+        standard = True
+        rem -= 25
+        if rem >= 5:
+            standard_break = True
+            rem -= 5
+    wrapup = rem if rem >= 10 else 0
+    return (True, int(peaks), standard, standard_break, wrapup)
+
+
+class Schedule(Sequence):
+    """
+    Lazy, immutable schedule. Nothing is materialized: the step at any index
+    is computed from block_counts() in O(1), so prev/skip on a week-long plan
+    is as cheap as on a one hour plan, and iterating yields steps on demand.
+    """
+    __slots__ = ("total_minutes", "_head", "_peaks", "_tail")
+
+    def __init__(self, total_minutes):
+        self.total_minutes = total_minutes
+        counts = block_counts(total_minutes)
+        if counts is None:
+            self._head, self._peaks, self._tail = (), 0, ()
+            return
+        warmup_break, peaks, standard, standard_break, wrapup = counts
+        self._head = (_WARMUP, _WARMUP_BREAK) if warmup_break else (_WARMUP,)
+        self._peaks = peaks
+        tail = []
+        if standard:
+            tail.append(_STANDARD)
+            if standard_break:
+                tail.append(_STANDARD_BREAK)
+        if wrapup:
+            tail.append(Step(StepType.WORK, wrapup * 60, _WRAPUP_LABEL))
+        self._tail = tuple(tail)
+
+    def __len__(self):
+        return len(self._head) + 2 * self._peaks + len(self._tail)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self))))
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("schedule index out of range")
+        if index < len(self._head):
+            return self._head[index]
+        index -= len(self._head)
+        if index < 2 * self._peaks:
+            return _PEAK_BREAK if index % 2 else _PEAK
+        return self._tail[index - 2 * self._peaks]
+
+    def __iter__(self):
+        yield from self._head
+        for _ in range(self._peaks):
+            yield _PEAK
+            yield _PEAK_BREAK
+        yield from self._tail
+
+    def seconds_from(self, index):
+        """Planned seconds of the steps from `index` on, in O(1)."""
+        index = max(0, index)
+        seconds = sum(step.duration for step in self._head[index:])
+        p = max(0, index - len(self._head))
+        if p < 2 * self._peaks:
+            seconds += (self._peaks - (p + 1) // 2) * _PEAK.duration
+            seconds += (self._peaks - p // 2) * _PEAK_BREAK.duration
+        p = max(0, p - 2 * self._peaks)
+        return seconds + sum(step.duration for step in self._tail[p:])
+
+    def as_dicts(self):
+        """Fresh list of plain step dicts (see SessionPlanner.generate_schedule)."""
+        steps = [step.as_dict() for step in self._head]
+        peak, peak_break = _PEAK_DICT, _PEAK_BREAK_DICT
+        for _ in range(self._peaks):
+            steps += (peak.copy(), peak_break.copy())
+        steps += [step.as_dict() for step in self._tail]
+        return steps
+
+    def __repr__(self):
+        return f"Schedule({self.total_minutes!r}, steps={len(self)})"
+
+
+def seconds_from(schedule, index):
+    """Planned seconds of schedule[index:], for any schedule sequence."""
+    method = getattr(schedule, "seconds_from", None)
+    if method is not None:
+        return method(index)
+    return sum(step.duration for step in schedule[index:])
+
+
+class Spliced(Sequence):
+    """
+    A re-planned schedule: the first `cut` steps of `head`, then `tail`
+    from `offset` on. Like Schedule nothing is copied; splicing a spliced
+    schedule again keeps one flat list of pieces, so a plan re-fitted at
+    every step still indexes in O(log pieces).
+    """
+    __slots__ = ("_starts", "_pieces", "_len")
+
+    def __init__(self, head, cut, tail, offset=0):
+        if isinstance(head, Spliced):
+            pieces = [piece for piece in head._pieces if piece[0] < cut]
+        else:
+            pieces = [(0, head, 0)] if cut else []
+        if offset < len(tail):
+            pieces.append((cut, tail, offset))
+        self._pieces = pieces
+        self._starts = [piece[0] for piece in pieces]
+        self._len = cut + max(0, len(tail) - offset)
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self))))
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("schedule index out of range")
+        start, steps, offset = self._pieces[bisect_right(self._starts, index) - 1]
+        return steps[offset + index - start]
+
+    def seconds_from(self, index):
+        # From the last piece back: the engine asks from the latest cut on, O(1)
+        seconds, end = 0, self._len
+        for start, steps, offset in reversed(self._pieces):
+            if end <= index:
+                break
+            seconds += seconds_from(steps, offset + max(0, index - start)) - seconds_from(steps, offset + end - start)
+            end = start
+        return seconds
+
+    def __repr__(self):
+        return f"Spliced(steps={self._len}, pieces={len(self._pieces)})"
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _cached_schedule(total_minutes):
+    return Schedule(total_minutes)
+
+
+def iter_schedule(total_minutes):
+    """Yields the steps of a plan one at a time."""
+    return iter(_cached_schedule(total_minutes))
+
+
 class SessionPlanner:
     def __init__(self):
         pass
@@ -5,59 +239,34 @@ class SessionPlanner:
     def generate_schedule(self, total_minutes):
         """
         Generates a schedule fitting into total_minutes.
-        Pattern by User Request: 
+        Pattern by User Request:
         - Start: Standard (25m) -> Break (5m)
         - Peak: Reduced to 35m (from 40m) or 30m to keep focus sharp.
+        Returns a fresh list of step dicts (callers may modify it).
+        """
+        return _cached_schedule(total_minutes).as_dicts()
+
+    def schedule_for(self, total_minutes):
+        """Cached, immutable, lazily indexed Schedule of Step objects. No copying."""
+        return _cached_schedule(total_minutes)
+
+    def iter_schedule(self, total_minutes):
+        return iter_schedule(total_minutes)
+
+    def replan(self, schedule, index, minutes_left):
+        """
+        Re-fits schedule[index:] into minutes_left, keeping the steps before
+        `index`. Past the warm-up the rest is what the greedy plan does after
+        its first block, i.e. Schedule(minutes_left + 30) without its warm-up
+        and break; both come from the cache, so this is O(1).
+        """
+        if index == 0:
+            return _cached_schedule(minutes_left)
+        return Spliced(schedule, index, _cached_schedule(minutes_left + 30), offset=2)
+
+    def generate_schedules(self, durations):
+        """
+        Batch API: plans many durations at once (e.g. every option 25..600m).
+        Returns a dict mapping each distinct duration to its immutable schedule.
         """
-        schedule = []
-        remaining_minutes = total_minutes
-        
-        # Minimum requirement: At least 25m for one session
-        if remaining_minutes < 25:
-            return []
-
-        # 1. Initial Phase (Standard 25m Work + 5m Break)
-        # User requested 25m start.
-        if remaining_minutes >= 25:
-            schedule.append({"type": "WORK", "duration": 25 * 60, "label": "기본 집중 🚀"})
-            remaining_minutes -= 25
-            
-            # Add break if we have enough time for at least a short next step or just a break
-            if remaining_minutes >= 5:
-                schedule.append({"type": "BREAK", "duration": 5 * 60, "label": "짧은 휴식 ☕"})
-                remaining_minutes -= 5
-            else:
-                return schedule
-
-        # 2. Peak / Flow Phase 
-        # User requested peak time to be shorter (was 40m). Let's aim for 30-35m.
-        # Let's try to fit 35m Peak blocks if possible.
-        
-        while remaining_minutes >= 25: # At least a standard session
-            # If enough for Peak (35 + 10 break) = 45m
-            if remaining_minutes >= 45:
-                work_min = 35
-                break_min = 10
-                schedule.append({"type": "WORK", "duration": work_min * 60, "label": "깊은 집중 🔥"})
-            else:
-                # Fallback to Standard 25m
-                work_min = 25
-                break_min = 5
-                schedule.append({"type": "WORK", "duration": work_min * 60, "label": "집중 🧠"})
-            
-            remaining_minutes -= work_min
-            
-            # Add break logic
-            if remaining_minutes >= break_min:
-                schedule.append({"type": "BREAK", "duration": break_min * 60, "label": "휴식 🌿"})
-                remaining_minutes -= break_min
-            else:
-                 # If we can't fit a full break, just exit loop to wrap up
-                 break
-
-        # 3. Cool-down / Wrap up
-        if remaining_minutes >= 10:
-             schedule.append({"type": "WORK", "duration": remaining_minutes * 60, "label": "마무리 🏁"})
-             remaining_minutes = 0
-
-        return schedule
+        return {minutes: _cached_schedule(minutes) for minutes in durations}
@@ -0,0 +1,295 @@
+import asyncio
+import json
+
+from engine import SessionEngine, START
+from metrics import NULL_METRICS
+
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+TICK_INTERVAL = 1.0
+# A subscriber whose unsent output grows past this is dropped instead of
+# letting one slow reader hold up the fan-out.
+MAX_BUFFER = 256 * 1024
+
+# Protocol: one JSON object per line in both directions.
+#   -> {"id": 1, "op": "plan", "session": 3, "minutes": 90}
+#   <- {"id": 1, "ok": true, "session": {...}}
+#   <- {"event": "step", "session": 3, "state": {...}}
+#   <- {"event": "tick", "session": 3, "left": 1499}
+# Requests may carry any "id"; it is echoed in the reply.
+# {"op": "metrics"} returns the loop lag histograms (empty unless --metrics).
+
+
+def session_state(session):
+    step = session.step
+    return {
+        "id": session.id,
+        "index": session.index,
+        "steps": len(session.schedule),
+        "label": step["label"] if step is not None else None,
+        "is_break": session.is_break,
+        "running": session.running,
+        "left": session.countdown.seconds_left(),
+    }
+
+
+def _encode(message):
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+
+
+def parse_address(address):
+    """'host:port' -> ("tcp", host, port); a path or 'unix:path' -> ("unix", path, None)."""
+    if address.startswith("unix:"):
+        return "unix", address[5:], None
+    host, sep, port = address.rpartition(":")
+    if not sep or "/" in address or not port.isdigit():
+        return "unix", address, None
+    return "tcp", host or "127.0.0.1", int(port)
+
+
+class _Connection:
+    __slots__ = ("writer", "sessions", "everything")
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.sessions = set()   # Subscribed session ids
+        self.everything = False  # Subscribed to all sessions
+
+    def send(self, line):
+        if self.writer.is_closing():
+            return
+        if self.writer.transport.get_write_buffer_size() > MAX_BUFFER:
+            self.writer.close()
+            return
+        self.writer.write(line)
+
+
+class SessionServer:
+    """
+    Shares one SessionEngine with many clients over line-delimited JSON.
+    Idle connections cost one reader task each; all timing is done by a
+    single tick task that sleeps until the next deadline or tick.
+    Every event is encoded once and written to each subscriber without
+    awaiting, so fan-out never blocks on a slow client.
+    """
+
+    def __init__(self, engine=None, tick_interval=TICK_INTERVAL, metrics=NULL_METRICS):
+        self.engine = engine or SessionEngine()
+        self.tick_interval = tick_interval
+        self.metrics = metrics
+        self.connections = set()
+        self._subscribers = {}  # session id -> set of connections
+        self._everything = set()
+        self._last_left = {}
+        self._server = None
+        self._ticker = None
+        self._wakeup = None
+        self.engine.subscribe(self._on_event)
+
+    # --- Lifecycle ---
+    async def start(self, address=DEFAULT_ADDRESS):
+        kind, host, port = parse_address(address)
+        if kind == "unix":
+            self._server = await asyncio.start_unix_server(self._handle, host)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+        self._wakeup = asyncio.Event()
+        self._ticker = asyncio.create_task(self._tick_loop())
+        return self._server
+
+    async def close(self):
+        if self._ticker is not None:
+            self._ticker.cancel()
+        for conn in list(self.connections):
+            conn.writer.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    @property
+    def sockets(self):
+        return self._server.sockets if self._server is not None else []
+
+    # --- Connections ---
+    async def _handle(self, reader, writer):
+        conn = _Connection(writer)
+        self.connections.add(conn)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                conn.send(_encode(self._dispatch(conn, line)))
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            self._drop(conn)
+            writer.close()
+
+    def _drop(self, conn):
+        self.connections.discard(conn)
+        self._everything.discard(conn)
+        for session_id in conn.sessions:
+            subscribers = self._subscribers.get(session_id)
+            if subscribers:
+                subscribers.discard(conn)
+                if not subscribers:
+                    del self._subscribers[session_id]
+
+    def _dispatch(self, conn, line):
+        try:
+            request = json.loads(line)
+            op = request["op"]
+        except (ValueError, TypeError, KeyError):
+            return {"ok": False, "error": "bad request"}
+        reply = {"id": request.get("id")} if "id" in request else {}
+        handler = getattr(self, "op_" + str(op), None)
+        if handler is None:
+            reply.update(ok=False, error=f"unknown op: {op}")
+            return reply
+        try:
+            reply.update(handler(conn, request) or {})
+            reply["ok"] = True
+        except (KeyError, ValueError, TypeError) as e:
+            reply.update(ok=False, error=str(e) or e.__class__.__name__)
+        return reply
+
+    def _session(self, request):
+        session = self.engine.sessions.get(request.get("session"))
+        if session is None:
+            raise KeyError("no such session")
+        return session
+
+    # --- Operations ---
+    def op_schedule(self, conn, request):
+        return {"schedule": self.engine.planner.generate_schedule(int(request["minutes"]))}
+
+    def op_create(self, conn, request):
+        session = self.engine.create()
+        if "minutes" in request and not self.engine.load_plan(session, int(request["minutes"])):
+            self.engine.remove(session)
+            raise ValueError("plan too short")
+        return {"session": session_state(session)}
+
+    def op_remove(self, conn, request):
+        session = self._session(request)
+        self.engine.stop(session)
+        self.engine.remove(session)
+        self._last_left.pop(session.id, None)
+
+    def op_plan(self, conn, request):
+        session = self._session(request)
+        if not self.engine.load_plan(session, int(request["minutes"])):
+            raise ValueError("plan too short")
+        return {"session": session_state(session)}
+
+    def op_start(self, conn, request):
+        self.engine.start(self._session(request))
+
+    def op_stop(self, conn, request):
+        self.engine.stop(self._session(request))
+
+    def op_reset(self, conn, request):
+        self.engine.reset(self._session(request))
+
+    def op_skip(self, conn, request):
+        return {"moved": self.engine.skip_step(self._session(request))}
+
+    def op_prev(self, conn, request):
+        return {"moved": self.engine.prev_step(self._session(request))}
+
+    def op_state(self, conn, request):
+        return {"session": session_state(self._session(request))}
+
+    def op_sessions(self, conn, request):
+        return {"sessions": list(self.engine.sessions)}
+
+    def op_metrics(self, conn, request):
+        return {"metrics": self.metrics.snapshot()}
+
+    def op_subscribe(self, conn, request):
+        if request.get("session") is None:
+            conn.everything = True
+            self._everything.add(conn)
+            return None
+        session = self._session(request)
+        conn.sessions.add(session.id)
+        self._subscribers.setdefault(session.id, set()).add(conn)
+        return {"session": session_state(session)}
+
+    def op_unsubscribe(self, conn, request):
+        if request.get("session") is None:
+            conn.everything = False
+            self._everything.discard(conn)
+            return None
+        session_id = request["session"]
+        conn.sessions.discard(session_id)
+        subscribers = self._subscribers.get(session_id)
+        if subscribers:
+            subscribers.discard(conn)
+
+    # --- Fan-out ---
+    def _targets(self, session_id):
+        subscribers = self._subscribers.get(session_id)
+        if not subscribers:
+            return self._everything
+        if not self._everything:
+            return subscribers
+        return subscribers | self._everything
+
+    def _publish(self, session_id, message):
+        targets = self._targets(session_id)
+        if targets:
+            line = _encode(message)
+            for conn in tuple(targets):
+                conn.send(line)
+
+    def _on_event(self, event, session):
+        if event == START and self._wakeup is not None:
+            self._wakeup.set()  # A new deadline may be earlier than the one we sleep on
+        self._last_left.pop(session.id, None)
+        if self._targets(session.id):
+            self._publish(session.id, {"event": event, "session": session.id, "state": session_state(session)})
+
+    def _publish_ticks(self):
+        if self._everything:
+            watched = self.engine.sessions.keys()
+        else:
+            watched = list(self._subscribers)
+        for session_id in watched:
+            session = self.engine.sessions.get(session_id)
+            if session is None or not session.running:
+                continue
+            left = session.countdown.seconds_left()
+            if self._last_left.get(session_id) != left:
+                self._last_left[session_id] = left
+                self._publish(session_id, {"event": "tick", "session": session_id, "left": left})
+
+    async def _tick_loop(self):
+        clock = self.engine.clock
+        next_tick = clock()
+        while True:
+            now = clock()
+            self.engine.advance(now)
+            if now >= next_tick:
+                self._publish_ticks()
+                next_tick = now + self.tick_interval
+            wake = next_tick
+            deadline = self.engine.next_deadline()
+            if deadline is not None and deadline < wake:
+                wake = deadline
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), max(0.0, wake - clock()))
+            except asyncio.TimeoutError:
+                # Woken by the timeout: how late against the deadline/tick it slept for
+                self.metrics.observe_lag("server.tick.lag", clock() - wake)
+
+
+async def serve(address=DEFAULT_ADDRESS, metrics=None):
+    server = SessionServer(metrics=metrics or NULL_METRICS)
+    await server.start(address)
+    print(f"세션 서버 실행 중: {address}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
@@ -0,0 +1,228 @@
+import collections
+import random
+
+from clock import EPOCH, VirtualClock, VirtualScheduler  # Day 0 starts at EPOCH, a Monday 09:00
+from main import PomodoroApp
+from store import SessionStore
+
+DAY = 24 * 3600
+
+
+class StubWidget:
+    """The slice of the Tk widget API the app uses, without Tk."""
+    __slots__ = ("options", "packed")
+
+    def __init__(self):
+        self.options = {}
+        self.packed = False
+
+    def config(self, **options):
+        self.options.update(options)
+
+    configure = config
+
+    def cget(self, key):
+        return self.options.get(key, "")
+
+    def pack(self, **options):
+        self.packed = True
+
+    def pack_forget(self):
+        self.packed = False
+
+
+class StubRoot:
+    """The window calls the app makes (title, bind, state, lift...), without Tk."""
+
+    def __init__(self):
+        self.window_state = "normal"
+
+    def title(self, text):
+        pass
+
+    def geometry(self, spec):
+        pass
+
+    def protocol(self, name, func):
+        pass
+
+    def bind(self, sequence, func, add=None):
+        pass
+
+    def event_generate(self, sequence, **options):
+        pass
+
+    def state(self, new_state=None):
+        if new_state is None:
+            return self.window_state
+        self.window_state = new_state
+
+    def withdraw(self):
+        self.window_state = "withdrawn"
+
+    def deiconify(self):
+        self.window_state = "normal"
+
+    def attributes(self, *args):
+        pass
+
+    def lift(self):
+        pass
+
+    def focus_force(self):
+        pass
+
+    def update(self):
+        pass
+
+    def destroy(self):
+        pass
+
+
+class MemoryJournal:
+    def __init__(self):
+        self.last = None
+        self.records = 0
+
+    def load(self):
+        return self.last
+
+    def record(self, snapshot):
+        self.last = snapshot
+        self.records += 1
+
+    def close(self):
+        pass
+
+
+class MemoryLog:
+    def __init__(self):
+        self.rows = []
+
+    def write(self, row):
+        self.rows.append(row)
+        return True
+
+    def close(self, timeout=None):
+        return True
+
+
+WIDGETS = ("mode_label", "time_label", "workout_label", "start_button", "stop_button", "reset_button",
+           "distraction_btn", "overtime_label", "plan_status_label", "stats_label", "info_label")
+
+
+class HeadlessApp(PomodoroApp):
+    TRAY_WARMUP_MS = None  # No tray (and no pystray import) in a simulation
+
+    def setup_icons(self):
+        pass
+
+    def setup_ui(self):
+        for name in WIDGETS:
+            setattr(self, name, StubWidget())
+        self.ui.pack(self.distraction_btn)
+
+
+def build_app(clock, scheduler, planner=None, metrics=None):
+    """A PomodoroApp on virtual time: stub window and widgets, in-memory store, journal and log."""
+    return HeadlessApp(StubRoot(), planner, metrics, clock=clock, scheduler=scheduler,
+                       store=SessionStore(":memory:", clock=clock.wall), journal=MemoryJournal(), log_writer=MemoryLog())
+
+
+class DayScript:
+    """
+    How a simulated user behaves, drawn from a seeded RNG:
+    skip a step, pause mid-step, log distractions while working, and
+    linger in overtime before starting the next step.
+    """
+
+    def __init__(self, plan_minutes=240, skip=0.05, pause=0.1, pause_seconds=(30, 600),
+                 distractions_per_hour=2.0, overtime_seconds=(0, 180)):
+        self.plan_minutes = plan_minutes
+        self.skip = skip
+        self.pause = pause
+        self.pause_seconds = pause_seconds
+        self.distractions_per_hour = distractions_per_hour
+        self.overtime_seconds = overtime_seconds
+
+
+class Simulation:
+    """
+    Replays days of plans through the real PomodoroApp (engine, ticker,
+    handlers, store) on virtual time, deterministically for a given seed.
+    redraw=False keeps the app in its low-power path (no per-second label
+    ticks, only deadline wakeups), which is what makes thousands of days
+    run in seconds; redraw=True also runs every per-second tick.
+    """
+
+    def __init__(self, seed=0, script=None, redraw=False, planner=None):
+        self.rng = random.Random(seed)
+        self.script = script or DayScript()
+        self.redraw = redraw
+        self.clock = VirtualClock()
+        self.scheduler = VirtualScheduler(self.clock)
+        self.app = build_app(self.clock, self.scheduler, planner)
+        self.app.low_power = not redraw
+        self.counts = collections.Counter()
+        self.day = 0
+        self.scheduler.run_for(1)  # Startup: resume_or_start loads the default plan
+
+    def run_days(self, days):
+        for _ in range(days):
+            self.run_day()
+        return self.summary()
+
+    def run_day(self):
+        app, rng, script = self.app, self.rng, self.script
+        self.scheduler.run_until(self.day * DAY)  # Next morning, 09:00
+        app.start_smart_plan(script.plan_minutes)
+        while app.schedule:
+            if rng.random() < script.skip and app.current_step_index < len(app.schedule) - 1:
+                app.skip_step()
+                self.counts["skips"] += 1
+            app.start_timer()
+            deadline = self.clock.t + app.countdown.remaining()
+            events = []
+            if not app.is_break:
+                rate = script.distractions_per_hour * app.countdown.remaining() / 3600
+                events += [(rng.uniform(self.clock.t, deadline), "distraction") for _ in range(self._poisson(rate))]
+            if rng.random() < script.pause:
+                events.append((rng.uniform(self.clock.t, deadline), "pause"))
+            for when, kind in sorted(events):
+                self.scheduler.run_until(when)
+                if not app.running:
+                    break
+                if kind == "distraction":
+                    app.log_distraction()
+                    self.counts["distractions"] += 1
+                else:
+                    app.stop_timer()
+                    self.scheduler.run_for(rng.uniform(*script.pause_seconds))
+                    app.start_timer()
+                    self.counts["pauses"] += 1
+            # after() delays are whole milliseconds, rounded up past the deadline
+            self.scheduler.run_until(self.clock.t + app.countdown.remaining() + 0.001)
+            self.counts["steps"] += 1
+            if app.schedule:
+                self.scheduler.run_for(rng.uniform(*script.overtime_seconds))
+        self.day += 1
+        self.counts["days"] += 1
+
+    def _poisson(self, rate):
+        # Knuth's method: fine for the handful of events per step used here
+        limit, k, p = pow(2.718281828459045, -rate), 0, self.rng.random()
+        while p > limit:
+            k += 1
+            p *= self.rng.random()
+        return k
+
+    def summary(self):
+        self.app.store.flush()
+        sessions = self.app.store.sessions_between(0, float("inf"))
+        summary = dict(self.counts)
+        summary["sessions"] = len(sessions)
+        summary["completed"] = sum(1 for s in sessions if s['status'] == "completed")
+        summary["overtime"] = round(sum(s['overtime'] for s in sessions), 3)
+        summary["logged_distractions"] = len(self.app.log_writer.rows)
+        summary["simulated_seconds"] = self.clock.t
+        return summary
@@ -0,0 +1,146 @@
+import json
+import time
+from datetime import date, datetime, timedelta
+
+VERSION = 1
+# Per day / per label counters: distractions, step statuses (completed,
+# skipped, aborted, interrupted) and focus seconds of completed work steps
+FOCUS = "focus"
+DISTRACTIONS = "distractions"
+
+
+def _day(ts):
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
+
+
+def _bump(table, key, field, n=1):
+    counters = table.get(key)
+    if counters is None:
+        counters = table[key] = {}
+    counters[field] = counters.get(field, 0) + n
+    return key
+
+
+class StatsCache:
+    """
+    Running aggregates over the session store: distractions per day, per
+    step label and per hour of day, and step outcomes (completed / skipped
+    / ...) per day and label. SessionStore updates it on every write and
+    saves it in the same transaction: one row per changed day plus a small
+    JSON header (labels, hours), so neither reading today's or this week's
+    numbers nor saving after an event grows with the history.
+
+    `watermark` is the store's [max session id, max distraction id] when
+    the snapshot was saved; a snapshot that no longer matches the tables
+    (written by an older version, an import, a crash) is rebuilt.
+    """
+
+    def __init__(self):
+        self.days = {}       # "YYYY-MM-DD" -> {field: count}
+        self.labels = {}     # step label -> {field: count}
+        self.hours = [0] * 24  # Distractions by local hour of day
+        self.watermark = None
+        self.dirty = False
+        self._dirty_days = set()
+        self._open = {}      # session id -> (label, type, duration) of running steps
+
+    # --- Updates (from SessionStore) ---
+    def session_started(self, session_id, label, step_type, duration):
+        self._open[session_id] = (label, step_type, duration)
+
+    def pop_session(self, session_id):
+        return self._open.pop(session_id, None)
+
+    def session_ended(self, step, status, ts):
+        """`step` is the (label, type, duration) of the ended session, or None if unknown."""
+        day = _day(ts)
+        self._dirty_days.add(_bump(self.days, day, status))
+        if step is not None:
+            label, step_type, duration = step
+            _bump(self.labels, label, status)
+            if status == "completed" and step_type == "WORK":
+                _bump(self.days, day, FOCUS, duration)
+        self.dirty = True
+
+    def distraction(self, session_id, ts):
+        local = datetime.fromtimestamp(ts)
+        self._dirty_days.add(_bump(self.days, local.strftime("%Y-%m-%d"), DISTRACTIONS))
+        self.hours[local.hour] += 1
+        step = self._open.get(session_id)
+        if step is not None:
+            _bump(self.labels, step[0], DISTRACTIONS)
+        self.dirty = True
+
+    @classmethod
+    def rebuild(cls, distractions, sessions):
+        """
+        A cache from grouped rows of the raw tables (see SessionStore.load_stats):
+        distractions as (day, hour, label, count), ended sessions as
+        (day, label, type, status, count, total duration).
+        """
+        stats = cls()
+        for day, hour, label, count in distractions:
+            _bump(stats.days, day, DISTRACTIONS, count)
+            stats.hours[hour] += count
+            if label is not None:
+                _bump(stats.labels, label, DISTRACTIONS, count)
+        for day, label, step_type, status, count, duration in sessions:
+            _bump(stats.days, day, status, count)
+            _bump(stats.labels, label, status, count)
+            if status == "completed" and step_type == "WORK":
+                _bump(stats.days, day, FOCUS, duration)
+        stats._dirty_days = set(stats.days)
+        stats.dirty = True
+        return stats
+
+    # --- Reads ---
+    def day(self, day):
+        return dict(self.days.get(day, ()))
+
+    def today(self, now=None):
+        return self.day(_day(time.time() if now is None else now))
+
+    def week(self, now=None):
+        """Totals from Monday of the current week through today."""
+        today = date.fromtimestamp(time.time() if now is None else now)
+        totals = {}
+        for offset in range(today.weekday() + 1):
+            for field, count in self.days.get((today - timedelta(days=offset)).isoformat(), {}).items():
+                totals[field] = totals.get(field, 0) + count
+        return totals
+
+    # --- Snapshot ---
+    def dumps(self):
+        """The header: everything but the per-day counters."""
+        return json.dumps({"version": VERSION, "watermark": self.watermark, "labels": self.labels,
+                           "hours": self.hours}, separators=(",", ":"), ensure_ascii=False)
+
+    def take_dirty_days(self):
+        """(day, counters JSON) of the days changed since the last save."""
+        days = [(day, json.dumps(self.days[day], separators=(",", ":"))) for day in sorted(self._dirty_days)]
+        self._dirty_days.clear()
+        return days
+
+    @classmethod
+    def loads(cls, text, days=()):
+        """
+        A cache from a dumps() header and (day, counters JSON) rows, or None
+        if it is unreadable or from another version.
+        """
+        try:
+            data = json.loads(text)
+            if data.get("version") != VERSION:
+                return None
+            stats = cls()
+            stats.watermark = data["watermark"]
+            stats.labels = data["labels"]
+            stats.hours = data["hours"]
+            stats.days = {day: json.loads(counters) for day, counters in days}
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return None
+        return stats
+
+
+def format_summary(counters):
+    return (f"완료 {counters.get('completed', 0)} · 건너뜀 {counters.get('skipped', 0)} · "
+            f"딴짓 {counters.get(DISTRACTIONS, 0)} · 집중 {counters.get(FOCUS, 0) // 60}분")
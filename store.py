@@ -0,0 +1,282 @@
+import itertools
+import os
+import time
+from datetime import datetime
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS plans (
+    id INTEGER PRIMARY KEY,
+    total_minutes INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    plan_id INTEGER REFERENCES plans(id),
+    step_index INTEGER,
+    type TEXT NOT NULL,
+    label TEXT NOT NULL,
+    duration INTEGER NOT NULL,
+    started_at REAL NOT NULL,
+    ended_at REAL,
+    overtime REAL NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'running'
+);
+CREATE TABLE IF NOT EXISTS stats_days (
+    day TEXT PRIMARY KEY,
+    counters TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS distractions (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    session_id INTEGER REFERENCES sessions(id),
+    time_remaining INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_started ON sessions(started_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_label ON sessions(label, started_at);
+CREATE INDEX IF NOT EXISTS idx_distractions_ts ON distractions(ts);
+CREATE INDEX IF NOT EXISTS idx_distractions_session ON distractions(session_id);
+"""
+
+_INSERT_PLAN = "INSERT INTO plans (id, total_minutes, created_at) VALUES (?, ?, ?)"
+_INSERT_SESSION = ("INSERT INTO sessions (id, plan_id, step_index, type, label, duration, started_at) "
+                   "VALUES (?, ?, ?, ?, ?, ?, ?)")
+_END_SESSION = "UPDATE sessions SET ended_at = ?, status = ? WHERE id = ?"
+_ADD_OVERTIME = "UPDATE sessions SET overtime = overtime + ? WHERE id = ?"
+_INSERT_DISTRACTION = "INSERT INTO distractions (ts, session_id, time_remaining) VALUES (?, ?, ?)"
+# CSV rows carry whole seconds; a row logged live has the same second and remaining time
+_IMPORT_DISTRACTION = """
+INSERT INTO distractions (ts, session_id, time_remaining)
+SELECT ?1, NULL, ?2 WHERE NOT EXISTS (
+    SELECT 1 FROM distractions WHERE ts >= ?1 AND ts < ?1 + 1 AND time_remaining IS ?2)
+"""
+_SAVE_STATS = "INSERT OR REPLACE INTO meta (key, value) VALUES ('stats', ?)"
+_SAVE_META = "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)"
+_SAVE_STATS_DAY = "INSERT OR REPLACE INTO stats_days (day, counters) VALUES (?, ?)"
+_WATERMARK = "SELECT (SELECT COALESCE(MAX(id), 0) FROM sessions), (SELECT COALESCE(MAX(id), 0) FROM distractions)"
+# Raw rows grouped for StatsCache.rebuild(), in local time like the CSV log
+_STATS_DISTRACTIONS = """
+SELECT date(d.ts, 'unixepoch', 'localtime'), CAST(strftime('%H', d.ts, 'unixepoch', 'localtime') AS INTEGER),
+       s.label, COUNT(*)
+FROM distractions d LEFT JOIN sessions s ON s.id = d.session_id
+GROUP BY 1, 2, 3
+"""
+_STATS_SESSIONS = """
+SELECT date(ended_at, 'unixepoch', 'localtime'), label, type, status, COUNT(*), SUM(duration)
+FROM sessions WHERE ended_at IS NOT NULL
+GROUP BY 1, 2, 3, 4
+"""
+
+IMPORT_BATCH = 10000
+ID_BLOCK = 64  # Ids reserved per write transaction (see SessionStore._reserve_ids)
+
+
+def _parse_mmss(text):
+    mins, _, secs = text.partition(":")
+    return int(mins) * 60 + int(secs or 0)
+
+
+class SessionStore:
+    """
+    Embedded SQLite store for plans, sessions (plan steps) and distractions.
+    Writes are queued in memory and committed together in one transaction
+    by flush(), which the app calls on step transitions; a failed flush
+    keeps them queued for the next one. Ids are assigned here, from blocks
+    reserved in the database, so queued rows can reference each other before
+    they are written and several writers (window, CLI) can share one file.
+    Timestamps are unix epoch seconds.
+    After load_stats() every write also updates the StatsCache.
+    """
+
+    def __init__(self, path="focus.db", clock=time.time):
+        self.path = path
+        self.clock = clock
+        self.stats = None
+        self._conn = None
+        self._pending = []  # (sql, params) in submission order
+        self._ids = {}  # table -> [next id, end of the reserved block]
+
+    # --- Connection ---
+    @property
+    def conn(self):
+        if self._conn is None:
+            import sqlite3  # Deferred until the first write/query
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def _new_id(self, table):
+        ids = self._ids.get(table)
+        if ids is None or ids[0] == ids[1]:
+            ids = self._ids[table] = self._reserve_ids(table)
+        new_id = ids[0]
+        ids[0] += 1
+        return new_id
+
+    def _reserve_ids(self, table):
+        """
+        Claims the next ID_BLOCK ids of `table` in a write transaction, so
+        another store on the same file never hands out the same ones.
+        """
+        key = "next_id:" + table
+        conn = self.conn
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")  # Take the write lock before reading the counter
+            row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+            top = conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()[0]
+            first = max(top + 1, int(row[0]) if row else 0)
+            conn.execute(_SAVE_META, (key, str(first + ID_BLOCK)))
+        return [first, first + ID_BLOCK]
+
+    # --- Writes (queued) ---
+    def start_plan(self, total_minutes):
+        plan_id = self._new_id("plans")
+        self._pending.append((_INSERT_PLAN, (plan_id, total_minutes, self.clock())))
+        return plan_id
+
+    def start_session(self, plan_id, step_index, step):
+        session_id = self._new_id("sessions")
+        self._pending.append((_INSERT_SESSION, (session_id, plan_id, step_index, step['type'],
+                                                step['label'], step['duration'], self.clock())))
+        if self.stats is not None:
+            self.stats.session_started(session_id, step['label'], step['type'], step['duration'])
+        return session_id
+
+    def end_session(self, session_id, status="completed"):
+        ended_at = self.clock()
+        if self.stats is not None:
+            step = self.stats.pop_session(session_id) or self._session_step(session_id)
+            self.stats.session_ended(step, status, ended_at)
+        self._pending.append((_END_SESSION, (ended_at, status, session_id)))
+
+    def add_overtime(self, session_id, seconds):
+        self._pending.append((_ADD_OVERTIME, (seconds, session_id)))
+
+    def log_distraction(self, session_id, time_remaining, ts=None):
+        ts = self.clock() if ts is None else ts
+        self._pending.append((_INSERT_DISTRACTION, (ts, session_id, time_remaining)))
+        if self.stats is not None:
+            self.stats.distraction(session_id, ts)
+
+    def flush(self):
+        """
+        Commits all queued writes in a single transaction. On sqlite3.Error
+        the transaction is rolled back and the writes stay queued.
+        """
+        pending = self._pending
+        if not pending:
+            return 0
+        with self.conn:
+            # Consecutive statements of the same kind go through one executemany
+            for sql, group in itertools.groupby(pending, key=lambda op: op[0]):
+                self.conn.executemany(sql, (params for _, params in group))
+            if self.stats is not None and self.stats.dirty:
+                self._save_stats()
+        self._pending = []
+        return len(pending)
+
+    # --- Stats cache ---
+    def load_stats(self):
+        """
+        Attaches and returns the StatsCache: the snapshot saved with the last
+        flush, or rebuilt from the sessions / distractions tables when it is
+        missing or its watermark no longer matches them.
+        """
+        from stats import StatsCache
+        self.flush()
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'stats'").fetchone()
+        stats = StatsCache.loads(row[0], self.conn.execute("SELECT day, counters FROM stats_days")) if row else None
+        if stats is None or stats.watermark != list(self.conn.execute(_WATERMARK).fetchone()):
+            stats = StatsCache.rebuild(self.conn.execute(_STATS_DISTRACTIONS), self.conn.execute(_STATS_SESSIONS))
+            with self.conn:
+                self.conn.execute("DELETE FROM stats_days")
+                self.stats = stats
+                self._save_stats()
+        self.stats = stats
+        return stats
+
+    def _save_stats(self):
+        self.stats.watermark = list(self.conn.execute(_WATERMARK).fetchone())
+        self.conn.executemany(_SAVE_STATS_DAY, self.stats.take_dirty_days())
+        self.conn.execute(_SAVE_STATS, (self.stats.dumps(),))
+        self.stats.dirty = False
+
+    def _session_step(self, session_id):
+        """(label, type, duration) of a session started by an earlier run, e.g. one cut off by a crash."""
+        self.flush()
+        row = self.conn.execute("SELECT label, type, duration FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        return tuple(row) if row else None
+
+    def close(self):
+        self.flush()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # --- Queries ---
+    def sessions_between(self, start, end, label=None):
+        sql = "SELECT * FROM sessions WHERE started_at >= ? AND started_at < ?"
+        params = [start, end]
+        if label is not None:
+            # Served by idx_sessions_label (label, started_at)
+            sql = "SELECT * FROM sessions WHERE label = ? AND started_at >= ? AND started_at < ?"
+            params = [label, start, end]
+        return self._query(sql + " ORDER BY started_at", params)
+
+    def sessions_with_label(self, label):
+        return self.sessions_between(0, float("inf"), label)
+
+    def distractions_between(self, start, end):
+        return self._query("SELECT * FROM distractions WHERE ts >= ? AND ts < ? ORDER BY ts", (start, end))
+
+    def last_days(self, days, now=None):
+        """Sessions and distractions of the last `days` days."""
+        now = self.clock() if now is None else now
+        start = now - days * 86400
+        return self.sessions_between(start, now), self.distractions_between(start, now)
+
+    def _query(self, sql, params):
+        import sqlite3
+        self.flush()
+        self.conn.row_factory = sqlite3.Row
+        try:
+            return [dict(row) for row in self.conn.execute(sql, params)]
+        finally:
+            self.conn.row_factory = None
+
+    # --- Import ---
+    def import_csv(self, path):
+        """
+        One-shot import of a legacy focus_log.csv into the distractions table.
+        Rows already in the table (same second and remaining time, whether
+        imported from another copy of the log or logged live) are skipped.
+        Returns the number of imported rows (0 if this file was imported before).
+        """
+        import csv
+        key = "csv_imported:" + os.path.abspath(path)
+        if self.conn.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+            return 0
+        self.flush()
+
+        count = 0
+        with open(path, newline="", encoding="utf-8") as f, self.conn:
+            batch = []
+            for row in csv.reader(f):
+                try:
+                    ts = datetime.strptime(row[0], "%Y-%m-%d %H:%M:%S").timestamp()
+                    remaining = _parse_mmss(row[1]) if len(row) > 1 else None
+                except (ValueError, IndexError):
+                    continue  # Header or malformed row
+                batch.append((ts, remaining))
+                if len(batch) >= IMPORT_BATCH:
+                    count += self.conn.executemany(_IMPORT_DISTRACTION, batch).rowcount
+                    batch = []
+            if batch:
+                count += self.conn.executemany(_IMPORT_DISTRACTION, batch).rowcount
+            self.conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (key, str(count)))
+        return count
@@ -0,0 +1,66 @@
+import unittest
+import tempfile
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import analyze, _analyze_range, DistractionReport
+
+LOG = (
+    "Timestamp,TimeRemaining\r\n"
+    "2025-01-30 09:10:00,20:00\r\n"        # Legacy row without elapsed column
+    "2025-01-30 09:40:00,10:00\r\n"
+    "2025-01-30 14:00:00,24:00,01:00\r\n"
+    "2025-01-31 14:05:59,12:34,22:26\r\n"
+    "2025-01-31 14:06:30,12:03,22:57\r\n"
+    "2025-01-31 08:00:00,30:00,05:00\r\n"  # Clock went backwards
+    "\r\n"
+    "2025-02-01 23:59:59,00:01,34:59"      # No trailing newline
+)
+
+class TestAnalytics(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "focus_log.csv")
+        with open(self.path, "w", newline="", encoding="utf-8") as f:
+            f.write(LOG)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def check(self, report):
+        self.assertEqual(report.total, 7)
+        self.assertEqual(report.by_day, {"2025-01-30": 3, "2025-01-31": 3, "2025-02-01": 1})
+        self.assertEqual(report.by_hour, {8: 1, 9: 2, 14: 3, 23: 1})
+        self.assertEqual(report.by_minute, {1: 1, 5: 1, 22: 2, 34: 1})
+
+    def test_analyze(self):
+        self.check(analyze(self.path))
+
+    def test_small_chunks(self):
+        for chunk_size in (1, 7, 40):
+            self.check(analyze(self.path, chunk_size=chunk_size))
+
+    def test_byte_ranges_cover_every_row_once(self):
+        size = os.path.getsize(self.path)
+        for parts in (2, 3, 5, 11):
+            bounds = [size * i // parts for i in range(parts + 1)]
+            report = DistractionReport()
+            for i in range(parts):
+                report.merge(_analyze_range(self.path, bounds[i], bounds[i + 1], 16))
+            self.check(report)
+
+    def test_format(self):
+        text = analyze(self.path).format()
+        self.assertIn("총 딴짓 기록: 7회", text)
+        self.assertIn("14시: 3", text)
+
+    def test_report_runs_in_process_unless_asked(self):
+        # Worker processes are opt-in: a frozen build without freeze_support would re-launch the app
+        from main import parse_args
+        self.assertEqual(parse_args(["--report"]).workers, 1)
+        self.assertEqual(parse_args(["--report", "--workers", "4"]).workers, 4)
+
+if __name__ == '__main__':
+    unittest.main()
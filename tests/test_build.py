@@ -0,0 +1,60 @@
+import base64
+import io
+import os
+import runpy
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+import build
+import icon_assets
+from main import PomodoroApp
+from store import SessionStore
+
+def pixels(png_base64):
+    from PIL import Image
+    image = Image.open(io.BytesIO(base64.b64decode(png_base64)))
+    return image.mode, image.size, image.tobytes()
+
+class TestBakedAssets(unittest.TestCase):
+    def test_baked_module_matches_icon(self):
+        cwd = os.getcwd()
+        os.chdir(ROOT)  # bake_assets reads assets/icon.ico relative to the project
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                output = os.path.join(tmp, "icon_assets.py")
+                build.bake_assets(output)
+                baked = runpy.run_path(output)
+        finally:
+            os.chdir(cwd)
+        # Compared as decoded pixels: PNG encoder output differs between Pillow versions
+        stale = "icon_assets.py is stale: run python build.py --bake-only"
+        self.assertEqual([pixels(data) for data in icon_assets.WINDOW_ICONS],
+                         [pixels(data) for data in baked["WINDOW_ICONS"]], stale)
+        self.assertEqual(icon_assets.TRAY_ICON_SIZE, baked["TRAY_ICON_SIZE"], stale)
+        self.assertEqual(icon_assets.TRAY_ICON_RGBA, baked["TRAY_ICON_RGBA"], stale)
+
+    def test_app_uses_baked_icons(self):
+        root = MagicMock()
+        app = PomodoroApp(root, store=SessionStore(":memory:"), journal=MagicMock(), log_writer=MagicMock())
+        root.iconphoto.assert_called_once()
+        root.iconbitmap.assert_not_called()
+        self.assertEqual(len(app.window_icons), len(icon_assets.WINDOW_ICONS))
+        image = app.create_image()
+        self.assertEqual((image.mode, image.size), ("RGBA", icon_assets.TRAY_ICON_SIZE))
+        self.assertIs(app.create_image(), image)
+
+    def test_trimmed_imports_keep_what_the_app_needs(self):
+        trimmed = build.trimmed_imports()
+        for needed in ("asyncio", "sqlite3", "multiprocessing", "tkinter", "PIL.IcoImagePlugin",
+                       "PIL.PngImagePlugin", "PIL.BmpImagePlugin"):
+            self.assertNotIn(needed, trimmed)
+        self.assertIn("PIL.JpegImagePlugin", trimmed)
+        self.assertIn("unittest", trimmed)
+
+if __name__ == '__main__':
+    unittest.main()
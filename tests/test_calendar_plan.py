@@ -0,0 +1,82 @@
+import random
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calendar_plan import CalendarPlanner, IntervalIndex
+from planner import SessionPlanner
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+def brute_free(busy, window_start, window_end):
+    """Reference gaps: minute by minute."""
+    gaps, start = [], None
+    for t in range(window_start, window_end, 60):
+        free = not any(s <= t < e for s, e in busy)
+        if free and start is None:
+            start = t
+        elif not free and start is not None:
+            gaps.append((start, t))
+            start = None
+    if start is not None:
+        gaps.append((start, window_end))
+    return gaps
+
+class TestIntervalIndex(unittest.TestCase):
+    def test_merges_overlapping_and_touching(self):
+        index = IntervalIndex([(10, 20), (15, 30), (30, 40), (50, 60), (5, 5)])
+        self.assertEqual(list(index), [(10, 40), (50, 60)])
+        index.add(45, 50)
+        index.add(0, 12)
+        self.assertEqual(list(index), [(0, 40), (45, 60)])
+        index.add(100, 110)
+        index.add(39, 101)
+        self.assertEqual(list(index), [(0, 110)])
+        self.assertTrue(index.is_busy(0))
+        self.assertFalse(index.is_busy(110))
+
+    def test_free_gaps_match_brute_force(self):
+        rng = random.Random(7)
+        for _ in range(50):
+            busy = []
+            for _ in range(rng.randint(0, 12)):
+                start = rng.randrange(0, 600) * 60
+                busy.append((start, start + rng.randrange(1, 90) * 60))
+            index = IntervalIndex()
+            for interval in busy:
+                index.add(*interval)
+            self.assertEqual(list(index), list(IntervalIndex(busy)))
+            window = (rng.randrange(0, 300) * 60, rng.randrange(300, 700) * 60)
+            self.assertEqual(list(index.free(*window)), brute_free(busy, *window))
+
+class TestCalendarPlanner(unittest.TestCase):
+    def test_plans_gaps_around_meetings(self):
+        day = 9 * HOUR
+        meetings = [(day + 1 * HOUR, day + 2 * HOUR), (day + 2 * HOUR + 20 * 60, day + 3 * HOUR)]
+        calendar = CalendarPlanner(meetings)
+        self.assertEqual(calendar.plans(day, day + 5 * HOUR), [(day, 60), (day + 3 * HOUR, 120)])
+
+        plan = calendar.plan(day, day + 5 * HOUR)
+        first = [s.step for s in plan if s.start < day + HOUR]
+        self.assertEqual([dict(s) for s in first], SessionPlanner().generate_schedule(60))
+        self.assertEqual(plan[0].start, day)
+        self.assertEqual(plan[len(first)].start, day + 3 * HOUR)
+        for timed in plan:
+            self.assertFalse(any(s < timed.end and timed.start < e for s, e in meetings))
+
+    def test_multi_day_window_with_nights_busy(self):
+        days = 14
+        nights = [(d * DAY + 18 * HOUR, (d + 1) * DAY + 9 * HOUR) for d in range(days)]
+        calendar = CalendarPlanner(nights)
+        plans = calendar.plans(9 * HOUR, days * DAY)
+        self.assertEqual(len(plans), days)
+        self.assertTrue(all(minutes == 9 * 60 for _, minutes in plans))
+        plan = calendar.plan(9 * HOUR, days * DAY)
+        self.assertEqual(plan, sorted(plan))
+        self.assertTrue(all(not calendar.busy.is_busy(s.start) for s in plan))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import io
+import os
+import subprocess
+import unittest
+from datetime import datetime
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from cli import TerminalTimer, format_time
+from clock import VirtualClock
+from store import SessionStore
+
+GUI_MODULES = ("tkinter", "_tkinter", "PIL", "pystray", "main", "tray", "trayicon", "channel")
+
+
+class ScriptedKeys:
+    """
+    Plays (time, command) pairs; each read() moves the clock to the next
+    command or the timeout. Afterwards the input behaves as closed.
+    """
+
+    def __init__(self, clock, script):
+        self.clock = clock
+        self.script = list(script)
+        self.timeouts = []
+
+    def read(self, timeout):
+        self.timeouts.append(timeout)
+        if not self.script:
+            if timeout is not None:
+                self.clock.advance(timeout)
+            return None
+        when, command = self.script[0]
+        if timeout is None or when <= self.clock.t + timeout:
+            self.clock.t = max(self.clock.t, when)
+            self.script.pop(0)
+            return [command]
+        self.clock.advance(timeout)
+        return []
+
+
+class MemoryLog:
+    def __init__(self):
+        self.rows = []
+
+    def write(self, row):
+        self.rows.append(row)
+
+    def close(self, timeout=None):
+        pass
+
+
+class KeptStore(SessionStore):
+    def close(self):
+        self.flush()  # Keep the in-memory DB readable after the timer quits
+
+
+class TestTerminalTimer(unittest.TestCase):
+    def run_script(self, script, minutes=60, auto=False):
+        self.clock = VirtualClock(epoch=1767600000.0, start=100.0)
+        self.store = KeptStore(":memory:", clock=self.clock.wall)
+        self.log = MemoryLog()
+        self.out = io.StringIO()
+        self.keys = ScriptedKeys(self.clock, [(100.0 + t, c) for t, c in script])
+        self.timer = TerminalTimer(self.keys, store=self.store, log_writer=self.log, out=self.out,
+                                   clock=self.clock, auto=auto)
+        return self.timer.run(minutes)
+
+    def sessions(self):
+        return self.store.sessions_between(0, float("inf"))
+
+    def test_start_distraction_skip_and_finish(self):
+        # Start, one distraction a minute in, pause, skip to the break, run it out, wait 30 s, quit
+        self.run_script([(0, " "), (60, "d"), (120, "s"), (120, "n"), (121, " "), (121 + 300 + 30, "q")])
+        self.assertEqual(self.log.rows[0][1:], ["24:00", "01:00"])
+        self.assertEqual(self.log.rows[0][0], datetime.fromtimestamp(1767600000.0 + 160).strftime("%Y-%m-%d %H:%M:%S"))
+
+        first, second = self.sessions()
+        self.assertEqual(first['status'], "skipped")
+        self.assertEqual(second['status'], "completed")
+        self.assertAlmostEqual(second['ended_at'] - second['started_at'], 300, delta=0.01)
+        self.assertEqual(self.timer.timer.index, 2)
+        self.assertIn("딴짓 기록됨", self.out.getvalue())
+
+    def test_wakes_on_second_boundaries_and_finishes_on_time(self):
+        self.run_script([(0.4, " "), (2000, "q")])
+        finished = self.sessions()[0]
+        self.assertEqual(finished['status'], "completed")
+        self.assertAlmostEqual(finished['ended_at'] - finished['started_at'], 1500, delta=0.01)
+        # No busy polling: about one wakeup per displayed second
+        self.assertLess(len(self.keys.timeouts), 1500 + 10)
+
+    def test_overtime_is_stored_when_next_step_starts(self):
+        self.run_script([(0, " "), (1500 + 45, " "), (1600, "q")])
+        first = self.sessions()[0]
+        self.assertAlmostEqual(first['overtime'], 45, delta=0.01)
+
+    def test_skip_before_start_and_going_back(self):
+        # Skip the first step unstarted, start the break, go back to the first step, quit
+        self.run_script([(0, "n"), (10, " "), (70, "p"), (80, "q")])
+        skipped, left = self.sessions()
+        self.assertEqual((skipped['step_index'], skipped['status']), (0, "skipped"))
+        self.assertEqual((left['step_index'], left['status']), (1, "interrupted"))
+        self.assertEqual(self.timer.timer.index, 0)
+
+    def test_auto_runs_whole_plan(self):
+        self.assertEqual(self.run_script([(0, " ")], auto=True), 0)
+        self.assertEqual([s['status'] for s in self.sessions()], ["completed"] * 4)
+        self.assertTrue(self.timer.done)
+        self.assertIn("플랜 완료", self.out.getvalue())
+
+    def test_too_short_plan(self):
+        self.assertEqual(self.run_script([], minutes=5), 1)
+
+    def test_format_time(self):
+        self.assertEqual(format_time(1500), "25:00")
+        self.assertEqual(format_time(59.9), "00:59")
+
+
+class TestNoGuiImports(unittest.TestCase):
+    def test_cli_loads_no_gui_modules(self):
+        # A fresh interpreter: this test process may already have imported tkinter
+        code = ("import sys, cli; cli.TerminalTimer; cli.main(['--list', '90']); "
+                "print(' '.join(sorted(sys.modules)))")
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=30)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        loaded = set(result.stdout.splitlines()[-1].split())
+        self.assertEqual(sorted(m for m in loaded if m.split(".")[0] in GUI_MODULES), [])
+        self.assertIn("깊은 집중", result.stdout)
+
+    def test_module_entry_point(self):
+        result = subprocess.run([sys.executable, "-m", "cli", "--list", "60"], cwd=ROOT,
+                                capture_output=True, text=True, timeout=30)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(len(result.stdout.splitlines()), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
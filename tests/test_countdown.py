@@ -0,0 +1,45 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clock import VirtualClock
+from countdown import Countdown, Stopwatch
+
+class TestCountdown(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock(start=50.0)
+        self.countdown = Countdown(60, clock=self.clock)
+
+    def test_remaining_follows_deadline(self):
+        self.countdown.start()
+        self.clock.advance(10.25)
+        self.assertAlmostEqual(self.countdown.remaining(), 49.75)
+        self.assertEqual(self.countdown.seconds_left(), 50)
+        self.assertEqual(self.countdown.next_tick_ms(), 750)
+
+    def test_stop_freezes_remaining(self):
+        self.countdown.start()
+        self.clock.advance(20)
+        self.countdown.stop()
+        self.clock.advance(100)
+        self.assertEqual(self.countdown.seconds_left(), 40)
+        self.countdown.start()
+        self.clock.advance(40)
+        self.assertTrue(self.countdown.expired())
+
+    def test_reset(self):
+        self.countdown.start()
+        self.clock.advance(5)
+        self.countdown.reset(300)
+        self.assertFalse(self.countdown.running)
+        self.assertEqual(self.countdown.seconds_left(), 300)
+
+    def test_stopwatch(self):
+        watch = Stopwatch(start=self.clock.t - 61.5, clock=self.clock)
+        self.assertEqual(watch.seconds(), 61)
+        self.assertEqual(watch.next_tick_ms(), 500)
+
+if __name__ == '__main__':
+    unittest.main()
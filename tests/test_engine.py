@@ -0,0 +1,194 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clock import VirtualClock
+from engine import (SessionEngine, WORK_TIME, BREAK_TIME, STEP, PLAN_DONE, MODE, START, STOP,
+                    FINISH, OVERTIME, OVERTIME_END)
+from planner import seconds_from
+
+class TestSessionEngine(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock(start=1000.0)
+        self.engine = SessionEngine(clock=self.clock)
+        self.events = []
+        self.engine.subscribe(lambda event, session: self.events.append((event, session.id)))
+
+    def test_plan_step_events_and_navigation(self):
+        session = self.engine.create()
+        self.assertTrue(self.engine.load_plan(session, 60))
+        self.assertEqual(self.events, [(STEP, session.id)])
+        self.assertEqual(session.index, 0)
+        self.assertEqual(session.countdown.seconds_left(), 25 * 60)
+
+        self.assertTrue(self.engine.skip_step(session))
+        self.assertTrue(session.is_break)
+        self.assertTrue(self.engine.prev_step(session))
+        self.assertFalse(self.engine.prev_step(session))
+        self.assertFalse(self.engine.load_plan(session, 10))
+
+    def test_finish_moves_to_next_step_with_overtime(self):
+        session = self.engine.create()
+        self.engine.load_plan(session, 60)
+        self.engine.start(session)
+        self.events.clear()
+
+        self.clock.advance(25 * 60 + 3)
+        self.assertEqual(self.engine.advance(), 1)
+        self.assertEqual([e for e, _ in self.events], [FINISH, STEP, OVERTIME])
+        self.assertFalse(session.running)
+        self.assertEqual(session.index, 1)
+        # Overtime counts from the deadline, not from when advance() ran
+        self.assertAlmostEqual(self.engine.overtime(session), 3)
+
+        self.events.clear()
+        self.engine.start(session)
+        self.assertEqual([e for e, _ in self.events], [OVERTIME_END, START])
+
+    def test_last_step_finishes_plan(self):
+        session = self.engine.create()
+        self.engine.load_plan(session, 25)
+        self.engine.start(session)
+        self.clock.advance(25 * 60)
+        self.engine.advance()
+        self.assertEqual(self.events[-1], (PLAN_DONE, session.id))
+        self.assertIsNone(session.overtime_since)
+        self.assertEqual(session.schedule, ())
+
+    def test_legacy_loop_toggles_mode(self):
+        session = self.engine.create()
+        self.engine.start(session)
+        self.clock.advance(WORK_TIME)
+        self.engine.advance()
+        self.assertIn((MODE, session.id), self.events)
+        self.assertTrue(session.is_break)
+        self.assertEqual(session.countdown.seconds_left(), BREAK_TIME)
+
+    def test_stopped_session_is_not_finished(self):
+        session = self.engine.create()
+        self.engine.start(session)
+        self.clock.advance(60)
+        self.engine.stop(session)
+        self.assertEqual(self.events[-1], (STOP, session.id))
+        self.clock.advance(WORK_TIME)
+        self.assertEqual(self.engine.advance(), 0)
+        self.assertIsNone(self.engine.next_deadline())
+        self.assertEqual(session.countdown.seconds_left(), WORK_TIME - 60)
+
+    def test_session_subscriber_only_sees_its_session(self):
+        a, b = self.engine.create(), self.engine.create()
+        seen = []
+        self.engine.subscribe(lambda event, session: seen.append(session.id), a.id)
+        self.engine.load_plan(a, 60)
+        self.engine.load_plan(b, 60)
+        self.assertEqual(seen, [a.id])
+
+    def test_thousands_of_concurrent_sessions(self):
+        sessions = [self.engine.create() for _ in range(5000)]
+        for i, session in enumerate(sessions):
+            self.engine.load_plan(session, 60 + i % 120)
+            self.clock.advance(0.01)
+            self.engine.start(session)
+        self.events.clear()
+
+        # Every session is on a 25 minute warm-up, started 10ms apart
+        self.clock.t = 1000.0 + 25 * 60 + 25
+        self.assertEqual(self.engine.advance(), 2500)
+        self.clock.advance(25)
+        self.assertEqual(self.engine.advance(), 2500)
+        self.assertEqual(sum(1 for event, _ in self.events if event == FINISH), 5000)
+        self.assertTrue(all(s.index == 1 and not s.running for s in sessions))
+        # All sessions share the planner's cached schedule tuples
+        self.assertIs(sessions[0].schedule, sessions[120].schedule)
+
+    def run_step(self, session, overtime=0):
+        """Starts the loaded step, lets it finish and then idles `overtime` seconds."""
+        self.engine.start(session)
+        self.clock.advance(session.countdown.remaining())
+        self.engine.advance()
+        self.clock.advance(overtime)
+
+    def test_plan_on_time_is_not_replanned(self):
+        session = self.engine.create()
+        self.engine.load_plan(session, 240)
+        schedule = session.schedule
+        for _ in range(4):
+            self.run_step(session, overtime=10)  # Within REPLAN_SLACK
+        self.assertIs(session.schedule, schedule)
+        # A skipped step leaves time to spare: the plan is kept, not stretched
+        self.engine.skip_step(session)
+        self.engine.skip_step(session)
+        self.assertIs(session.schedule, schedule)
+
+    def test_budget_counts_from_the_first_start(self):
+        session = self.engine.create()
+        self.engine.load_plan(session, 60)
+        schedule = session.schedule
+        self.assertIsNone(session.plan_deadline)
+        # Loaded at startup, started two hours later
+        self.clock.advance(2 * 3600)
+        state = self.engine.snapshot(session, wall_clock=lambda: self.clock.t)
+        self.assertIsNone(state["plan_deadline"])
+        self.run_step(session)  # Warm-up
+        self.run_step(session)  # Break
+        self.assertIs(session.schedule, schedule)
+        self.assertEqual(session.replans, [])
+        self.assertEqual(session.index, 2)
+
+    def test_overtime_refits_the_rest_at_the_next_work_step(self):
+        session = self.engine.create()
+        self.engine.load_plan(session, 240)
+        self.run_step(session)                  # Warm-up
+        budget_end = session.plan_deadline
+        self.run_step(session, overtime=1200)   # Break, then 20 minutes away
+        self.assertEqual(session.index, 2)
+        self.assertEqual(session.replans, [])  # Loaded at the break's deadline, still on time
+
+        self.run_step(session, overtime=600)
+        self.engine.next_step(session)
+        self.assertEqual(session.index, 4)
+        self.assertEqual(len(session.replans), 1)
+        self.assertLessEqual(seconds_from(session.schedule, 4), budget_end - self.clock.t)
+        self.assertEqual(session.schedule[:4], self.engine.planner.schedule_for(240)[:4])
+
+    def test_pauses_refit_and_can_end_the_plan(self):
+        session = self.engine.create()
+        self.engine.load_plan(session, 60)
+        self.engine.start(session)
+        self.engine.stop(session)
+        self.clock.advance(50 * 60)  # Paused for most of the budget
+        self.run_step(session)
+        # The warm-up's break is kept; once it is over the budget is spent
+        self.assertEqual(session.index, 1)
+        self.events.clear()
+        self.run_step(session)
+        self.assertEqual([e for e, _ in self.events], [OVERTIME_END, START, FINISH, PLAN_DONE])
+        self.assertIsNone(session.overtime_since)
+
+    def test_replans_survive_snapshot_and_restore(self):
+        session = self.engine.create()
+        self.engine.load_plan(session, 240)
+        self.run_step(session)
+        self.run_step(session, overtime=3600)
+        self.engine.next_step(session)
+        self.engine.next_step(session)
+        self.assertTrue(session.replans)
+        state = self.engine.snapshot(session, wall_clock=lambda: self.clock.t + 5000)
+
+        restored = self.engine.create()
+        self.engine.restore(restored, state, wall_clock=lambda: self.clock.t + 5000)
+        self.assertEqual(list(restored.schedule), list(session.schedule))
+        self.assertEqual(restored.index, session.index)
+        self.assertAlmostEqual(restored.plan_deadline, session.plan_deadline, places=2)
+
+    def test_heap_stays_bounded_under_restarts(self):
+        session = self.engine.create()
+        for _ in range(1000):
+            self.engine.start(session)
+            self.engine.stop(session)
+        self.assertLess(len(self.engine._heap), 100)
+
+if __name__ == '__main__':
+    unittest.main()
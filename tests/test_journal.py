@@ -0,0 +1,131 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clock import VirtualClock
+from journal import Journal
+from main import PomodoroApp
+from store import SessionStore
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "focus.journal")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_last_record_wins(self):
+        journal = Journal(self.path)
+        self.assertIsNone(journal.load())
+        journal.record({"index": 0})
+        journal.record({"index": 1})
+        # Readable without close(): os._exit never gets to close it
+        self.assertEqual(Journal(self.path).load(), {"index": 1})
+        journal.close()
+
+    def test_torn_write_is_skipped_and_not_extended(self):
+        with open(self.path, "wb") as f:
+            f.write(b'{"index":3}\n{"index":4,"rem')
+        journal = Journal(self.path)
+        self.assertEqual(journal.load(), {"index": 3})
+        journal.record({"index": 5})
+        journal.close()
+        self.assertEqual(Journal(self.path).load(), {"index": 5})
+
+    def test_compaction_keeps_only_the_latest_snapshot(self):
+        journal = Journal(self.path, compact_every=10)
+        for i in range(25):
+            journal.record({"index": i})
+        journal.close()
+        with open(self.path, "rb") as f:
+            self.assertLessEqual(len(f.read().splitlines()), 10)
+        self.assertEqual(Journal(self.path).load(), {"index": 24})
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+class TestResume(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "focus.journal")
+        self.store = SessionStore(":memory:")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_app(self, clock):
+        root = MagicMock()
+        app = PomodoroApp(root, store=self.store, journal=Journal(self.path), log_writer=MagicMock())
+        app.countdown.clock = clock
+        for name in ("mode_label", "time_label", "workout_label", "start_button", "stop_button",
+                     "reset_button", "distraction_btn", "overtime_label", "plan_status_label"):
+            setattr(app, name, MagicMock())
+        return app
+
+    def test_resume_after_crash_restores_step_and_deadline(self):
+        clock = VirtualClock(start=1000.0)
+        app = self.make_app(clock)
+        app.resume_or_start()  # Nothing journaled yet: default plan
+        self.assertEqual(len(app.schedule), 4)
+        app.skip_step()
+        app.start_timer()
+        deadline = app.journal.load()["deadline"]  # Wall-clock deadline
+        self.assertAlmostEqual(deadline - time.time(), 5 * 60, delta=0.05)
+        # Crash: no perform_quit, nothing closed or flushed
+
+        clock = VirtualClock(start=5000.0)  # New process, unrelated monotonic origin
+        resumed = self.make_app(clock)
+        before = time.time()
+        resumed.resume_or_start()
+        after = time.time()
+        self.assertEqual(resumed.current_step_index, 1)
+        self.assertTrue(resumed.is_break)
+        self.assertTrue(resumed.running)
+        # The fake clock stands still, so this is what was left at restore time
+        self.assertLessEqual(resumed.countdown.remaining(), deadline - before)
+        self.assertGreaterEqual(resumed.countdown.remaining(), deadline - after)
+        sessions = self.store.sessions_between(0, float("inf"))
+        self.assertEqual([s['status'] for s in sessions], ["skipped", "interrupted", "running"])
+
+    def test_deadline_that_passed_while_down_finishes_with_overtime(self):
+        clock = VirtualClock(start=1000.0)
+        app = self.make_app(clock)
+        app.start_smart_plan(60)
+        app.start_timer()
+        state = app.journal.load()
+        state["deadline"] -= 25 * 60 + 30  # Ran out 30s before the restart
+        app.journal.record(state)
+
+        resumed = self.make_app(VirtualClock(start=1000.0))
+        resumed.finish_timer = MagicMock()
+        before = time.time()
+        resumed.resume_or_start()
+        after = time.time()
+        resumed.finish_timer.assert_called_once()
+        # 30 s overdue at the wall-clock deadline, plus however long restoring took
+        deadline_wall = state["deadline"]
+        self.assertLessEqual(resumed.countdown.deadline, 1000.0 - (before - deadline_wall))
+        self.assertGreaterEqual(resumed.countdown.deadline, 1000.0 - (after - deadline_wall))
+
+    def test_clean_quit_resumes_paused(self):
+        clock = VirtualClock(start=1000.0)
+        app = self.make_app(clock)
+        app.start_smart_plan(60)
+        app.start_timer()
+        clock.advance(60)
+        app.root.destroy = MagicMock()
+        with unittest.mock.patch("os._exit"):
+            app.perform_quit()
+
+        resumed = self.make_app(VirtualClock(start=1000.0))
+        resumed.resume_or_start()
+        self.assertFalse(resumed.running)
+        self.assertEqual(resumed.current_step_index, 0)
+        self.assertEqual(resumed.time_left, 25 * 60 - 60)
+
+if __name__ == '__main__':
+    unittest.main()
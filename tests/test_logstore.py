@@ -0,0 +1,220 @@
+import contextlib
+import io
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import analyze
+from logstore import LOG_HEADER, LogManager, data_dir, data_path, open_log
+from logwriter import LogWriter
+
+
+def rows_for(day, hours=(9, 14), per_hour=3):
+    return [[f"{day} {hour:02}:{minute * 10:02}:00", "20:00", f"{5 + minute:02}:00"]
+            for hour in hours for minute in range(per_hour)]
+
+
+class TestLogManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = os.path.join(self.tmp.name, "data")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, rows, manager=None, **kwargs):
+        manager = manager or LogManager(self.dir, **kwargs)
+        writer = LogWriter(manager.path, header=LOG_HEADER, rotation=manager, flush_interval=None)
+        for row in rows:
+            writer.write(row)
+            writer.flush()  # One batch per row, so every row is checked for rotation
+        self.assertTrue(writer.close())
+        return manager
+
+    def test_rotates_by_month(self):
+        rows = rows_for("2026-01-30") + rows_for("2026-01-31") + rows_for("2026-02-01") + rows_for("2026-03-02")
+        manager = self.write(rows)
+
+        segments = manager.segments()
+        self.assertEqual([(s["first"], s["last"], s["rows"]) for s in segments],
+                         [("2026-01-30 09:00:00", "2026-01-31 14:20:00", 12),
+                          ("2026-02-01 09:00:00", "2026-02-01 14:20:00", 6)])
+        self.assertEqual(segments[0]["days"], {"2026-01-30": 6, "2026-01-31": 6})
+        self.assertTrue(os.path.isfile(os.path.join(self.dir, segments[0]["file"])))
+        # March is still the active, uncompressed log
+        with open(manager.path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0], ",".join(LOG_HEADER))
+        self.assertEqual(len(lines), 7)
+
+        self.assertEqual(manager.report().total, len(rows))
+        # A fresh manager reads the sidecar indexes back
+        self.assertEqual(LogManager(self.dir).segments(), segments)
+
+    def test_rotates_by_size(self):
+        manager = self.write(rows_for("2026-01-05", hours=range(24), per_hour=6), max_bytes=1024)
+        segments = manager.segments()
+        self.assertGreater(len(segments), 2)
+        self.assertEqual(manager.report(start="2026-01-06").total, 0)
+        self.assertEqual(manager.report().total, 144)
+        for earlier, later in zip(segments, segments[1:]):
+            self.assertLess(earlier["last"], later["first"])
+
+    def test_report_matches_full_scan(self):
+        rows = []
+        for day in ("2026-01-30", "2026-01-31", "2026-02-01", "2026-02-02", "2026-03-01"):
+            rows += rows_for(day)
+        manager = self.write(rows)
+        flat = os.path.join(self.tmp.name, "flat.csv")
+        writer = LogWriter(flat, header=LOG_HEADER)
+        for row in rows:
+            writer.write(row)
+        writer.close()
+
+        expected, report = analyze(flat), manager.report()
+        self.assertEqual(report.by_day, expected.by_day)
+        self.assertEqual(report.by_hour, expected.by_hour)
+        self.assertEqual(report.by_minute, expected.by_minute)
+
+    def test_range_reads_open_only_overlapping_segments(self):
+        rows = []
+        for month in range(1, 7):
+            rows += rows_for(f"2026-{month:02}-10") + rows_for(f"2026-{month:02}-20")
+        manager = self.write(rows)
+        self.assertEqual(len(manager.segments()), 5)  # June is active
+
+        # Mid-March to mid-April: two partial segments
+        report = manager.report("2026-03-15", "2026-04-15")
+        self.assertEqual(report.by_day, {"2026-03-20": 6, "2026-04-10": 6})
+        self.assertEqual(manager.opened, 2)
+
+        # Whole months come from the indexes alone: the data files are not needed
+        manager.opened = 0
+        february = os.path.join(self.dir, manager.segments("2026-02-01", "2026-03-01")[0]["file"])
+        os.remove(february)
+        report = manager.report("2026-02-01", "2026-03-01")
+        self.assertEqual(report.by_day, {"2026-02-10": 6, "2026-02-20": 6})
+        self.assertEqual(report.by_hour, {9: 6, 14: 6})
+        self.assertEqual(manager.opened, 0)
+
+        chunks = b"".join(manager.iter_chunks("2026-05-20", "2026-06-11"))
+        self.assertEqual(chunks.count(b"\n"), 12)
+
+    def test_adopts_legacy_log(self):
+        legacy = os.path.join(self.tmp.name, "focus_log.csv")
+        self.write([["2025-12-01 10:00:00", "10:00"]], LogManager(os.path.join(self.tmp.name, "old")))
+        os.replace(os.path.join(self.tmp.name, "old", "focus_log.csv"), legacy)
+
+        manager = self.write(rows_for("2026-01-05"), legacy=legacy)
+        self.assertFalse(os.path.exists(legacy))
+        self.assertEqual([s["first"] for s in manager.segments()], ["2025-12-01 10:00:00"])
+        self.assertEqual(manager.report().total, 7)
+
+    def test_lost_index_is_rebuilt(self):
+        manager = self.write(rows_for("2026-01-05") + rows_for("2026-02-05"))
+        index = manager.segments()[0]
+        os.remove(os.path.join(self.dir, index["file"][:-len(".csv.gz")] + ".idx.json"))
+        self.assertEqual(LogManager(self.dir).segments(), [index])
+
+    def test_leftover_source_after_crash_is_not_duplicated(self):
+        manager = self.write(rows_for("2026-01-05"))
+        with open(manager.path, "rb") as f:
+            active = f.read()
+        manager.rotate()
+        with open(manager.path, "wb") as f:
+            f.write(active)  # Stopped after the index was written, before the source was removed
+        manager.rotate()
+        self.assertEqual(len(manager.segments()), 1)
+        self.assertEqual(manager.report().total, 6)
+
+    def report_output(self, *args, **kwargs):
+        from main import run_report
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            status = run_report(*args, **kwargs)
+        return status, out.getvalue()
+
+    def test_report_date_range_on_a_plain_file(self):
+        flat = os.path.join(self.tmp.name, "flat.csv")
+        writer = LogWriter(flat, header=LOG_HEADER)
+        for row in rows_for("2025-01-30") + rows_for("2025-03-02"):
+            writer.write(row)
+        writer.close()
+        self.assertIn("총 딴짓 기록: 12회", self.report_output(flat)[1])
+        status, out = self.report_output(flat, since="2025-03-01")
+        self.assertEqual(status, 0)
+        self.assertIn("총 딴짓 기록: 6회", out)
+        self.assertNotIn("2025-01-30", out)
+        self.assertIn("총 딴짓 기록: 6회", self.report_output(flat, until="2025-01-30")[1])
+
+    def test_report_adopts_legacy_log(self):
+        self.write(rows_for("2026-01-05"), LogManager(os.path.join(self.tmp.name, "old")))
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        try:
+            os.replace(os.path.join("old", "focus_log.csv"), "focus_log.csv")
+            with patch.dict(os.environ, {"FOCUS_DATA_DIR": self.dir}):
+                status, out = self.report_output("")
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(status, 0)
+        self.assertIn("총 딴짓 기록: 6회", out)
+        self.assertEqual(len(LogManager(self.dir).segments()), 1)
+
+    def test_data_dir(self):
+        with patch.dict(os.environ, {"FOCUS_DATA_DIR": self.dir}):
+            self.assertEqual(data_dir(), self.dir)
+            writer = open_log(legacy=None)
+            self.assertEqual(writer.path, os.path.join(self.dir, "focus_log.csv"))
+            self.assertEqual(writer.header, LOG_HEADER)
+        with patch.dict(os.environ, {"FOCUS_DATA_DIR": ""}):
+            self.assertTrue(os.path.isabs(data_dir()))
+
+    def test_data_path_moves_files_from_the_working_directory(self):
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        try:
+            with open("focus.journal", "w") as f:
+                f.write("{}\n")
+            with patch.dict(os.environ, {"FOCUS_DATA_DIR": self.dir}):
+                path = data_path("focus.journal")
+                self.assertEqual(path, os.path.join(self.dir, "focus.journal"))
+                self.assertEqual(data_path("focus.db"), os.path.join(self.dir, "focus.db"))
+        finally:
+            os.chdir(cwd)
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, "focus.journal")))
+        with open(path) as f:
+            self.assertEqual(f.read(), "{}\n")
+
+    def test_data_path_checkpoints_a_database_before_moving_it(self):
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        try:
+            # An older version still running: its WAL can't be folded in, the file stays
+            conn = sqlite3.connect("focus.db")
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute("CREATE TABLE plans (id INTEGER PRIMARY KEY)")
+                conn.execute("INSERT INTO plans VALUES (1)")
+            # Left behind by a crash: the committed row is only in the -wal file
+            for suffix in ("", "-wal"):
+                shutil.copyfile("focus.db" + suffix, "crashed.db" + suffix)
+            with patch.dict(os.environ, {"FOCUS_DATA_DIR": self.dir}):
+                self.assertEqual(data_path("focus.db"), os.path.join(self.tmp.name, "focus.db"))
+                conn.close()
+                path = data_path("crashed.db")
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(os.listdir(self.dir), ["crashed.db"])
+        conn = sqlite3.connect(path)
+        self.assertEqual(conn.execute("SELECT id FROM plans").fetchall(), [(1,)])
+        conn.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import threading
+import unittest
+import tempfile
+from unittest.mock import MagicMock
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logwriter import LogWriter
+
+class TestLogWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "log.csv")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def read_lines(self):
+        with open(self.path, encoding="utf-8") as f:
+            return f.read().splitlines()
+
+    def test_close_flushes_everything(self):
+        writer = LogWriter(self.path, header=["A", "B"], flush_interval=None)
+        for i in range(500):
+            writer.write([i, "x"])
+        self.assertTrue(writer.close())
+        lines = self.read_lines()
+        self.assertEqual(lines[0], "A,B")
+        self.assertEqual(len(lines), 501)
+        self.assertEqual(lines[-1], "499,x")
+        # Writes after close are refused
+        self.assertFalse(writer.write([1, 2]))
+
+    def test_flush_waits_for_rows(self):
+        writer = LogWriter(self.path, header=["A"], flush_interval=60, fsync=True)
+        writer.write(["one"])
+        self.assertTrue(writer.flush(timeout=5))
+        self.assertEqual(self.read_lines(), ["A", "one"])
+        writer.close()
+
+    def test_header_written_once(self):
+        for _ in range(2):
+            writer = LogWriter(self.path, header=["A"])
+            writer.write(["row"])
+            writer.close()
+        self.assertEqual(self.read_lines(), ["A", "row", "row"])
+
+    def test_ring_buffer_overflow_drops_oldest(self):
+        writer = LogWriter(self.path, capacity=2)
+        writer._cond = threading.Condition()  # As if started, with no worker draining
+        with writer._cond:
+            writer._buffer.extend([[1], [2]])
+            writer._pending = 2
+            writer.write([3])
+        self.assertEqual(writer.dropped, 1)
+        self.assertEqual(list(writer._buffer), [[2], [3]])
+
+    def test_write_failure_closes_the_file(self):
+        writer = LogWriter(self.path, flush_interval=None)
+        writer.write(["ok"])
+        writer.flush()
+        broken = writer._file
+        writer._writer = MagicMock(**{"writerows.side_effect": OSError("disk full")})
+        writer.write(["lost"])
+        writer.flush()
+        self.assertEqual(writer.dropped, 1)
+        self.assertTrue(broken.closed)
+        self.assertIsNone(writer._file)
+        # The next batch reopens the file
+        writer.write(["again"])
+        self.assertTrue(writer.close())
+        self.assertEqual(self.read_lines(), ["ok", "again"])
+
+if __name__ == '__main__':
+    unittest.main()
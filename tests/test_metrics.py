@@ -0,0 +1,104 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clock import VirtualClock, VirtualScheduler
+from main import PomodoroApp
+from metrics import NULL_METRICS, Histogram, Metrics
+from store import SessionStore
+from ticker import Ticker
+
+class TestHistogram(unittest.TestCase):
+    def test_quantiles_are_bucket_bounds(self):
+        h = Histogram()
+        for ms in [0.3] * 90 + [15] * 9 + [7000]:
+            h.observe(ms)
+        self.assertEqual(h.count, 100)
+        self.assertEqual(h.quantile(0.5), 0.5)
+        self.assertEqual(h.quantile(0.99), 20)
+        self.assertEqual(h.quantile(1.0), 7000)
+        self.assertEqual(h.as_dict()["buckets"], {"0.5": 90, "20": 9, "inf": 1})
+
+class TestMetrics(unittest.TestCase):
+    def test_timer_and_export(self):
+        clock = VirtualClock(start=10.0)
+        metrics = Metrics(clock=clock)
+        with metrics.timer("handler.x"):
+            clock.advance(0.004)
+        metrics.observe_lag("tick.lag", 0.25)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = metrics.export(os.path.join(tmp, "metrics.json"))
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.assertEqual(os.listdir(tmp), ["metrics.json"])
+        self.assertEqual(data["histograms"]["handler.x"]["count"], 1)
+        self.assertAlmostEqual(data["histograms"]["handler.x"]["max_ms"], 4.0)
+        self.assertEqual(data["counters"], {"stalls": 1})
+
+    def test_null_metrics_record_nothing(self):
+        with NULL_METRICS.timer("x"):
+            pass
+        NULL_METRICS.observe_lag("tick.lag", 5)
+        self.assertEqual(NULL_METRICS.snapshot(), {})
+        self.assertIsNone(NULL_METRICS.export("unused.json"))
+        self.assertFalse(os.path.exists("unused.json"))
+
+    def test_ticker_records_lag_and_stalls(self):
+        clock = VirtualClock(start=10.0)
+        scheduler = VirtualScheduler(clock, lag=0.5)  # The Tk loop was blocked for half a second
+        metrics = Metrics()
+        ticker = Ticker(scheduler, clock=clock, metrics=metrics)
+        ticker.schedule("countdown", 1000, lambda: None)
+        scheduler.run_next()
+        self.assertEqual(metrics.histograms["tick.lag"].count, 1)
+        self.assertEqual(metrics.histograms["lag.countdown"].max, 500)
+        self.assertEqual(metrics.histograms["job.countdown"].count, 1)
+        self.assertEqual(metrics.counters["stalls"], 1)
+
+class TestAppMetrics(unittest.TestCase):
+    def make_app(self, metrics=None):
+        root = MagicMock()
+        app = PomodoroApp(root, metrics=metrics, store=SessionStore(":memory:"), journal=MagicMock(),
+                          log_writer=MagicMock())
+        for name in ("mode_label", "time_label", "workout_label", "start_button", "stop_button",
+                     "reset_button", "distraction_btn", "overtime_label", "plan_status_label"):
+            setattr(app, name, MagicMock())
+        return app
+
+    def test_disabled_by_default(self):
+        app = self.make_app()
+        self.assertIs(app.metrics, NULL_METRICS)
+        self.assertFalse(app.ticker.pending("watchdog"))
+
+    def test_handlers_are_timed_and_exported_on_demand(self):
+        metrics = Metrics()
+        app = self.make_app(metrics)
+        self.assertTrue(app.ticker.pending("watchdog"))
+        app.root.bind.assert_any_call("<Control-M>", app.export_metrics)
+        app.start_smart_plan(60)
+        app.start_timer()
+        app.log_distraction()
+        app.skip_step()
+        app.finish_timer()
+        for name in ("handler.log_distraction", "handler.load_step", "handler.finish", "handler.finish_raise"):
+            self.assertEqual(metrics.histograms[name].count, 1, name)
+        with tempfile.TemporaryDirectory() as tmp:
+            app.metrics_path = os.path.join(tmp, "focus_metrics.json")
+            app.export_metrics()
+            with open(app.metrics_path, encoding="utf-8") as f:
+                self.assertIn("handler.load_step", json.load(f)["histograms"])
+
+    def test_relative_export_path_lands_in_the_data_directory(self):
+        app = self.make_app(Metrics())
+        with tempfile.TemporaryDirectory() as tmp, patch.dict(os.environ, {"FOCUS_DATA_DIR": tmp}):
+            path = app.export_metrics()
+            self.assertEqual(path, os.path.join(tmp, "focus_metrics.json"))
+            self.assertTrue(os.path.isfile(path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import SessionEngine
+from optimal_planner import Block, OptimalPlanner
+from planner import SessionPlanner
+
+def focus(schedule):
+    return sum(s['duration'] for s in schedule if s['type'] == 'WORK') // 60
+
+def brute_focus(catalog, minutes, prev=None):
+    """Exhaustive search over the same rules (small budgets only)."""
+    best = 0
+    for block in catalog:
+        if prev is None and not block.opening:
+            continue
+        if prev is not None and block.follows is not None and prev.name not in block.follows:
+            continue
+        for work in block.lengths():
+            if work > minutes:
+                continue
+            best = max(best, work)
+            if not block.final and work + block.rest <= minutes:
+                best = max(best, work + brute_focus(catalog, minutes - work - block.rest, block))
+    return best
+
+class TestOptimalPlanner(unittest.TestCase):
+    def setUp(self):
+        self.planner = OptimalPlanner()
+
+    def test_never_worse_than_greedy(self):
+        greedy = SessionPlanner()
+        improved = 0
+        for minutes in range(0, 2001):
+            schedule = self.planner.generate_schedule(minutes)
+            self.assertLessEqual(sum(s['duration'] for s in schedule), minutes * 60, minutes)
+            self.assertGreaterEqual(focus(schedule), focus(greedy.generate_schedule(minutes)), minutes)
+            improved += focus(schedule) > focus(greedy.generate_schedule(minutes))
+        self.assertGreater(improved, 0)
+        # 120m: greedy takes two peaks, the optimum swaps one for standard + wrap-up
+        self.assertEqual(focus(greedy.generate_schedule(120)), 95)
+        self.assertEqual(self.planner.focus_minutes(120), 100)
+
+    def test_matches_exhaustive_search(self):
+        catalog = (
+            Block("warmup", 20, 5, "a", "b", opening=True, follows=()),
+            Block("long", 50, 10, "c", "d"),
+            Block("short", 15, 3, "e", "f", min_work=10, follows=("long",)),
+            Block("end", 12, 0, "g", final=True, follows=("short", "warmup")),
+        )
+        planner = OptimalPlanner(catalog)
+        for minutes in range(0, 160):
+            self.assertEqual(planner.focus_minutes(minutes), brute_focus(catalog, minutes), minutes)
+            self.assertEqual(focus(planner.generate_schedule(minutes)), brute_focus(catalog, minutes))
+
+    def test_ordering_rules_hold(self):
+        labels = [s.label for s in self.planner.schedule_for(600)]
+        self.assertEqual(labels[0], "기본 집중 🚀")
+        self.assertEqual(labels.count("기본 집중 🚀"), 1)
+        self.assertLessEqual(labels.count("집중 🧠"), 1)
+        if "마무리 🏁" in labels:
+            self.assertEqual(labels[-1], "마무리 🏁")
+
+    def test_table_is_reused_across_queries(self):
+        self.planner.schedule_for(600)
+        rows = len(self.planner._best)
+        self.assertIs(self.planner.schedule_for(600), self.planner.schedule_for(600))
+        self.planner.schedule_for(300)
+        self.assertEqual(len(self.planner._best), rows)
+
+    def test_drives_the_engine(self):
+        engine = SessionEngine(self.planner)
+        session = engine.create()
+        self.assertTrue(engine.load_plan(session, 120))
+        self.assertEqual(len(session.schedule), 7)
+        self.assertFalse(engine.load_plan(session, 20))
+
+    def test_replan_follows_the_last_block(self):
+        schedule = self.planner.schedule_for(240)
+        # After the warm-up: the best continuation for 100m
+        replanned = self.planner.replan(schedule, 2, 100)
+        self.assertEqual(tuple(replanned[:2]), tuple(schedule[:2]))
+        self.assertLessEqual(replanned.seconds_from(2), 100 * 60)
+        self.assertNotIn("기본 집중 🚀", [s.label for s in replanned[2:]])
+        self.assertEqual(focus(replanned[2:]), 84)  # Peak 35 + standard 25 + wrap-up 24
+
+        # After the standard block only the wrap-up may follow
+        index = [s.label for s in replanned].index("집중 🧠") + 2
+        self.assertEqual([s.label for s in self.planner.replan(replanned, index, 60)[index:]], ["마무리 🏁"])
+        # After the wrap-up nothing may
+        self.assertEqual(len(self.planner.replan(replanned, len(replanned), 60)), len(replanned))
+
+    def test_duplicate_block_names_rejected(self):
+        with self.assertRaises(ValueError):
+            OptimalPlanner([Block("a", 25, opening=True), Block("a", 30)])
+
+if __name__ == '__main__':
+    unittest.main()
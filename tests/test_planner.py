@@ -5,7 +5,7 @@ import os
 # Add parent directory
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from planner import SessionPlanner
+from planner import SessionPlanner, Spliced, Step, StepType, block_counts, iter_schedule, seconds_from
 
 class TestSessionPlanner(unittest.TestCase):
     def setUp(self):
@@ -34,8 +34,8 @@ class TestSessionPlanner(unittest.TestCase):
         
         schedule = self.planner.generate_schedule(60)
         self.assertEqual(len(schedule), 4)
-        self.assertEqual(schedule[0]['label'], "Standard Focus 🚀")
-        self.assertEqual(schedule[2]['label'], "Focus 🧠")
+        self.assertEqual(schedule[0]['label'], "기본 집중 🚀")
+        self.assertEqual(schedule[2]['label'], "집중 🧠")
         # No wrap up because exactly 0 left
 
     def test_long_session(self):
@@ -46,9 +46,97 @@ class TestSessionPlanner(unittest.TestCase):
         
         schedule = self.planner.generate_schedule(120)
         labels = [s['label'] for s in schedule]
-        self.assertIn("Deep Focus 🔥", labels) # 35m
-        self.assertEqual(labels.count("Deep Focus 🔥"), 2) 
-        self.assertNotIn("Wrap-up 🏁", labels)
+        self.assertIn("깊은 집중 🔥", labels) # 35m
+        self.assertEqual(labels.count("깊은 집중 🔥"), 2) 
+        self.assertNotIn("마무리 🏁", labels)
+
+    def test_block_counts_closed_form(self):
+        self.assertIsNone(block_counts(24))
+        self.assertEqual(block_counts(27), (False, 0, False, False, 0))
+        # 30 + 2*45 + 25 + 5 + 12 = 162
+        self.assertEqual(block_counts(162), (True, 2, True, True, 12))
+
+    def test_schedule_cache_is_immutable_and_shared(self):
+        cached = self.planner.schedule_for(240)
+        self.assertIs(cached, self.planner.schedule_for(240))
+        with self.assertRaises(TypeError):
+            cached[0]['duration'] = 1
+        # generate_schedule hands out independent copies
+        schedule = self.planner.generate_schedule(240)
+        schedule[0]['duration'] = 1
+        self.assertEqual(self.planner.generate_schedule(240)[0]['duration'], 25 * 60)
+
+    def test_generate_schedules_batch(self):
+        batch = self.planner.generate_schedules(range(25, 601))
+        self.assertEqual(len(batch), 576)
+        for minutes in (25, 60, 333, 600):
+            self.assertEqual([dict(s) for s in batch[minutes]], self.planner.generate_schedule(minutes))
+
+    def test_steps_are_slotted_and_dict_compatible(self):
+        step = self.planner.schedule_for(60)[0]
+        self.assertIsInstance(step, Step)
+        self.assertFalse(hasattr(step, "__dict__"))
+        self.assertIs(step.type, StepType.WORK)
+        self.assertEqual(step['type'], 'WORK')
+        self.assertEqual(dict(step), {"type": "WORK", "duration": 25 * 60, "label": "기본 집중 🚀"})
+        self.assertEqual(Step.coerce(dict(step)), step)
+        with self.assertRaises(KeyError):
+            step['missing']
+        # Fixed steps are shared, not copied per schedule
+        self.assertIs(self.planner.schedule_for(600)[0], step)
+
+    def test_lazy_schedule_matches_materialized_plan(self):
+        for minutes in (0, 25, 27, 60, 162, 600, 1000):
+            expected = self.planner.generate_schedule(minutes)
+            schedule = self.planner.schedule_for(minutes)
+            self.assertEqual(len(schedule), len(expected))
+            self.assertEqual([dict(s) for s in schedule], expected)
+            self.assertEqual([dict(schedule[i]) for i in range(-len(expected), 0)], expected)
+            self.assertEqual([dict(s) for s in schedule[1::3]], expected[1::3])
+            with self.assertRaises(IndexError):
+                schedule[len(expected)]
+
+    def test_week_long_plan_is_not_materialized(self):
+        week = 7 * 24 * 60
+        schedule = self.planner.schedule_for(week)
+        self.assertGreater(len(schedule), 400)
+        self.assertLess(sys.getsizeof(schedule), 100)
+        self.assertEqual(dict(schedule[-1]), self.planner.generate_schedule(week)[-1])
+        steps = iter_schedule(week)
+        self.assertEqual(next(steps)['label'], "기본 집중 🚀")
+        self.assertEqual(sum(s.duration for s in steps) + 25 * 60,
+                         sum(s['duration'] for s in self.planner.generate_schedule(week)))
+
+    def test_seconds_from_closed_form(self):
+        for minutes in (0, 25, 27, 60, 162, 600):
+            schedule = self.planner.schedule_for(minutes)
+            for index in range(len(schedule) + 1):
+                self.assertEqual(schedule.seconds_from(index), sum(s.duration for s in schedule[index:]))
+
+    def test_replan_keeps_prefix_and_fits_the_rest(self):
+        schedule = self.planner.schedule_for(240)
+        replanned = self.planner.replan(schedule, 4, 100)
+        self.assertEqual(tuple(replanned[:4]), tuple(schedule[:4]))
+        # What greedy does after its warm-up block: two peaks, then a 10m wrap-up
+        self.assertEqual([s.label for s in replanned[4:]], ["깊은 집중 🔥", "휴식 🌿", "깊은 집중 🔥", "휴식 🌿", "마무리 🏁"])
+        self.assertEqual(replanned.seconds_from(4), 100 * 60)
+
+        # Splicing again stays flat and indexable
+        again = self.planner.replan(replanned, 6, 20)
+        self.assertEqual([s.label for s in again[6:]], ["마무리 🏁"])
+        self.assertEqual(len(again._pieces), 3)
+        self.assertEqual(again[-1].duration, 20 * 60)
+        self.assertEqual(seconds_from(again, 2), sum(s.duration for s in again[2:]))
+        self.assertEqual(len(self.planner.replan(schedule, 2, 5)), 2)
+        self.assertIs(self.planner.replan(schedule, 0, 60), self.planner.schedule_for(60))
+
+    def test_spliced_tuple(self):
+        steps = tuple(self.planner.schedule_for(60))
+        spliced = Spliced(steps, 1, steps, offset=2)
+        self.assertEqual(list(spliced), [steps[0], steps[2], steps[3]])
+        self.assertEqual(seconds_from(spliced, 1), steps[2].duration + steps[3].duration)
+        with self.assertRaises(IndexError):
+            spliced[3]
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import time
+import sys
+import os
+
+# Add parent directory and benchmarks (baseline helpers)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, "benchmarks"))
+
+from planner import SessionPlanner
+from bench_planner import schedule_digest, load_baseline
+
+MAX_MINUTES = 10000
+
+class TestPlannerProperties(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        planner = SessionPlanner()
+        cls.schedules = {m: planner.generate_schedule(m) for m in range(MAX_MINUTES + 1)}
+
+    def test_total_duration_fits_budget(self):
+        for minutes, schedule in self.schedules.items():
+            self.assertLessEqual(sum(s['duration'] for s in schedule), minutes * 60, minutes)
+
+    def test_work_and_break_alternate(self):
+        for minutes, schedule in self.schedules.items():
+            types = [s['type'] for s in schedule]
+            if types:
+                self.assertEqual(types[0], 'WORK', minutes)
+            for a, b in zip(types, types[1:]):
+                self.assertNotEqual(a, b, minutes)
+
+    def test_25_minute_minimum(self):
+        for minutes, schedule in self.schedules.items():
+            if minutes < 25:
+                self.assertEqual(schedule, [], minutes)
+            else:
+                self.assertEqual(schedule[0]['duration'], 25 * 60, minutes)
+            for step in schedule:
+                if step['type'] == 'WORK':
+                    self.assertGreaterEqual(step['duration'], 10 * 60, minutes)
+
+    def test_leftover_is_small(self):
+        # Greedy packing never wastes a full standard block
+        for minutes, schedule in self.schedules.items():
+            if minutes >= 25:
+                unused = minutes * 60 - sum(s['duration'] for s in schedule)
+                self.assertLess(unused, 25 * 60, minutes)
+
+    def test_matches_stored_baseline(self):
+        baseline = load_baseline()
+        start, stop = baseline["durations"]
+        schedules = (self.schedules[m] for m in range(start, stop + 1))
+        self.assertEqual(schedule_digest(schedules), baseline["digest"],
+                         "Planner output changed. If intended, run benchmarks/bench_planner.py --update")
+
+    def test_batch_matches_single_calls(self):
+        planner = SessionPlanner()
+        batch = planner.generate_schedules(range(MAX_MINUTES + 1))
+        for minutes in range(0, MAX_MINUTES + 1, 7):
+            self.assertEqual([dict(s) for s in batch[minutes]], self.schedules[minutes])
+
+    def test_single_call_latency(self):
+        # Generous bound; precise numbers live in benchmarks/bench_planner.py
+        planner = SessionPlanner()
+        start = time.perf_counter()
+        for _ in range(1000):
+            planner.generate_schedule(600)
+        self.assertLess((time.perf_counter() - start) / 1000, 0.001)
+
+if __name__ == '__main__':
+    unittest.main()
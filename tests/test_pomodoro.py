@@ -6,16 +6,19 @@ import os
 # Add parent directory to path to import main
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from clock import VirtualClock, VirtualScheduler
 from main import PomodoroApp
+from store import SessionStore
 import tkinter as tk
 
+
 class TestPomodoro(unittest.TestCase):
     def setUp(self):
         # Mock Tkinter root
         self.root = MagicMock()
         # Mock queue to avoid threading issues in test
         self.root.after = MagicMock() 
-        self.app = PomodoroApp(self.root)
+        self.app = PomodoroApp(self.root, store=SessionStore(":memory:"), journal=MagicMock(), log_writer=MagicMock())
         # Disable queue checking for unit tests
         self.app.process_queue = MagicMock()
 
@@ -32,10 +35,53 @@ class TestPomodoro(unittest.TestCase):
         self.app.reset_button = MagicMock()
         self.app.distraction_btn = MagicMock()
         
+        clock = VirtualClock(start=1000.0)
+        self.app.countdown.clock = clock
+        
         self.app.start_timer()
         self.assertTrue(self.app.running)
+        # Remaining time comes from the deadline: full 25:00 at start
+        self.assertEqual(self.app.time_left, 25*60)
+        clock.advance(1)
         self.assertEqual(self.app.time_left, 25*60 - 1)
 
+    def test_timer_drift_under_slow_event_loop(self):
+        # Every after() callback fires 80ms late and each tick costs 40ms,
+        # like a loaded machine. The old decrement chain drifted ~2 minutes here.
+        clock = VirtualClock(start=1000.0)
+        loop = VirtualScheduler(clock, lag=0.08, cost=0.04)
+        self.root.after = loop.after
+        self.root.after_cancel = loop.after_cancel
+        self.app.countdown.clock = clock
+        self.app.finish_timer = MagicMock(side_effect=lambda: loop.stop())
+        self.app.start_button = MagicMock()
+        self.app.stop_button = MagicMock()
+        self.app.reset_button = MagicMock()
+        self.app.time_label = MagicMock()
+        
+        self.app.time_left = 35 * 60 # Deep Focus block
+        started = clock.t
+        self.app.start_timer()
+        loop.run()
+        
+        self.app.finish_timer.assert_called_once()
+        drift = clock.t - started - 35 * 60
+        self.assertGreaterEqual(drift, 0)
+        self.assertLess(drift, 0.2) # At most one late tick, never accumulated
+
+    def test_timer_catches_up_after_stall(self):
+        clock = VirtualClock(start=1000.0)
+        self.app.countdown.clock = clock
+        self.app.start_button = MagicMock()
+        self.app.stop_button = MagicMock()
+        self.app.reset_button = MagicMock()
+        self.app.time_label = MagicMock()
+        
+        self.app.start_timer()
+        clock.advance(600) # e.g. laptop sleep
+        self.app.run_timer()
+        self.app.time_label.config.assert_called_with(text="15:00")
+
     def test_finish_timer_transition(self):
         # Mock GUI elements
         self.app.start_button = MagicMock()
@@ -71,6 +117,28 @@ class TestPomodoro(unittest.TestCase):
         # 4. Timer NOT running (User must click Start)
         self.assertFalse(self.app.running)
 
+    def test_session_history(self):
+        for name in ("start_button", "stop_button", "reset_button", "mode_label", "time_label",
+                     "overtime_label", "distraction_btn", "plan_status_label", "workout_label"):
+            setattr(self.app, name, MagicMock())
+        self.app.root.state = MagicMock(return_value="normal")
+        self.app.start_smart_plan(60)
+        
+        self.app.start_timer()
+        self.app.log_distraction()
+        self.app.finish_timer()   # Step 1 completed, overtime starts
+        self.app.start_timer()    # Step 2 started, overtime recorded on step 1
+        self.app.skip_step()      # Step 2 skipped
+        
+        sessions = self.app.store.sessions_between(0, float("inf"))
+        self.assertEqual([s['status'] for s in sessions], ["completed", "skipped"])
+        self.assertEqual([s['step_index'] for s in sessions], [0, 1])
+        self.assertEqual(sessions[0]['label'], "기본 집중 🚀")
+        self.assertEqual(len(self.app.store.sessions_with_label("짧은 휴식 ☕")), 1)
+        distractions = self.app.store.distractions_between(0, float("inf"))
+        self.assertEqual(len(distractions), 1)
+        self.assertEqual(distractions[0]['session_id'], sessions[0]['id'])
+
     def test_navigation(self):
         # Setup specific schedule
         self.app.schedule = [
@@ -107,23 +175,148 @@ class TestPomodoro(unittest.TestCase):
          self.assertFalse(hasattr(self.app, 'overtime_start'))
          self.app.overtime_label.pack_forget.assert_called()
 
+    def test_repeated_overtime_starts_share_one_loop(self):
+        self.app.overtime_label = MagicMock()
+        for _ in range(5):
+            self.app.start_overtime()
+        self.assertEqual(list(self.app.ticker.jobs), ["overtime"])
+        self.app.stop_overtime()
+        self.assertEqual(self.app.ticker.jobs, {})
+
+    def test_ticks_only_touch_changed_widgets(self):
+        clock = VirtualClock(start=1000.0)
+        loop = VirtualScheduler(clock)
+        self.root.after = loop.after
+        self.root.after_cancel = loop.after_cancel
+        self.app.ticker.clock = clock
+        self.app.countdown.clock = clock
+        for name in ("start_button", "stop_button", "reset_button", "time_label", "distraction_btn"):
+            setattr(self.app, name, MagicMock())
+
+        self.app.start_timer()
+        self.app.start_timer()  # Already running: no extra loop, no widget calls
+        loop.run(max_events=60)
+        # One wakeup and one label update per displayed second
+        self.assertEqual(self.app.tk_stats.counts["after"], 61)
+        self.assertEqual(self.app.time_label.config.call_count, 61)
+        self.assertEqual(self.app.start_button.config.call_count, 1)
+        self.assertEqual(self.app.time_left, 25 * 60 - 60)
+
     def test_log_distraction(self):
-        import csv
+        import tempfile
+        from logwriter import LogWriter
         self.app.running = True
         self.app.is_break = False
         self.app.distraction_btn = MagicMock()
-        self.app.time_left = 1234
+        self.app.countdown.reset(1500)
+        self.app.countdown._remaining = 1234
         
-        # Use a real file write test or mock open? Mock is cleaner but real is robust.
-        # Let's mock open for safety in this environment
-        with unittest.mock.patch("builtins.open", unittest.mock.mock_open()) as mock_file:
-             with unittest.mock.patch("os.path.isfile", return_value=False):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "focus_log.csv")
+            self.app.log_writer = LogWriter(path, header=["Timestamp", "TimeRemaining", "TimeElapsed"])
+            # The click itself must not touch the file system
+            with unittest.mock.patch("builtins.open") as mock_open:
                 self.app.log_distraction()
-                mock_file.assert_called_with("focus_log.csv", "a", newline="", encoding="utf-8")
-                # Verify CSV writer was called (tricky with mock_open, check handle write)
-                handle = mock_file()
-                # We expect header + row
-                self.assertEqual(handle.write.call_count, 2) 
+                mock_open.assert_not_called()
+            self.app.log_writer.close()
+            
+            with open(path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+            # We expect header + row
+            self.assertEqual(len(lines), 2)
+            self.assertEqual(lines[0], "Timestamp,TimeRemaining,TimeElapsed")
+            self.assertTrue(lines[1].endswith(",20:34,04:26"))
+
+    def test_tray_messages_are_event_driven(self):
+        from channel import UIChannel, Message
+        # No periodic polling is armed for the tray queue
+        scheduled = [getattr(call.args[1], '__name__', None) for call in self.root.after.call_args_list if len(call.args) > 1]
+        self.assertNotIn('process_queue', scheduled)
+        self.root.bind.assert_any_call(UIChannel.EVENT, unittest.mock.ANY)
+        
+        self.app.perform_restore = MagicMock()
+        self.app.perform_quit = MagicMock()
+        self.app.on_tray_show()
+        self.root.event_generate.assert_called_with(UIChannel.EVENT, when="tail")
+        
+        # The bound handler drains everything posted so far
+        PomodoroApp.process_queue(self.app)
+        self.app.perform_restore.assert_called_once()
+        self.app.on_tray_quit()
+        PomodoroApp.process_queue(self.app)
+        self.app.perform_quit.assert_called_once()
+
+    def test_tray_message_falls_back_to_after_when_the_event_fails(self):
+        from channel import UIChannel, Message
+        root = MagicMock(**{"event_generate.side_effect": RuntimeError("main thread is not in main loop")})
+        wakeup = MagicMock()
+        channel = UIChannel(root, wakeup)
+        self.assertTrue(channel.post(Message.SHOW))
+        root.after.assert_called_once_with(0, wakeup)
+
+        root.after.side_effect = RuntimeError("no main loop")
+        self.assertFalse(channel.post(Message.QUIT))
+        self.assertEqual([msg for msg, _ in channel.drain()], [Message.SHOW, Message.QUIT])
+
+    def test_live_tray_icon_while_running(self):
+        from PIL import Image
+        clock = VirtualClock(start=1000.0)
+        self.app.countdown.clock = clock
+        self.app.start_button = MagicMock()
+        self.app.stop_button = MagicMock()
+        self.app.reset_button = MagicMock()
+        self.app.start_timer()
+        clock.advance(90)
+
+        tray = self.app.tray = MagicMock(visible=True)
+        self.app.ticker.clock = clock
+        self.app.update_tray_icon()
+        self.assertIsInstance(tray.update.call_args.args[0], Image.Image)
+        # 23:30 left -> next redraw when "24" becomes "23"
+        self.assertEqual(self.app.ticker.jobs["tray"], (clock.t + 30, self.app.update_tray_icon))
+
+        self.app.stop_tray_icon()
+        self.assertFalse(self.app.ticker.pending("tray"))
+        tray.stop.assert_called_once()
+
+    def test_low_power_while_minimized(self):
+        clock = VirtualClock(start=1000.0)
+        loop = VirtualScheduler(clock)
+        self.root.after = loop.after
+        self.root.after_cancel = loop.after_cancel
+        self.app.countdown.clock = clock
+        self.app.ticker.clock = clock
+        for name in ("time_label", "start_button", "stop_button", "reset_button"):
+            setattr(self.app, name, MagicMock())
+        self.app.create_tray = MagicMock(return_value=MagicMock(visible=False))
+        self.app.tray_image = MagicMock()
+        self.app.start_timer()
+        deadline = self.app.countdown.deadline
+
+        self.root.state.return_value = 'iconic'
+        self.app.minimize_to_tray()
+        self.assertTrue(self.app.low_power)
+        self.assertEqual(set(self.app.ticker.jobs), {"countdown", "tray"})
+        self.assertAlmostEqual(self.app.ticker.jobs["countdown"][0], deadline)
+        self.app.time_label.reset_mock()
+        until = clock.t + 10 * 60
+        loop.run_until(until)
+        self.assertLessEqual(loop.fired, 1)  # At most the tray's minute update
+        self.app.time_label.config.assert_not_called()
+
+        self.app.perform_restore()
+        self.assertFalse(self.app.low_power)
+        self.app.time_label.config.assert_called_with(text=self.app.format_time(self.app.time_left))
+        self.assertLessEqual(self.app.ticker.jobs["countdown"][0], clock.t + 1)
+
+    def test_startup_defers_tray_stack(self):
+        import subprocess
+        root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = "import main, sys; print([m for m in ('PIL', 'pystray', 'csv', 'sqlite3') if m in sys.modules])"
+        result = subprocess.run([sys.executable, "-c", code], cwd=root_dir, capture_output=True, text=True)
+        self.assertEqual(result.stdout.strip(), "[]", result.stderr)
+        # Warm-up is scheduled for later, not run during construction
+        self.root.after.assert_any_call(PomodoroApp.TRAY_WARMUP_MS, unittest.mock.ANY)
 
     def test_reset_timer(self):
         self.app.stop_timer = MagicMock()
@@ -0,0 +1,120 @@
+import asyncio
+import json
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metrics import Metrics
+from server import SessionServer, parse_address
+
+class Client:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.next_id = 0
+
+    async def send(self, op, **fields):
+        self.next_id += 1
+        fields.update(op=op, id=self.next_id)
+        self.writer.write(json.dumps(fields).encode() + b"\n")
+        await self.writer.drain()
+        while True:
+            message = await self.receive()
+            if message.get("id") == self.next_id:
+                return message
+
+    async def receive(self):
+        line = await asyncio.wait_for(self.reader.readline(), 5)
+        return json.loads(line)
+
+    async def event(self, name):
+        while True:
+            message = await self.receive()
+            if message.get("event") == name:
+                return message
+
+class TestSessionServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = SessionServer(tick_interval=0.05)
+        await self.server.start("127.0.0.1:0")
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.clients = []
+
+    async def asyncTearDown(self):
+        for client in self.clients:
+            client.writer.close()
+        await self.server.close()
+
+    async def connect(self):
+        client = Client(*await asyncio.open_connection("127.0.0.1", self.port))
+        self.clients.append(client)
+        return client
+
+    async def test_schedule_matches_planner(self):
+        client = await self.connect()
+        reply = await client.send("schedule", minutes=90)
+        self.assertTrue(reply["ok"])
+        self.assertEqual(reply["schedule"], self.server.engine.planner.generate_schedule(90))
+
+    async def test_lifecycle_events_fan_out_to_subscribers(self):
+        owner, watcher = await self.connect(), await self.connect()
+        reply = await owner.send("create", minutes=60)
+        session_id = reply["session"]["id"]
+        self.assertEqual(reply["session"]["steps"], 4)
+
+        await watcher.send("subscribe", session=session_id)
+        await owner.send("skip", session=session_id)
+        event = await watcher.event("step")
+        self.assertEqual(event["state"]["index"], 1)
+        self.assertTrue(event["state"]["is_break"])
+
+        reply = await owner.send("prev", session=session_id)
+        self.assertTrue(reply["moved"])
+        self.assertEqual((await watcher.event("step"))["state"]["index"], 0)
+
+        await owner.send("start", session=session_id)
+        self.assertTrue((await watcher.event("start"))["state"]["running"])
+        tick = await watcher.event("tick")
+        self.assertEqual(tick["session"], session_id)
+        self.assertLessEqual(tick["left"], 25 * 60)
+
+        await owner.send("stop", session=session_id)
+        await watcher.event("stop")
+
+    async def test_errors_are_replied(self):
+        client = await self.connect()
+        self.assertFalse((await client.send("start", session=999))["ok"])
+        self.assertFalse((await client.send("create", minutes=10))["ok"])
+        self.assertFalse((await client.send("explode"))["ok"])
+        client.writer.write(b"not json\n")
+        self.assertFalse((await client.receive())["ok"])
+        self.assertEqual(self.server.engine.sessions, {})
+
+    async def test_disconnect_drops_subscriptions(self):
+        client = await self.connect()
+        session_id = (await client.send("create", minutes=60))["session"]["id"]
+        await client.send("subscribe", session=session_id)
+        client.writer.close()
+        for _ in range(100):
+            if not self.server.connections:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(self.server._subscribers, {})
+
+    async def test_metrics_endpoint(self):
+        client = await self.connect()
+        self.assertEqual((await client.send("metrics"))["metrics"], {})
+        self.server.metrics = Metrics()
+        await asyncio.sleep(0.12)  # A couple of timed-out ticks
+        reply = await client.send("metrics")
+        self.assertGreaterEqual(reply["metrics"]["histograms"]["server.tick.lag"]["count"], 1)
+
+    def test_parse_address(self):
+        self.assertEqual(parse_address("127.0.0.1:8765"), ("tcp", "127.0.0.1", 8765))
+        self.assertEqual(parse_address("/tmp/focus.sock"), ("unix", "/tmp/focus.sock", None))
+        self.assertEqual(parse_address("unix:focus.sock"), ("unix", "focus.sock", None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+import os
+import subprocess
+import unittest
+from datetime import datetime
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clock import VirtualClock, VirtualScheduler
+from simulation import DayScript, Simulation, build_app
+
+
+class TestVirtualScheduler(unittest.TestCase):
+    def test_runs_callbacks_in_due_order_and_skips_cancelled(self):
+        clock = VirtualClock()
+        scheduler = VirtualScheduler(clock)
+        fired = []
+        scheduler.after(2000, lambda: fired.append(("b", clock())))
+        cancelled = scheduler.after(500, lambda: fired.append(("x", clock())))
+        scheduler.after(1000, lambda: fired.append(("a", clock())))
+        scheduler.after_cancel(cancelled)
+
+        scheduler.run_until(1.5)
+        self.assertEqual(fired, [("a", 1.0)])
+        self.assertEqual(clock(), 1.5)
+        scheduler.run_for(10)
+        self.assertEqual(fired, [("a", 1.0), ("b", 2.0)])
+        self.assertEqual(clock(), 11.5)
+
+    def test_lag_cost_and_stop_model_a_slow_loop(self):
+        clock = VirtualClock(start=10.0)
+        scheduler = VirtualScheduler(clock, lag=0.5, cost=0.25)
+        fired = []
+        scheduler.after(1000, lambda: fired.append(clock()))
+        scheduler.after(1000, scheduler.stop)
+        scheduler.after(3000, lambda: fired.append(clock()))
+        self.assertEqual(scheduler.pending(), 3)
+
+        self.assertEqual(scheduler.run(), 2)  # Stopped before the third callback
+        self.assertEqual(fired, [11.5])
+        self.assertEqual(clock(), 12.0)
+        self.assertEqual(scheduler.pending(), 1)
+        self.assertTrue(scheduler.run_next())
+        self.assertEqual(fired, [11.5, 13.5])
+        self.assertFalse(scheduler.run_next())
+
+    def test_wall_and_now_follow_monotonic(self):
+        clock = VirtualClock(epoch=datetime(2026, 1, 5, 9, 0).timestamp())
+        clock.advance(90)
+        self.assertEqual(clock.now(), datetime(2026, 1, 5, 9, 1, 30))
+        self.assertEqual(clock.wall(), clock.epoch + 90)
+
+
+class TestHeadless(unittest.TestCase):
+    def test_simulation_loads_no_mock_or_threads(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = "import sys, simulation; print([m for m in ('unittest', 'threading') if m in sys.modules])"
+        result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, timeout=30)
+        self.assertEqual(result.stdout.strip(), "[]", result.stderr)
+
+
+class TestAppOnVirtualTime(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.scheduler = VirtualScheduler(self.clock)
+        self.app = build_app(self.clock, self.scheduler)
+        self.scheduler.run_for(1)
+        self.events = []
+        self.app.engine.subscribe(lambda event, session: self.events.append((event, self.clock())))
+
+    def test_finish_loads_next_step_then_starts_overtime(self):
+        app = self.app
+        app.start_smart_plan(240)
+        first = app.schedule[0]
+        app.start_timer()
+        started = self.clock()
+        self.scheduler.run_for(first.duration + 0.5)
+
+        names = [event for event, _ in self.events]
+        self.assertEqual(names[-3:], ["finish", "step", "overtime"])
+        finished_at = self.events[-3][1]
+        self.assertAlmostEqual(finished_at - started, first.duration, delta=1)
+        self.assertEqual(app.current_step_index, 1)
+        self.assertFalse(app.running)
+        self.assertIsNotNone(app.overtime)
+
+        # Overtime ends when the next step starts, and is stored on the finished session
+        self.scheduler.run_for(42)
+        app.start_timer()
+        app.store.flush()
+        sessions = app.store.sessions_between(0, float("inf"))
+        self.assertEqual(sessions[0]['status'], "completed")
+        self.assertAlmostEqual(sessions[0]['overtime'], 42.5, delta=1)
+
+    def test_custom_schedule_after_a_plan_is_not_refitted(self):
+        app = self.app
+        app.start_smart_plan(60)
+        app.schedule = [{'type': 'WORK', 'duration': 600, 'label': 'A'},
+                        {'type': 'BREAK', 'duration': 300, 'label': 'B'},
+                        {'type': 'WORK', 'duration': 3000, 'label': 'C'},
+                        {'type': 'BREAK', 'duration': 300, 'label': 'D'}]
+        app.current_step_index = 0
+        app.start_timer()
+        self.scheduler.run_for(600 + 300)  # Well into overtime: a 60 minute budget would re-fit C and D
+        app.start_timer()
+
+        self.assertEqual([step.label for step in app.schedule], ["A", "B", "C", "D"])
+        self.assertIsNone(app.timer.plan_deadline)
+        self.assertIsNone(app.journal.last["plan"])
+
+    def test_skipping_an_unstarted_break_is_recorded(self):
+        app = self.app
+        app.start_smart_plan(240)
+        app.start_timer()
+        self.scheduler.run_for(app.countdown.remaining() + 30)  # Finished, 30 s into overtime
+        app.skip_step()  # Skip the break without starting it
+        app.store.flush()
+        work, rest = app.store.sessions_between(0, float("inf"))
+        self.assertEqual((work['status'], rest['status']), ("completed", "skipped"))
+        self.assertEqual(rest['step_index'], 1)
+        self.assertAlmostEqual(work['overtime'], 30, delta=1)
+        self.assertEqual(app.stats.today(self.clock.wall())["skipped"], 1)
+
+    def test_going_back_does_not_mark_a_skip(self):
+        app = self.app
+        app.start_smart_plan(240)
+        app.next_step()
+        app.start_timer()
+        self.scheduler.run_for(60)
+        app.prev_step()
+        app.store.flush()
+        left, = app.store.sessions_between(0, float("inf"))
+        self.assertEqual((left['step_index'], left['status']), (1, "interrupted"))
+        self.assertEqual(app.current_step_index, 0)
+
+    def test_distraction_is_stamped_with_virtual_time(self):
+        app = self.app
+        app.start_smart_plan(240)
+        app.start_timer()
+        self.scheduler.run_for(300)
+        app.log_distraction()
+        row = app.log_writer.rows[-1]
+        self.assertEqual(row[0], self.clock.now().strftime("%Y-%m-%d %H:%M:%S"))
+        self.assertEqual(row[0][:10], "2026-01-05")
+
+
+class TestSimulation(unittest.TestCase):
+    def test_full_days_complete_every_step(self):
+        summary = Simulation(seed=3).run_days(5)
+        self.assertEqual(summary['days'], 5)
+        self.assertEqual(summary['sessions'], summary['steps'] + summary['skips'])  # Skipped steps get a row too
+        self.assertEqual(summary['completed'], summary['steps'])
+        self.assertEqual(summary['logged_distractions'], summary['distractions'])
+        self.assertGreater(summary['simulated_seconds'], 4 * 24 * 3600)
+
+    def test_same_seed_same_result(self):
+        script = DayScript(plan_minutes=120, skip=0.2, pause=0.3, distractions_per_hour=4)
+        first = Simulation(seed=7, script=script).run_days(3)
+        second = Simulation(seed=7, script=script).run_days(3)
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, Simulation(seed=8, script=script).run_days(3))
+
+    def test_redraw_mode_matches_low_power_mode(self):
+        # The per-second label ticks must not change what happens, only how often the loop wakes
+        quiet = Simulation(seed=5, redraw=False)
+        busy = Simulation(seed=5, redraw=True)
+        self.assertEqual(quiet.run_days(1), busy.run_days(1))
+        self.assertGreater(busy.scheduler.fired, 10 * quiet.scheduler.fired)
+
+
+if __name__ == '__main__':
+    unittest.main()
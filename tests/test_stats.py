@@ -0,0 +1,137 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clock import VirtualClock
+from planner import Step, StepType
+from stats import StatsCache, format_summary
+from store import SessionStore
+
+WORK = Step(StepType.WORK, 1500, "집중 🧠")
+BREAK = Step(StepType.BREAK, 300, "휴식 🌿")
+
+
+class TestStatsCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "focus.db")
+        self.clock = VirtualClock(epoch=0.0, start=datetime(2026, 1, 7, 10, 0).timestamp())  # A Wednesday
+        self.store = SessionStore(self.path, clock=self.clock.wall)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def day_of_steps(self, when):
+        """One completed work step with two distractions, a skipped break, an aborted work step."""
+        self.clock.t = when.timestamp()
+        plan = self.store.start_plan(60)
+        work = self.store.start_session(plan, 0, WORK)
+        self.store.log_distraction(work, 1200)
+        self.clock.advance(600)
+        self.store.log_distraction(work, 600)
+        self.clock.advance(900)
+        self.store.end_session(work, "completed")
+        rest = self.store.start_session(plan, 1, BREAK)
+        self.store.end_session(rest, "skipped")
+        again = self.store.start_session(plan, 2, WORK)
+        self.store.end_session(again, "aborted")
+        self.store.flush()
+
+    def test_updates_incrementally(self):
+        stats = self.store.load_stats()
+        self.day_of_steps(datetime(2026, 1, 5, 9, 0))   # Monday
+        self.day_of_steps(datetime(2026, 1, 7, 14, 0))  # Wednesday
+
+        now = datetime(2026, 1, 7, 20, 0).timestamp()
+        self.assertEqual(stats.today(now), {"distractions": 2, "completed": 1, "focus": 1500,
+                                            "skipped": 1, "aborted": 1})
+        self.assertEqual(stats.week(now)["completed"], 2)
+        self.assertEqual(stats.week(now)["distractions"], 4)
+        # The week starts on Monday
+        self.assertEqual(stats.week(datetime(2026, 1, 12, 8, 0).timestamp()), {})
+        self.assertEqual(stats.labels["집중 🧠"], {"distractions": 4, "completed": 2, "aborted": 2})
+        self.assertEqual(stats.labels["휴식 🌿"], {"skipped": 2})
+        self.assertEqual((stats.hours[9], stats.hours[14]), (2, 2))
+        self.assertEqual(sum(stats.hours), 4)
+
+    def test_matches_rebuild_from_tables(self):
+        stats = self.store.load_stats()
+        self.day_of_steps(datetime(2026, 1, 5, 23, 50))  # Distraction and completion on different days
+        self.store.conn.execute("DELETE FROM meta WHERE key = 'stats'")
+        rebuilt = SessionStore(self.path).load_stats()
+        self.assertEqual(rebuilt.days, stats.days)
+        self.assertEqual(rebuilt.labels, stats.labels)
+        self.assertEqual(rebuilt.hours, stats.hours)
+
+    def test_snapshot_is_reloaded_without_a_rescan(self):
+        stats = self.store.load_stats()
+        self.day_of_steps(datetime(2026, 1, 6, 9, 0))
+        self.store.close()
+
+        with patch.object(StatsCache, "rebuild", side_effect=AssertionError("rescanned")):
+            loaded = SessionStore(self.path).load_stats()
+        self.assertEqual(loaded.days, stats.days)
+        self.assertEqual(loaded.labels, stats.labels)
+
+    def test_stale_snapshot_is_rebuilt(self):
+        self.store.load_stats()
+        self.day_of_steps(datetime(2026, 1, 6, 9, 0))
+        self.store.close()
+        # Rows written behind the cache's back (e.g. --import-log)
+        other = SessionStore(self.path)
+        other.log_distraction(None, 100, ts=datetime(2026, 1, 6, 11, 0).timestamp())
+        other.close()
+
+        stats = SessionStore(self.path).load_stats()
+        self.assertEqual(stats.day("2026-01-06")["distractions"], 3)
+        self.assertEqual(stats.hours[11], 1)
+
+    def test_session_from_an_earlier_run(self):
+        work = self.store.start_session(None, 0, WORK)
+        self.store.close()
+        # After a crash the next run marks the step interrupted
+        store = SessionStore(self.path, clock=self.clock.wall)
+        stats = store.load_stats()
+        store.end_session(work, "interrupted")
+        store.close()
+        self.assertEqual(stats.labels["집중 🧠"], {"interrupted": 1})
+        self.assertEqual(stats.today(self.clock.wall()), {"interrupted": 1})
+
+    def test_unreadable_snapshot(self):
+        self.assertIsNone(StatsCache.loads("{"))
+        self.assertIsNone(StatsCache.loads('{"version": 0}'))
+
+    def test_format_summary(self):
+        self.assertEqual(format_summary({"completed": 3, "distractions": 2, "focus": 4500}),
+                         "완료 3 · 건너뜀 0 · 딴짓 2 · 집중 75분")
+
+
+class TestStatsInApp(unittest.TestCase):
+    def test_label_shows_today_and_week(self):
+        from clock import VirtualScheduler
+        from simulation import build_app
+        clock = VirtualClock(epoch=datetime(2026, 1, 7, 9, 0).timestamp())
+        scheduler = VirtualScheduler(clock)
+        app = build_app(clock, scheduler)
+        scheduler.run_for(1)  # Startup loads the stats
+        self.assertIn("오늘: 완료 0", app.stats_label.cget("text"))
+
+        app.start_smart_plan(60)
+        app.start_timer()
+        scheduler.run_for(60)
+        app.log_distraction()
+        scheduler.run_for(app.countdown.remaining())
+        app.skip_step()  # The break, never started
+        text = app.stats_label.cget("text")
+        self.assertIn("오늘: 완료 1 · 건너뜀 1 · 딴짓 1 · 집중 25분", text)
+        self.assertIn("이번 주: 완료 1", text)
+
+
+if __name__ == '__main__':
+    unittest.main()
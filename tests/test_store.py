@@ -0,0 +1,104 @@
+import shutil
+import sqlite3
+import unittest
+import tempfile
+import sys
+import os
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clock import VirtualClock
+from store import SessionStore
+
+STEP = {"type": "WORK", "duration": 35 * 60, "label": "깊은 집중 🔥"}
+
+class TestSessionStore(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock(epoch=1_700_000_000.0)
+        self.store = SessionStore(":memory:", clock=self.clock.wall)
+
+    def test_writes_are_batched_until_flush(self):
+        plan = self.store.start_plan(120)
+        sid = self.store.start_session(plan, 2, STEP)
+        self.store.log_distraction(sid, 600)
+        self.clock.advance(2100)
+        self.store.end_session(sid)
+        self.store.add_overtime(sid, 42.5)
+        count = self.store.conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+        self.assertEqual(count, 0)
+        self.assertEqual(self.store.flush(), 5)
+        
+        session, = self.store.sessions_with_label("깊은 집중 🔥")
+        self.assertEqual(session['plan_id'], plan)
+        self.assertEqual(session['status'], "completed")
+        self.assertEqual(session['overtime'], 42.5)
+        self.assertEqual(session['ended_at'] - session['started_at'], 2100)
+
+    def test_range_queries(self):
+        for day in range(10):
+            sid = self.store.start_session(None, 0, STEP)
+            self.store.log_distraction(sid, 100)
+            self.clock.advance(86400)
+        sessions, distractions = self.store.last_days(7)
+        self.assertEqual(len(sessions), 7)
+        self.assertEqual(len(distractions), 7)
+        plan = self.store.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM distractions WHERE ts >= 0 AND ts < 1").fetchall()
+        self.assertIn("idx_distractions_ts", str(plan))
+
+    def test_two_stores_on_one_file_never_share_ids(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "focus.db")
+            window = SessionStore(path, clock=self.clock.wall)
+            terminal = SessionStore(path, clock=self.clock.wall)
+            try:
+                plans = [window.start_plan(60), terminal.start_plan(30)]
+                sessions = [window.start_session(plans[0], 0, STEP), terminal.start_session(plans[1], 0, STEP)]
+                window.flush()
+                terminal.flush()
+                self.assertEqual(len(set(plans)), 2)
+                self.assertEqual(sorted(s['id'] for s in window.sessions_between(0, float("inf"))), sorted(sessions))
+                self.assertEqual([s['plan_id'] for s in window.sessions_between(0, float("inf"))], plans)
+            finally:
+                window.close()
+                terminal.close()
+
+    def test_failed_flush_keeps_writes_queued(self):
+        sid = self.store.start_session(None, 0, STEP)
+        self.store.conn.execute("CREATE TRIGGER no_writes BEFORE INSERT ON sessions BEGIN SELECT RAISE(ABORT, 'disk full'); END")
+        with self.assertRaises(sqlite3.Error):
+            self.store.flush()
+        self.store.conn.execute("DROP TRIGGER no_writes")
+        self.assertEqual(self.store.flush(), 1)
+        self.assertEqual([s['id'] for s in self.store.sessions_between(0, float("inf"))], [sid])
+
+    def test_import_csv_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "focus_log.csv")
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                f.write("Timestamp,TimeRemaining\r\n2025-01-30 09:10:00,20:00\r\n"
+                        "garbage\r\n2025-01-31 14:05:59,12:34,22:26\r\n")
+            self.assertEqual(self.store.import_csv(path), 2)
+            self.assertEqual(self.store.import_csv(path), 0)
+        rows = self.store.distractions_between(0, float("inf"))
+        self.assertEqual([r['time_remaining'] for r in rows], [1200, 754])
+
+    def test_import_csv_skips_rows_already_stored(self):
+        sid = self.store.start_session(None, 0, STEP)
+        live = datetime(2025, 1, 30, 9, 10, 0, 400000).timestamp()
+        self.store.log_distraction(sid, 1200, ts=live)
+        self.store.flush()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "focus_log.csv")
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                f.write("Timestamp,TimeRemaining\r\n2025-01-30 09:10:00,20:00\r\n2025-01-31 14:05:59,12:34\r\n")
+            copy = os.path.join(tmp, "focus_log_copy.csv")
+            shutil.copy(path, copy)
+            self.assertEqual(self.store.import_csv(path), 1)
+            self.assertEqual(self.store.import_csv(copy), 0)
+        rows = self.store.distractions_between(0, float("inf"))
+        self.assertEqual([(r['session_id'], r['time_remaining']) for r in rows], [(sid, 1200), (None, 754)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clock import VirtualClock, VirtualScheduler
+from ticker import Renderer, Ticker, TkStats
+
+class TestRenderer(unittest.TestCase):
+    def setUp(self):
+        self.ui = Renderer()
+        self.label = MagicMock()
+
+    def test_only_changed_options_are_applied(self):
+        self.assertTrue(self.ui.config(self.label, text="25:00", fg="black"))
+        self.assertFalse(self.ui.config(self.label, text="25:00", fg="black"))
+        self.ui.config(self.label, text="24:59", fg="black")
+        self.label.config.assert_called_with(text="24:59")
+        self.assertEqual(self.label.config.call_count, 2)
+        self.assertEqual(self.ui.stats.counts["config_skipped"], 1)
+
+    def test_pack_state_is_tracked(self):
+        self.ui.pack(self.label, pady=5)
+        self.ui.pack(self.label, pady=5)
+        self.ui.pack_forget(self.label)
+        self.ui.pack_forget(self.label)
+        self.assertEqual(self.label.pack.call_count, 1)
+        self.assertEqual(self.label.pack_forget.call_count, 1)
+
+    def test_without_dirty_check_everything_is_applied(self):
+        ui = Renderer(dirty_check=False)
+        ui.config(self.label, text="x")
+        ui.config(self.label, text="x")
+        self.assertEqual(self.label.config.call_count, 2)
+
+class TestTicker(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock(start=10.0)
+        self.scheduler = VirtualScheduler(self.clock)
+        self.ticker = Ticker(self.scheduler, clock=self.clock)
+        self.calls = []
+
+    def job(self, name):
+        return lambda: self.calls.append(name)
+
+    def test_rescheduling_replaces_instead_of_stacking(self):
+        for _ in range(5):
+            self.ticker.schedule("overtime", 1000, self.job("overtime"))
+        self.assertEqual(self.scheduler.pending(), 1)
+        self.scheduler.run_next()
+        self.assertEqual(self.calls, ["overtime"])
+        self.assertEqual(self.scheduler.pending(), 0)
+
+    def test_jobs_on_the_same_boundary_share_one_wakeup(self):
+        self.ticker.schedule("countdown", 400, self.job("countdown"))
+        self.ticker.schedule("tray", 402, self.job("tray"))
+        self.ticker.schedule("later", 900, self.job("later"))
+        self.scheduler.run_next()
+        self.assertAlmostEqual(self.clock.t, 10.4)
+        self.assertEqual(self.calls, ["countdown", "tray"])
+        self.scheduler.run_next()
+        self.assertAlmostEqual(self.clock.t, 10.9)
+        self.assertEqual(self.ticker.stats.counts["after"], 2)
+
+    def test_jobs_rescheduled_during_a_tick_arm_once(self):
+        def tick():
+            self.calls.append("tick")
+            self.clock.advance(0.25)
+            self.ticker.schedule("countdown", 750, tick)
+            self.ticker.schedule("overtime", 750, self.job("overtime"))
+        self.ticker.schedule("countdown", 1000, tick)
+        self.scheduler.run_next()
+        self.assertEqual(self.scheduler.pending(), 1)
+        self.assertEqual(self.ticker.stats.counts["after_cancel"], 0)
+
+    def test_cancel_disarms_when_idle(self):
+        self.ticker.schedule("countdown", 1000, self.job("countdown"))
+        self.ticker.cancel("countdown")
+        self.assertEqual(self.scheduler.pending(), 0)
+        self.ticker.cancel("countdown")
+
+    def test_stats_rates(self):
+        stats = TkStats(clock=self.clock)
+        stats.count("config")
+        stats.count("config")
+        self.clock.advance(4)
+        self.assertEqual(stats.rates(), {"config": 0.5})
+        self.assertEqual(stats.format(), "config 0.50/s")
+
+if __name__ == '__main__':
+    unittest.main()
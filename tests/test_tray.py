@@ -0,0 +1,97 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import PomodoroApp
+from store import SessionStore
+from tray import TrayService
+
+class FakeIcon:
+    """Same run/stop/visible/icon contract as pystray.Icon, without a display."""
+
+    def __init__(self):
+        self.icon = None
+        self.visible = False
+        self.runs = 0
+        self._stopped = threading.Event()
+
+    def run(self, setup=None):
+        self.runs += 1
+        setup(self)
+        self._stopped.wait()
+
+    def stop(self):
+        self._stopped.set()
+
+def rss_kib():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        return None
+
+class TestTrayService(unittest.TestCase):
+    def test_one_thread_toggles_visibility(self):
+        icon = FakeIcon()
+        tray = TrayService(icon)
+        tray.show("image")
+        for _ in range(100):
+            if icon.visible:
+                break
+            threading.Event().wait(0.01)
+        self.assertTrue(icon.visible)
+        self.assertEqual(icon.icon, "image")
+
+        tray.hide()
+        self.assertFalse(icon.visible)
+        tray.show()
+        self.assertTrue(icon.visible)
+        self.assertEqual(icon.runs, 1)
+
+        tray.stop()
+        self.assertFalse(any(t.name == "tray" for t in threading.enumerate()))
+
+class TestTrayStress(unittest.TestCase):
+    CYCLES = 1000
+
+    def setUp(self):
+        self.root = MagicMock()
+        self.root.after = MagicMock()
+        self.app = PomodoroApp(self.root, store=SessionStore(":memory:"), journal=MagicMock(), log_writer=MagicMock())
+        self.icon = FakeIcon()
+        self.app.create_tray = lambda: TrayService(self.icon)
+
+    def tearDown(self):
+        self.app.stop_tray_icon()
+
+    def cycle(self):
+        self.root.state.return_value = 'iconic'
+        self.app.minimize_to_tray()
+        self.app.perform_restore()
+        # The mock root would otherwise grow with every recorded call
+        self.root.reset_mock()
+
+    def test_minimize_restore_cycles_reuse_thread_and_image(self):
+        from PIL import Image
+        with patch.object(Image, "open", wraps=Image.open) as image_open:
+            for _ in range(10):
+                self.cycle()
+            threads = threading.active_count()
+            rss = rss_kib()
+
+            for _ in range(self.CYCLES):
+                self.cycle()
+
+        self.assertEqual(threading.active_count(), threads)
+        self.assertEqual(self.icon.runs, 1)
+        self.assertFalse(self.icon.visible)
+        self.assertLessEqual(image_open.call_count, 1)  # Decoded once, if there is an icon file
+        if rss is not None:
+            self.assertLess(rss_kib() - rss, 2048)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clock import VirtualClock
+from countdown import Countdown
+from trayicon import SpriteAtlas, ICON_SIZE, RING_STEPS, WORK_COLOR, BREAK_COLOR, minutes_left, next_update_ms, ring_level
+
+class TestTrayIcon(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.atlas = SpriteAtlas()
+
+    def test_minute_rounding_and_update_delay(self):
+        self.assertEqual(minutes_left(25 * 60), 25)
+        self.assertEqual(minutes_left(24 * 60 + 0.5), 25)
+        self.assertEqual(minutes_left(0), 0)
+        self.assertEqual(minutes_left(500 * 60), 99)
+        # 24:30 left -> the "25" changes to "24" in 30 seconds
+        self.assertEqual(next_update_ms(24 * 60 + 30), 30000)
+        self.assertEqual(next_update_ms(24 * 60), 60000)
+
+    def test_ring_levels(self):
+        self.assertEqual(ring_level(0), 0)
+        self.assertEqual(ring_level(0.5), RING_STEPS // 2)
+        self.assertEqual(ring_level(1.5), RING_STEPS)
+        self.assertEqual(len(self.atlas.rings), RING_STEPS + 1)
+
+    def test_render_composites_digits_and_ring(self):
+        image = self.atlas.render(25, 0.5)
+        self.assertEqual(image.size, (ICON_SIZE, ICON_SIZE))
+        self.assertNotEqual(image.tobytes(), self.atlas.render(24, 0.5).tobytes())
+        # Right edge of the ring (3 o'clock) is filled at half progress
+        self.assertEqual(self.atlas.render(25, 0.5).getpixel((ICON_SIZE - 4, ICON_SIZE // 2)), WORK_COLOR)
+        self.assertEqual(self.atlas.render(5, 0.5, is_break=True).getpixel((ICON_SIZE - 4, ICON_SIZE // 2)), BREAK_COLOR)
+        # The dial itself is never modified by a render
+        self.assertNotEqual(self.atlas.base.getpixel((ICON_SIZE - 4, ICON_SIZE // 2)), WORK_COLOR)
+
+    def test_unchanged_state_reuses_last_image(self):
+        first = self.atlas.render(12, 0.51)
+        self.assertIs(self.atlas.render(12, 0.52), first)
+        self.assertIsNot(self.atlas.render(11, 0.52), first)
+
+    def test_render_countdown(self):
+        clock = VirtualClock(start=100.0)
+        countdown = Countdown(600, clock=clock)
+        countdown.start()
+        clock.advance(301)
+        expected = self.atlas.render(5, 301 / 600).tobytes()
+        self.assertEqual(self.atlas.render_countdown(countdown).tobytes(), expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+import collections
+import math
+import time
+
+from metrics import NULL_METRICS
+
+_MISSING = object()
+
+
+class TkStats:
+    """Counts the Tk calls made by the UI layer, by kind."""
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.counts = collections.Counter()
+        self.started = clock()
+
+    def count(self, kind):
+        self.counts[kind] += 1
+
+    def reset(self):
+        self.counts.clear()
+        self.started = self.clock()
+
+    def rates(self):
+        """Calls per second since the last reset."""
+        elapsed = max(1e-9, self.clock() - self.started)
+        return {kind: count / elapsed for kind, count in sorted(self.counts.items())}
+
+    def format(self):
+        return ", ".join(f"{kind} {rate:.2f}/s" for kind, rate in self.rates().items())
+
+
+class Renderer:
+    """
+    Dirty-checked widget updates. Remembers the options last applied to each
+    widget and its pack state, and only calls into Tk for what changed.
+    All updates of a widget must go through here for the cache to hold.
+    With dirty_check=False every update is applied (for comparisons).
+    """
+
+    def __init__(self, stats=None, dirty_check=True):
+        self.stats = stats or TkStats()
+        self.dirty_check = dirty_check
+        self._applied = {}  # id(widget) -> (widget, options)
+        self._packed = {}   # id(widget) -> (widget, pack options or None)
+
+    def _state(self, table, widget, default):
+        entry = table.get(id(widget))
+        if entry is None or entry[0] is not widget:
+            entry = table[id(widget)] = (widget, default)
+        return entry[1]
+
+    def config(self, widget, **options):
+        applied = self._state(self._applied, widget, {})
+        if self.dirty_check:
+            options = {key: value for key, value in options.items() if applied.get(key, _MISSING) != value}
+            if not options:
+                self.stats.count("config_skipped")
+                return False
+        widget.config(**options)
+        applied.update(options)
+        self.stats.count("config")
+        return True
+
+    def pack(self, widget, **options):
+        if self.dirty_check and self._state(self._packed, widget, _MISSING) == options:
+            self.stats.count("pack_skipped")
+            return False
+        widget.pack(**options)
+        self._packed[id(widget)] = (widget, options)
+        self.stats.count("pack")
+        return True
+
+    def pack_forget(self, widget):
+        if self.dirty_check and self._state(self._packed, widget, _MISSING) is None:
+            self.stats.count("pack_skipped")
+            return False
+        widget.pack_forget()
+        self._packed[id(widget)] = (widget, None)
+        self.stats.count("pack_forget")
+        return True
+
+
+class Ticker:
+    """
+    The one root.after() loop for all periodic UI work. Jobs are keyed by
+    name, so scheduling a job again replaces it instead of stacking another
+    loop. A single after() is armed for the earliest job; every job due
+    within SLACK of it runs in the same tick, so the countdown, overtime
+    and tray updates that share a second boundary cost one wakeup.
+    With metrics enabled, each tick records how late it fired (a late
+    tick is a stalled Tk loop) and each job how late it ran and for how long.
+    """
+    SLACK = 0.005
+
+    def __init__(self, root, clock=time.monotonic, stats=None, metrics=NULL_METRICS):
+        self.root = root
+        self.clock = clock
+        self.stats = stats or TkStats()
+        self.metrics = metrics
+        self.jobs = {}  # name -> (due, callback)
+        self._after_id = None
+        self._armed_due = None
+        self._in_tick = False
+
+    def schedule(self, name, delay_ms, callback):
+        self.jobs[name] = (self.clock() + delay_ms / 1000, callback)
+        self._arm()
+
+    def cancel(self, name):
+        if self.jobs.pop(name, None) is not None:
+            self._arm()
+
+    def pending(self, name):
+        return name in self.jobs
+
+    def _arm(self):
+        if self._in_tick:
+            return  # Re-armed once after the tick's jobs ran
+        due = min((due for due, _ in self.jobs.values()), default=None)
+        if due == self._armed_due:
+            return
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self.stats.count("after_cancel")
+            self._after_id = None
+        self._armed_due = due
+        if due is not None:
+            delay = max(1, int(math.ceil(round((due - self.clock()) * 1000, 3))))
+            self._after_id = self.root.after(delay, self._tick)
+            self.stats.count("after")
+
+    def _tick(self):
+        # The after() firing is the signal that the armed job is due, so jobs
+        # are compared with each other rather than with the clock.
+        fired = self._armed_due
+        self._after_id = self._armed_due = None
+        if fired is None:
+            return
+        due = [name for name, (when, _) in self.jobs.items() if when <= fired + self.SLACK]
+        metrics = self.metrics if self.metrics.enabled else None
+        if metrics is not None:
+            now = self.clock()
+            metrics.observe_lag("tick.lag", now - fired)
+        self._in_tick = True
+        try:
+            for name in due:
+                entry = self.jobs.get(name)
+                if entry is None or entry[0] > fired + self.SLACK:
+                    continue  # Cancelled or moved by an earlier job of this tick
+                del self.jobs[name]
+                if metrics is None:
+                    entry[1]()
+                    continue
+                metrics.observe("lag." + name, max(0.0, now - entry[0]))
+                with metrics.timer("job." + name):
+                    entry[1]()
+        finally:
+            self._in_tick = False
+            self._arm()
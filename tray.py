@@ -0,0 +1,60 @@
+import threading
+
+
+class TrayService:
+    """
+    Keeps one tray icon and its event loop thread alive for the whole app.
+    Minimize/restore only toggle the icon's visibility, so the decoded
+    image, the native icon handle and the thread are reused instead of
+    being rebuilt on every cycle.
+
+    `icon` is a pystray.Icon (or anything with the same run/stop/visible/icon
+    interface); its loop is started on the first show().
+    """
+
+    def __init__(self, icon):
+        self.icon = icon
+        self._lock = threading.Lock()
+        self._thread = None
+        self._ready = False     # The icon loop is running and can be shown
+        self._visible = False   # Requested visibility
+
+    @property
+    def visible(self):
+        return self._visible
+
+    def show(self, image=None):
+        with self._lock:
+            if image is not None and image is not self.icon.icon:
+                self.icon.icon = image
+            self._visible = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self.icon.run, kwargs={"setup": self._setup},
+                                                name="tray", daemon=True)
+                self._thread.start()
+            elif self._ready:
+                self.icon.visible = True
+
+    def hide(self):
+        with self._lock:
+            self._visible = False
+            if self._ready:
+                self.icon.visible = False
+
+    def update(self, image):
+        if image is not self.icon.icon:
+            self.icon.icon = image
+
+    def _setup(self, icon):
+        # Runs once the loop is up; applies whatever was requested meanwhile
+        with self._lock:
+            self._ready = True
+            icon.visible = self._visible
+
+    def stop(self, timeout=1.0):
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._ready = self._visible = False
+        if thread is not None:
+            self.icon.stop()
+            thread.join(timeout)
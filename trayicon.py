@@ -0,0 +1,112 @@
+import math
+
+ICON_SIZE = 64
+RING_STEPS = 24     # Pre-rendered progress ring levels (15 degrees each)
+RING_WIDTH = 7
+MAX_MINUTES = 99    # Two digits; longer steps show 99 until they get there
+
+BACKGROUND = (255, 255, 255, 255)
+RING_TRACK = (224, 224, 224, 255)
+WORK_COLOR = (0, 121, 107, 255)   # Matches the focus step label color
+BREAK_COLOR = (198, 40, 40, 255)  # Matches the break step label color
+DIGIT_COLOR = (33, 33, 33, 255)
+
+
+def minutes_left(remaining):
+    """Whole minutes shown for `remaining` seconds (rounded up, like the timer)."""
+    return min(MAX_MINUTES, int(math.ceil(remaining / 60)))
+
+
+def next_update_ms(remaining):
+    """Milliseconds until the shown minute count changes."""
+    fraction = remaining - (math.ceil(remaining / 60) - 1) * 60
+    return max(1, int(math.ceil(fraction * 1000)))
+
+
+def ring_level(progress):
+    return max(0, min(RING_STEPS, int(progress * RING_STEPS)))
+
+
+def _load_font(size):
+    from PIL import ImageFont
+    for name in ("DejaVuSans-Bold.ttf", "arialbd.ttf", "Arial Bold.ttf"):
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:  # Pillow < 10.1 has a single bitmap size
+        return ImageFont.load_default()
+
+
+class SpriteAtlas:
+    """
+    Everything the live tray icon can show, rendered once with ImageDraw:
+    the empty dial, one alpha mask per ring level and one sprite per digit. An
+    update is then a copy of the dial plus two or three mask pastes, and the
+    result is cached so repeated updates within a minute cost nothing.
+    """
+
+    def __init__(self, size=ICON_SIZE):
+        from PIL import Image, ImageDraw
+        self.size = size
+        box = (1, 1, size - 2, size - 2)
+        self.base = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        dc = ImageDraw.Draw(self.base)
+        dc.ellipse(box, fill=BACKGROUND)
+        dc.arc(box, 0, 360, fill=RING_TRACK, width=RING_WIDTH)
+        # Ring levels are alpha masks, so work and break share them
+        self.rings = [None]
+        for level in range(1, RING_STEPS + 1):
+            mask = Image.new("L", (size, size), 0)
+            ImageDraw.Draw(mask).arc(box, -90, -90 + 360 * level // RING_STEPS, fill=255, width=RING_WIDTH)
+            self.rings.append(mask)
+        # Solid fills to paste through the masks (pasting a bare color
+        # would allocate a fill image on every update)
+        self.inks = {color: Image.new("RGBA", (size, size), color) for color in (WORK_COLOR, BREAK_COLOR)}
+
+        font = _load_font(size * 9 // 16)
+        self.digits = []
+        for digit in "0123456789":
+            left, top, right, bottom = font.getbbox(digit)
+            sprite = Image.new("RGBA", (right - left, bottom - top), DIGIT_COLOR)
+            mask = Image.new("L", sprite.size, 0)
+            ImageDraw.Draw(mask).text((-left, -top), digit, font=font, fill=255)
+            sprite.putalpha(mask)
+            self.digits.append(sprite)
+        self._last_key = None
+        self._last_image = None
+
+    def render(self, minutes, progress, is_break=False):
+        minutes = max(0, min(MAX_MINUTES, minutes))
+        key = (minutes, ring_level(progress), is_break)
+        if key == self._last_key:
+            return self._last_image
+
+        image = self.base.copy()
+        ring = self.rings[key[1]]
+        if ring is not None:
+            image.paste(self.inks[BREAK_COLOR if is_break else WORK_COLOR], (0, 0), ring)
+        sprites = [self.digits[int(d)] for d in str(minutes)]
+        width = sum(sprite.width for sprite in sprites)
+        height = max(sprite.height for sprite in sprites)
+        x = (self.size - width) // 2
+        y = (self.size - height) // 2
+        for sprite in sprites:
+            image.paste(sprite, (x, y + height - sprite.height), sprite)
+            x += sprite.width
+
+        self._last_key, self._last_image = key, image
+        return image
+
+    def render_countdown(self, countdown, is_break=False):
+        remaining = countdown.remaining()
+        progress = 1 - remaining / countdown.duration if countdown.duration else 1
+        return self.render(minutes_left(remaining), progress, is_break)
+
+    @property
+    def nbytes(self):
+        """Approximate pixel memory held by the atlas."""
+        images = [self.base] + [m for m in self.rings if m is not None] + list(self.inks.values()) + self.digits
+        return sum(len(im.getbands()) * im.width * im.height for im in images)